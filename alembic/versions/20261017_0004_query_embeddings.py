@@ -0,0 +1,42 @@
+"""Add query embedding cache table."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0004"
+down_revision: Union[str, Sequence[str], None] = "f2ca03afb3a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic."""
+    op.create_table(
+        "query_embeddings",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", Vector(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("dimensions > 0", name="ck_query_embeddings_dimensions_positive"),
+        sa.CheckConstraint(
+            "dimensions = vector_dims(vector)", name="ck_query_embeddings_dimensions_match_vector"
+        ),
+    )
+    op.create_index(
+        "ux_query_embeddings_hash_model_dimensions",
+        "query_embeddings",
+        ["text_hash", "model", "dimensions"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ux_query_embeddings_hash_model_dimensions", table_name="query_embeddings")
+    op.drop_table("query_embeddings")
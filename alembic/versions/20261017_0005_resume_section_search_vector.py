@@ -0,0 +1,53 @@
+"""Add language-aware full-text search vector to resume sections."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0005"
+down_revision: Union[str, Sequence[str], None] = "20261017_0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "to_tsvector(CASE WHEN language = 'es' THEN 'spanish'::regconfig "
+    "ELSE 'english'::regconfig END, content)"
+)
+
+
+def upgrade() -> None:
+    """Runs upgrade logic."""
+    op.add_column("resume_sections", sa.Column("language", sa.String(length=16), nullable=True))
+    op.execute(
+        """
+        UPDATE resume_sections rs
+        SET language = r.language
+        FROM resumes r
+        WHERE r.id = rs.resume_id
+        """
+    )
+    op.add_column(
+        "resume_sections",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_resume_sections_search_vector",
+        "resume_sections",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ix_resume_sections_search_vector", table_name="resume_sections")
+    op.drop_column("resume_sections", "search_vector")
+    op.drop_column("resume_sections", "language")
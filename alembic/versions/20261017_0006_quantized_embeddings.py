@@ -0,0 +1,30 @@
+"""Add compact halfvec and binary-quantized columns to embeddings."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import BIT, HALFVEC
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0006"
+down_revision: Union[str, Sequence[str], None] = "20261017_0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic.
+
+    Existing rows are filled by ``scripts/backfill_quantized_embeddings.py`` in
+    batches, and the model-scoped partial indexes are created by
+    ``scripts/create_embedding_hnsw_indexes.py --halfvec --bit``.
+    """
+    op.add_column("embeddings", sa.Column("vector_half", HALFVEC(), nullable=True))
+    op.add_column("embeddings", sa.Column("vector_bit", BIT(varying=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_column("embeddings", "vector_bit")
+    op.drop_column("embeddings", "vector_half")
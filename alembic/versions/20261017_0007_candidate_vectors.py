@@ -0,0 +1,64 @@
+"""Add pooled candidate-level vectors for coarse retrieval."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0007"
+down_revision: Union[str, Sequence[str], None] = "20261017_0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic.
+
+    Rows are filled by ``scripts/backfill_candidate_vectors.py`` and indexed per
+    model by ``scripts/create_embedding_hnsw_indexes.py``.
+    """
+    op.create_table(
+        "candidate_vectors",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "candidate_id",
+            sa.Integer(),
+            sa.ForeignKey("candidates.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "resume_id",
+            sa.Integer(),
+            sa.ForeignKey("resumes.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", Vector(), nullable=False),
+        sa.Column("section_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("dimensions > 0", name="ck_candidate_vectors_dimensions_positive"),
+        sa.CheckConstraint(
+            "dimensions = vector_dims(vector)",
+            name="ck_candidate_vectors_dimensions_match_vector",
+        ),
+        sa.ForeignKeyConstraint(
+            ["model", "dimensions"],
+            ["embedding_models.model", "embedding_models.dimensions"],
+            name="fk_candidate_vectors_model_dimensions",
+        ),
+    )
+    op.create_index(
+        "ux_candidate_vectors_candidate_model",
+        "candidate_vectors",
+        ["candidate_id", "model"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ux_candidate_vectors_candidate_model", table_name="candidate_vectors")
+    op.drop_table("candidate_vectors")
@@ -0,0 +1,34 @@
+"""Add content-addressed rerank/explanation cache table."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0008"
+down_revision: Union[str, Sequence[str], None] = "20261017_0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic."""
+    op.create_table(
+        "rerank_cache",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("model_alias", sa.String(length=128), nullable=False),
+        sa.Column("prompt_version", sa.String(length=32), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ux_rerank_cache_cache_key", "rerank_cache", ["cache_key"], unique=True)
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ux_rerank_cache_cache_key", table_name="rerank_cache")
+    op.drop_table("rerank_cache")
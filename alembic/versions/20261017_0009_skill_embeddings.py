@@ -0,0 +1,42 @@
+"""Add cached skill embedding table for soft skill matching."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0009"
+down_revision: Union[str, Sequence[str], None] = "20261017_0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic."""
+    op.create_table(
+        "skill_embeddings",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("skill_text", sa.String(length=256), nullable=False),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", Vector(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("dimensions > 0", name="ck_skill_embeddings_dimensions_positive"),
+        sa.CheckConstraint(
+            "dimensions = vector_dims(vector)", name="ck_skill_embeddings_dimensions_match_vector"
+        ),
+    )
+    op.create_index(
+        "ux_skill_embeddings_text_model",
+        "skill_embeddings",
+        ["skill_text", "model"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ux_skill_embeddings_text_model", table_name="skill_embeddings")
+    op.drop_table("skill_embeddings")
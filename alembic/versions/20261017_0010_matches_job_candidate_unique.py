@@ -0,0 +1,42 @@
+"""Enforce one match row per job/candidate pair."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0010"
+down_revision: Union[str, Sequence[str], None] = "20261017_0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic.
+
+    Duplicate pairs left by earlier read-then-insert persistence are collapsed
+    to their newest row before the unique index is created.
+    """
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM matches m
+            USING matches newer
+            WHERE newer.job_id = m.job_id
+              AND newer.candidate_id = m.candidate_id
+              AND (newer.created_at, newer.id) > (m.created_at, m.id)
+            """
+        )
+    )
+    op.create_index(
+        "ux_matches_job_candidate",
+        "matches",
+        ["job_id", "candidate_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ux_matches_job_candidate", table_name="matches")
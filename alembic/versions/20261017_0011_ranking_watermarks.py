@@ -0,0 +1,35 @@
+"""Add per-job watermarks for incremental ranking."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0011"
+down_revision: Union[str, Sequence[str], None] = "20261017_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic."""
+    op.create_table(
+        "ranking_watermarks",
+        sa.Column(
+            "job_id",
+            sa.Integer(),
+            sa.ForeignKey("job_postings.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("requirements_hash", sa.String(length=64), nullable=False),
+        sa.Column("top_k", sa.Integer(), nullable=False),
+        sa.Column("resume_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("resume_id", sa.Integer(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_table("ranking_watermarks")
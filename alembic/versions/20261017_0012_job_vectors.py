@@ -0,0 +1,54 @@
+"""Add job description vectors for reverse (resume to job) matching."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0012"
+down_revision: Union[str, Sequence[str], None] = "20261017_0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic.
+
+    Rows are written when a job is ingested, filled for existing jobs by
+    ``scripts/backfill_job_vectors.py`` and indexed per model by
+    ``scripts/create_embedding_hnsw_indexes.py``.
+    """
+    op.create_table(
+        "job_vectors",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "job_id",
+            sa.Integer(),
+            sa.ForeignKey("job_postings.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", Vector(), nullable=False),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("dimensions > 0", name="ck_job_vectors_dimensions_positive"),
+        sa.CheckConstraint(
+            "dimensions = vector_dims(vector)",
+            name="ck_job_vectors_dimensions_match_vector",
+        ),
+        sa.ForeignKeyConstraint(
+            ["model", "dimensions"],
+            ["embedding_models.model", "embedding_models.dimensions"],
+            name="fk_job_vectors_model_dimensions",
+        ),
+    )
+    op.create_index("ux_job_vectors_job_model", "job_vectors", ["job_id", "model"], unique=True)
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index("ux_job_vectors_job_model", table_name="job_vectors")
+    op.drop_table("job_vectors")
@@ -0,0 +1,30 @@
+"""Add raw-file fingerprints to resumes for pre-parse duplicate checks."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0013"
+down_revision: Union[str, Sequence[str], None] = "20261017_0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Runs upgrade logic."""
+    op.add_column("resumes", sa.Column("source_sha256", sa.String(length=64), nullable=True))
+    op.add_column("resumes", sa.Column("source_size", sa.BigInteger(), nullable=True))
+    op.add_column("resumes", sa.Column("source_mtime", sa.Float(), nullable=True))
+    op.create_index(op.f("ix_resumes_source_sha256"), "resumes", ["source_sha256"], unique=False)
+    op.create_index(op.f("ix_resumes_source_file"), "resumes", ["source_file"], unique=False)
+
+
+def downgrade() -> None:
+    """Runs downgrade logic."""
+    op.drop_index(op.f("ix_resumes_source_file"), table_name="resumes")
+    op.drop_index(op.f("ix_resumes_source_sha256"), table_name="resumes")
+    op.drop_column("resumes", "source_mtime")
+    op.drop_column("resumes", "source_size")
+    op.drop_column("resumes", "source_sha256")
@@ -8,6 +8,7 @@ from collections import defaultdict
 from src.ingest.identity import estimate_name_quality, normalize_email, normalize_phone
 from src.storage.db import get_session
 from src.storage.models import Candidate, Match, Resume
+from src.storage.repositories import CandidateVectorRepository
 
 
 def _link_list(value: list[str] | dict | None) -> list[str]:
@@ -70,7 +71,8 @@ def run_backfill(*, apply: bool) -> int:
     """Merges duplicate candidates that share email/phone identity keys.
 
     The script chooses a canonical candidate per duplicate group, reassigns
-    related rows (resumes, matches), and deletes duplicate rows.
+    related rows (resumes, matches), deletes duplicate rows, and refreshes the
+    canonical candidate's pooled vectors.
 
     Args:
         apply (bool): When true commits DB changes; when false performs a dry run.
@@ -94,6 +96,7 @@ def run_backfill(*, apply: bool) -> int:
         merged_candidates = 0
         moved_resumes = 0
         moved_matches = 0
+        vector_repo = CandidateVectorRepository(session)
 
         for key, rows in sorted(merge_groups.items()):
             canonical = sorted(
@@ -131,6 +134,8 @@ def run_backfill(*, apply: bool) -> int:
                 )
                 session.delete(dup)
                 merged_candidates += 1
+            session.flush()
+            vector_repo.refresh(candidate_id=canonical.id)
 
             print(
                 f"group={key} canonical={canonical.id} merged={len(duplicates)} "
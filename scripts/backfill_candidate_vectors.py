@@ -0,0 +1,42 @@
+"""Rebuild pooled per-candidate vectors from latest-resume section embeddings."""
+
+from __future__ import annotations
+
+import argparse
+
+from src.storage.db import get_session
+from src.storage.repositories import CandidateVectorRepository
+
+
+def run(*, model: str | None, candidate_id: int | None, dry_run: bool) -> int:
+    """Recomputes candidate vectors for the selected scope."""
+    session = get_session()
+    try:
+        written = CandidateVectorRepository(session).refresh(
+            candidate_id=candidate_id, model=model
+        )
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+        print(f"candidate_vectors={written}")
+        print(f"dry_run={dry_run}")
+        return 0
+    finally:
+        session.close()
+
+
+def main() -> int:
+    """Parses CLI arguments and runs the backfill command."""
+    parser = argparse.ArgumentParser(description="Rebuild pooled candidate vectors.")
+    parser.add_argument("--model", default=None, help="Only rebuild this provider/model.")
+    parser.add_argument(
+        "--candidate-id", type=int, default=None, help="Only rebuild one candidate."
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Run without committing changes.")
+    args = parser.parse_args()
+    return run(model=args.model, candidate_id=args.candidate_id, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
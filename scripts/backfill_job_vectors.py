@@ -0,0 +1,68 @@
+"""Embed job postings that have no vector yet, for reverse matching."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+
+from sqlalchemy import select
+
+from src.core.config import get_settings
+from src.llm.factory import get_shared_llm_client, get_shared_registry
+from src.storage import models
+from src.storage.db import get_session
+from src.storage.repositories import JobVectorRepository
+
+
+def run(*, batch_size: int, dry_run: bool) -> int:
+    """Embeds every job description missing from ``job_vectors`` for the configured alias."""
+    settings = get_settings()
+    alias = settings.embedding_model_alias
+    default_model = get_shared_registry().get(alias).default_model
+    client = get_shared_llm_client()
+    session = get_session()
+    try:
+        repo = JobVectorRepository(session)
+        done = repo.get_job_ids(model=default_model)
+        jobs = [
+            job
+            for job in session.scalars(select(models.JobPosting).order_by(models.JobPosting.id))
+            if job.id not in done
+        ]
+        written = 0
+        for start in range(0, len(jobs), batch_size):
+            batch = jobs[start : start + batch_size]
+            vectors, metadata = client.embed_with_meta(
+                texts=[job.description for job in batch], embedding_model_alias=alias
+            )
+            model = metadata.selected_model or alias
+            for job, vector in zip(batch, vectors):
+                repo.upsert(
+                    job_id=job.id,
+                    model=model,
+                    vector=[float(value) for value in vector],
+                    text_hash=hashlib.sha256(job.description.encode("utf-8")).hexdigest(),
+                )
+                written += 1
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+        print(f"job_vectors={written}")
+        print(f"dry_run={dry_run}")
+        return 0
+    finally:
+        session.close()
+
+
+def main() -> int:
+    """Parses CLI arguments and runs the backfill command."""
+    parser = argparse.ArgumentParser(description="Embed job postings for reverse matching.")
+    parser.add_argument("--batch-size", type=int, default=64, help="Descriptions per call.")
+    parser.add_argument("--dry-run", action="store_true", help="Run without committing changes.")
+    args = parser.parse_args()
+    return run(batch_size=args.batch_size, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""Recompute canonical skill ids stored in resume signals and job requirements."""
+
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import select
+
+from src.extract.skills import (
+    get_shared_skill_registry,
+    normalize_candidate_signals,
+    normalize_job_requirements,
+)
+from src.extract.types import CandidateSignals, JobRequirements
+from src.storage import models
+from src.storage.db import get_session
+
+
+def run(*, dry_run: bool) -> int:
+    """Re-normalizes every stored extraction output against the current registry."""
+    registry = get_shared_skill_registry()
+    session = get_session()
+    try:
+        resumes_updated = 0
+        for resume in session.scalars(
+            select(models.Resume).where(models.Resume.signals_json.is_not(None))
+        ):
+            signals = normalize_candidate_signals(
+                CandidateSignals.model_validate(resume.signals_json), registry
+            )
+            if resume.signals_json.get("normalized_skills") != signals.normalized_skills:
+                resume.signals_json = signals.model_dump()
+                resumes_updated += 1
+
+        jobs_updated = 0
+        for job in session.scalars(
+            select(models.JobPosting).where(models.JobPosting.requirements_json.is_not(None))
+        ):
+            requirements = normalize_job_requirements(
+                JobRequirements.model_validate(job.requirements_json), registry
+            )
+            if job.requirements_json.get("normalized_hard_skills") != (
+                requirements.normalized_hard_skills
+            ):
+                job.requirements_json = requirements.model_dump()
+                jobs_updated += 1
+
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+        print(f"resumes_updated={resumes_updated}")
+        print(f"jobs_updated={jobs_updated}")
+        print(f"dry_run={dry_run}")
+        return 0
+    finally:
+        session.close()
+
+
+def main() -> int:
+    """Parses CLI arguments and runs the backfill command."""
+    parser = argparse.ArgumentParser(
+        description="Recompute canonical skill ids after editing config/skill_aliases.yaml."
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Run without committing changes.")
+    args = parser.parse_args()
+    return run(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
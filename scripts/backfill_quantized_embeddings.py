@@ -0,0 +1,75 @@
+"""Backfill compact halfvec and binary-quantized forms of stored embeddings."""
+
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import bindparam, text
+
+from src.storage.db import get_session
+
+BACKFILL_SQL = """
+UPDATE embeddings
+SET vector_half = vector::halfvec,
+    vector_bit = binary_quantize(vector)::bit varying
+WHERE id IN (
+    SELECT id
+    FROM embeddings
+    WHERE vector_half IS NULL OR vector_bit IS NULL
+    ORDER BY id
+    LIMIT :batch_size
+)
+"""
+
+
+def run(*, batch_size: int, dry_run: bool) -> int:
+    """Fills missing compact vectors batch by batch, committing after each batch."""
+    session = get_session()
+    updated = 0
+    batches = 0
+    try:
+        pending = int(
+            session.execute(
+                text(
+                    "SELECT COUNT(*) FROM embeddings "
+                    "WHERE vector_half IS NULL OR vector_bit IS NULL"
+                )
+            ).scalar_one()
+        )
+        if dry_run:
+            print(f"pending={pending}")
+            print("dry_run=True")
+            return 0
+
+        stmt = text(BACKFILL_SQL).bindparams(bindparam("batch_size", value=batch_size))
+        while True:
+            result = session.execute(stmt)
+            session.commit()
+            if not result.rowcount:
+                break
+            updated += int(result.rowcount)
+            batches += 1
+
+        print(f"pending={pending}")
+        print(f"updated={updated}")
+        print(f"batches={batches}")
+        return 0
+    finally:
+        session.close()
+
+
+def main() -> int:
+    """Parses CLI arguments and runs the backfill command."""
+    parser = argparse.ArgumentParser(
+        description="Backfill halfvec and binary-quantized embedding columns."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Rows updated per transaction."
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report pending rows.")
+    args = parser.parse_args()
+    return run(batch_size=max(args.batch_size, 1), dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,11 +8,10 @@ import hashlib
 from sqlalchemy import delete, select
 
 from src.core.config import get_settings
-from src.llm.factory import build_default_llm_client
-from src.llm.registry import ModelAliasRegistry
+from src.llm.factory import get_shared_llm_client, get_shared_registry
 from src.storage.db import get_session
-from src.storage.models import Embedding, ResumeSection
-from src.storage.repositories import EmbeddingRepository
+from src.storage.models import Embedding, Resume, ResumeSection
+from src.storage.repositories import CandidateVectorRepository, EmbeddingRepository
 
 
 def run(
@@ -23,16 +22,22 @@ def run(
     replace_existing: bool,
     dry_run: bool,
 ) -> int:
-    """Runs section-embedding backfill with optional scoping and dry-run mode."""
+    """Runs section-embedding backfill with optional scoping and dry-run mode.
+
+    Candidate vectors are refreshed for every model that received new
+    embeddings (scoped to the resume's candidate when ``resume_id`` is set).
+    """
     session = get_session()
     inserted = 0
     skipped = 0
     failed = 0
+    candidate_vectors = 0
+    touched_models: set[str] = set()
     try:
         settings = get_settings()
         alias = embedding_alias or settings.embedding_model_alias
-        target_model = ModelAliasRegistry(settings.model_aliases_path).get(alias).default_model
-        client = build_default_llm_client()
+        target_model = get_shared_registry().get(alias).default_model
+        client = get_shared_llm_client()
         repo = EmbeddingRepository(session)
 
         if replace_existing:
@@ -83,12 +88,23 @@ def run(
                 )
                 inserted += 1
                 existing.add((section.id, model))
+                touched_models.add(model)
             except Exception as exc:
                 failed += 1
                 print(
                     f"section_id={section.id} status=error error_type={type(exc).__name__} error={exc}"
                 )
 
+        if touched_models or replace_existing:
+            candidate_id = None
+            if resume_id is not None:
+                candidate_id = session.scalar(
+                    select(Resume.candidate_id).where(Resume.id == resume_id)
+                )
+            vector_repo = CandidateVectorRepository(session)
+            for model in sorted(touched_models | {target_model}):
+                candidate_vectors += vector_repo.refresh(candidate_id=candidate_id, model=model)
+
         if dry_run:
             session.rollback()
         else:
@@ -97,6 +113,7 @@ def run(
         print(f"inserted={inserted}")
         print(f"skipped={skipped}")
         print(f"failed={failed}")
+        print(f"candidate_vectors={candidate_vectors}")
         print(f"target_model={target_model}")
         print(f"replace_existing={replace_existing}")
         print(f"dry_run={dry_run}")
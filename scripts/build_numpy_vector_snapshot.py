@@ -0,0 +1,54 @@
+"""Build memory-mappable NumPy snapshots of section embeddings per model space."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.core.config import get_settings
+from src.retrieval.numpy_backend import NumpyVectorIndex, snapshot_directory
+from src.storage.db import get_session
+
+
+def run(*, output_dir: Path | None, model: str | None) -> int:
+    """Writes one snapshot directory per registered model+dimension pair."""
+    root = output_dir or get_settings().retrieval_numpy_snapshot_dir
+    if root is None:
+        print("error=no_output_dir (pass --output-dir or set RETRIEVAL_NUMPY_SNAPSHOT_DIR)")
+        return 1
+
+    session = get_session()
+    written = 0
+    try:
+        rows = session.execute(
+            text("SELECT model, dimensions FROM embedding_models ORDER BY model")
+        ).fetchall()
+        for model_name, dimensions in rows:
+            model_str = str(model_name)
+            if model is not None and model_str != model:
+                continue
+            dim = int(dimensions)
+            index = NumpyVectorIndex.from_session(session, model=model_str, dimensions=dim)
+            directory = snapshot_directory(root, model=model_str, dimensions=dim)
+            index.save(directory)
+            written += 1
+            print(f"model={model_str} dimensions={dim} rows={index.matrix.shape[0]} path={directory}")
+        print(f"snapshots_written={written}")
+        return 0
+    finally:
+        session.close()
+
+
+def main() -> int:
+    """Parses CLI options and builds the snapshots."""
+    parser = argparse.ArgumentParser(description="Build NumPy snapshots of section embeddings.")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Snapshot root directory.")
+    parser.add_argument("--model", default=None, help="Only snapshot this provider/model.")
+    args = parser.parse_args()
+    return run(output_dir=args.output_dir, model=args.model)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,4 @@
-"""Create model-scoped HNSW indexes for embeddings."""
+"""Create model-scoped HNSW indexes for section embeddings, candidate and job vectors."""
 
 from __future__ import annotations
 
@@ -10,10 +10,10 @@ from sqlalchemy import text
 from src.storage.db import get_session
 
 
-def _index_name(*, model: str, dimensions: int) -> str:
+def _index_name(*, model: str, dimensions: int, prefix: str = "ix_emb_hnsw") -> str:
     """Builds a short deterministic index name within Postgres length limits."""
     digest = hashlib.sha1(model.encode("utf-8")).hexdigest()[:8]
-    return f"ix_emb_hnsw_{dimensions}_{digest}"
+    return f"{prefix}_{dimensions}_{digest}"
 
 
 def _escape_literal(value: str) -> str:
@@ -21,7 +21,44 @@ def _escape_literal(value: str) -> str:
     return value.replace("'", "''")
 
 
-def run() -> int:
+def _index_statements(*, model: str, dimensions: int, halfvec: bool, bit: bool) -> list[str]:
+    """Builds partial-index DDL for section, candidate and job vectors and compact columns."""
+    predicate = f"WHERE model = '{_escape_literal(model)}' AND dimensions = {dimensions}"
+    statements = [
+        f"CREATE INDEX IF NOT EXISTS {_index_name(model=model, dimensions=dimensions)} "
+        f"ON embeddings USING hnsw ((vector::vector({dimensions})) vector_cosine_ops) "
+        f"{predicate}"
+    ]
+    idx = _index_name(model=model, dimensions=dimensions, prefix="ix_cand_vec_hnsw")
+    statements.append(
+        f"CREATE INDEX IF NOT EXISTS {idx} "
+        f"ON candidate_vectors USING hnsw ((vector::vector({dimensions})) vector_cosine_ops) "
+        f"{predicate}"
+    )
+    idx = _index_name(model=model, dimensions=dimensions, prefix="ix_job_vec_hnsw")
+    statements.append(
+        f"CREATE INDEX IF NOT EXISTS {idx} "
+        f"ON job_vectors USING hnsw ((vector::vector({dimensions})) vector_cosine_ops) "
+        f"{predicate}"
+    )
+    if halfvec:
+        idx = _index_name(model=model, dimensions=dimensions, prefix="ix_emb_hnsw_half")
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS {idx} "
+            f"ON embeddings USING hnsw ((vector_half::halfvec({dimensions})) halfvec_cosine_ops) "
+            f"{predicate}"
+        )
+    if bit:
+        idx = _index_name(model=model, dimensions=dimensions, prefix="ix_emb_hnsw_bit")
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS {idx} "
+            f"ON embeddings USING hnsw ((vector_bit::bit({dimensions})) bit_hamming_ops) "
+            f"{predicate}"
+        )
+    return statements
+
+
+def run(*, halfvec: bool = False, bit: bool = False) -> int:
     """Creates missing HNSW indexes for each model+dimension pair."""
     session = get_session()
     created = 0
@@ -32,15 +69,9 @@ def run() -> int:
         for model, dimensions in rows:
             model_str = str(model)
             dim = int(dimensions)
-            idx = _index_name(model=model_str, dimensions=dim)
-            sql = (
-                f"CREATE INDEX IF NOT EXISTS {idx} "
-                f"ON embeddings USING hnsw ((vector::vector({dim})) vector_cosine_ops) "
-                f"WHERE model = '{_escape_literal(model_str)}' "
-                f"AND dimensions = {dim}"
-            )
-            session.execute(text(sql))
-            created += 1
+            for sql in _index_statements(model=model_str, dimensions=dim, halfvec=halfvec, bit=bit):
+                session.execute(text(sql))
+                created += 1
         session.commit()
         print(f"indexes_attempted={created}")
         return 0
@@ -51,8 +82,14 @@ def run() -> int:
 def main() -> int:
     """Parses CLI options and executes the index creation script."""
     parser = argparse.ArgumentParser(description="Create model-scoped HNSW indexes for embeddings.")
-    parser.parse_args()
-    return run()
+    parser.add_argument(
+        "--halfvec", action="store_true", help="Also index the halfvec column per model."
+    )
+    parser.add_argument(
+        "--bit", action="store_true", help="Also index the binary-quantized column per model."
+    )
+    args = parser.parse_args()
+    return run(halfvec=args.halfvec, bit=args.bit)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from src.api.schemas import IngestResumesRequest, TaskResponse
 from src.api.tasks import execute_task
+from src.ingest.engine import IngestionEngine
 from src.ingest.service import IngestionService
 from src.storage import models
 from src.storage.db import get_session
@@ -29,31 +30,16 @@ def run_ingest_resumes(input_dir: str, pattern: str, cleanup: bool = False) -> d
         input_dir_path = (Path.cwd() / input_dir_path).resolve()
 
     service = IngestionService()
-    files = service.discover_pdf_files(input_dir_path, pattern)
-
-    results = []
-
-    for file_path in files:
-        with get_session() as session:
-            try:
-                result = service.ingest_pdf(file_path, session)
-                session.commit()
-                results.append(
-                    {
-                        "source_file": str(file_path),
-                        "status": result.status,
-                        "candidate_id": result.candidate_id,
-                        "resume_id": result.resume_id,
-                    }
-                )
-            except Exception as e:
-                session.rollback()
-                results.append({"source_file": str(file_path), "status": "error", "error": str(e)})
+    with get_session() as session:
+        files = service.discover_pdf_files(input_dir_path, pattern, session=session)
+
+    engine = IngestionEngine(service=service)
+    results = engine.ingest_files(files)
 
     if cleanup and input_dir_path.exists():
         shutil.rmtree(input_dir_path)
 
-    return {"processed": len(files), "results": results}
+    return {"processed": len(files), "results": results, "stage_metrics": engine.metrics()}
 
 
 @router.post("/resumes", response_model=TaskResponse)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session, joinedload
 from src.api.schemas import MatchResponse, TaskResponse
 from src.api.tasks import execute_task
 from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.cache import build_rerank_cache
 from src.ranking.service import RankingService
 from src.ranking.types import RankExplanation, RankInput
 from src.storage import models
@@ -56,7 +57,7 @@ def run_generate_prep(match_id: int) -> dict:
         if not explanation:
             raise ValueError("No ranking explanation found to base the prep pack on.")
 
-        ranking_service = RankingService()
+        ranking_service = RankingService(cache=build_rerank_cache(session))
         pack = ranking_service.generate_interview_pack(rank_input, explanation)
         if pack:
             match.interview_pack_json = pack.model_dump()
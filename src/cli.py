@@ -62,21 +62,28 @@ def ingest_job_cmd(path: Path, title: str | None = typer.Option(None, help="Job
 
 
 @app.command()
-def rank(job_id: int, top_k: int = 5) -> None:
+def rank(job_id: int, top_k: int = 5, incremental: bool = False) -> None:
     """Retrieves and ranks candidates for a specific job posting.
 
     Args:
         job_id (int): Database ID of the job posting to rank against.
         top_k (int): Number of top candidates to return.
+        incremental (bool): Score only candidates whose resumes changed since the last run.
     """
     settings = get_settings()
     configure_logging(settings.log_level)
     log = get_run_logger(__name__)
-    log.info("rank command received", extra={"job_id": job_id, "top_k": top_k})
+    log.info(
+        "rank command received",
+        extra={"job_id": job_id, "top_k": top_k, "incremental": incremental},
+    )
 
     with get_session() as session:
         workflow = RankingWorkflow(session)
-        ranked = workflow.run(job_id=job_id, top_k=top_k)
+        if incremental:
+            ranked = workflow.run_incremental(job_id=job_id, top_k=top_k)
+        else:
+            ranked = workflow.run(job_id=job_id, top_k=top_k)
         session.commit()
 
     typer.secho(
@@ -95,6 +102,38 @@ def rank(job_id: int, top_k: int = 5) -> None:
                 for gap in r.explanation.gaps_and_risks:
                     typer.echo(f"    - {gap.missing_requirement}: {gap.impact}")
         typer.echo("-" * 40)
+    _echo_budget_report(workflow.budget_reports.get(job_id))
+
+
+@app.command("rank-all")
+def rank_all(top_k: int = 5, incremental: bool = False) -> None:
+    """Retrieves and ranks candidates for every job posting in one batched run.
+
+    Args:
+        top_k (int): Number of top candidates to keep per job.
+        incremental (bool): Score only candidates whose resumes changed since each job's last run.
+    """
+    settings = get_settings()
+    configure_logging(settings.log_level)
+    log = get_run_logger(__name__)
+    log.info("rank-all command received", extra={"top_k": top_k, "incremental": incremental})
+
+    with get_session() as session:
+        workflow = RankingWorkflow(session)
+        ranked_by_job = workflow.run_all(top_k=top_k, incremental=incremental)
+        session.commit()
+
+    if not ranked_by_job:
+        typer.echo("No job postings to rank.")
+        return
+
+    for job_id, ranked in ranked_by_job.items():
+        typer.secho(f"\nJob {job_id}:", fg=typer.colors.CYAN, bold=True)
+        for r in ranked[:top_k]:
+            typer.echo(
+                f"{r.rank}. Candidate ID: {r.candidate_id} | Score: {r.scores.final_score:.2f}"
+            )
+        _echo_budget_report(workflow.budget_reports.get(job_id))
 
 
 @app.command()
@@ -102,6 +141,7 @@ def prep(job_id: int, candidate_id: int) -> None:
     """Displays or generates an interview preparation pack for a candidate."""
     from src.storage import models
     from src.storage.repositories import MatchRepository, ResumeRepository
+    from src.ranking.cache import build_rerank_cache
     from src.ranking.service import RankingService
     from src.extract.types import CandidateSignals, JobRequirements
     from src.ranking.types import InterviewPrepPack, RankExplanation, RankInput
@@ -154,7 +194,7 @@ def prep(job_id: int, candidate_id: int) -> None:
                 )
                 raise typer.Exit(1)
 
-            ranking_service = RankingService()
+            ranking_service = RankingService(cache=build_rerank_cache(session))
             pack = ranking_service.generate_interview_pack(rank_input, explanation)
             if pack:
                 match.interview_pack_json = pack.model_dump()
@@ -183,6 +223,53 @@ def prep(job_id: int, candidate_id: int) -> None:
         typer.echo(f" - {q}")
 
 
+@app.command()
+def reparse(
+    extract_missing: bool = typer.Option(
+        False, help="Re-extract markdown from unchanged source files on a cache miss"
+    ),
+    force: bool = typer.Option(False, help="Also re-parse resumes at the current parser version"),
+) -> None:
+    """Re-parses stored resumes from the markdown parse cache with the current parser.
+
+    Args:
+        extract_missing (bool): Re-extract markdown from source files missing from the cache.
+        force (bool): Re-parse resumes already at the current parser version.
+    """
+    from src.ingest.parse_cache import PARSE_CACHE_STATS
+
+    settings = get_settings()
+    configure_logging(settings.log_level)
+    log = get_run_logger(__name__)
+    log.info(
+        "reparse command received", extra={"extract_missing": extract_missing, "force": force}
+    )
+
+    service = IngestionService()
+    with get_session() as session:
+        counts = service.reparse_resumes(session, extract_missing=extract_missing, force=force)
+
+    assert service.parser is not None
+    typer.secho(
+        f"Re-parsed {counts['reparsed']} resumes with parser {service.parser.parser_version} "
+        f"({counts['current']} already current, {counts['missing']} without cached markdown, {counts['failed']} failed).",
+        fg=typer.colors.RED if counts["failed"] else typer.colors.GREEN,
+    )
+    typer.echo(f"Parse cache: {PARSE_CACHE_STATS.snapshot()}")
+
+
+def _echo_budget_report(report: dict | None) -> None:
+    """Warns when a job's ranking budget ran out and left calls unmade."""
+    if not report or not report["skipped"]:
+        return
+    skipped = ", ".join(f"{count} {stage}" for stage, count in report["skipped"].items())
+    typer.secho(
+        f"Budget exhausted ({report['exhausted_by']}); skipped LLM calls: {skipped}. "
+        "Affected candidates keep deterministic scores and are re-scored by the next run.",
+        fg=typer.colors.YELLOW,
+    )
+
+
 @app.command("ingest-flow-help")
 def ingest_flow_help() -> None:
     """Show how to run the Metaflow PDF ingestion pipeline."""
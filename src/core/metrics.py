@@ -0,0 +1,129 @@
+"""Lightweight in-process counters shared by caches and pipelines."""
+
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CacheStats:
+    """Thread-safe hit/miss counters for one cache."""
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_hit(self, count: int = 1) -> None:
+        """Increments the hit counter."""
+        with self._lock:
+            self.hits += count
+
+    def record_miss(self, count: int = 1) -> None:
+        """Increments the miss counter."""
+        with self._lock:
+            self.misses += count
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Returns a point-in-time copy of the counters plus the hit ratio."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def reset(self) -> None:
+        """Clears both counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+@dataclass
+class PruningStats:
+    """Thread-safe counters for work done versus skipped by a pruning cascade."""
+
+    evaluated: int = 0
+    pruned: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, *, evaluated: int, pruned: int) -> None:
+        """Adds one cascade run's evaluated and pruned item counts."""
+        with self._lock:
+            self.evaluated += evaluated
+            self.pruned += pruned
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Returns a point-in-time copy of the counters plus the pruned ratio."""
+        with self._lock:
+            total = self.evaluated + self.pruned
+            return {
+                "evaluated": self.evaluated,
+                "pruned": self.pruned,
+                "pruned_ratio": round(self.pruned / total, 4) if total else 0.0,
+            }
+
+    def reset(self) -> None:
+        """Clears both counters."""
+        with self._lock:
+            self.evaluated = 0
+            self.pruned = 0
+
+
+@dataclass
+class StageStats:
+    """Thread-safe throughput and input-queue depth counters for one pipeline stage."""
+
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    _first_started: float | None = field(default=None, repr=False)
+    _last_finished: float | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, *, started: float, finished: float, failed: bool = False) -> None:
+        """Adds one item handled between two ``time.perf_counter()`` readings."""
+        with self._lock:
+            self.processed += 1
+            self.failed += int(failed)
+            self.busy_seconds += finished - started
+            if self._first_started is None or started < self._first_started:
+                self._first_started = started
+            if self._last_finished is None or finished > self._last_finished:
+                self._last_finished = finished
+
+    def record_queue_depth(self, depth: int) -> None:
+        """Records the current depth of the stage's input queue."""
+        with self._lock:
+            self.queue_depth = depth
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Returns a point-in-time copy of the counters plus items per wall-clock second."""
+        with self._lock:
+            elapsed = (
+                self._last_finished - self._first_started
+                if self._first_started is not None and self._last_finished is not None
+                else 0.0
+            )
+            return {
+                "processed": self.processed,
+                "failed": self.failed,
+                "busy_seconds": round(self.busy_seconds, 4),
+                "throughput_per_second": round(self.processed / elapsed, 4) if elapsed else 0.0,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+            }
+
+    def reset(self) -> None:
+        """Clears every counter."""
+        with self._lock:
+            self.processed = 0
+            self.failed = 0
+            self.busy_seconds = 0.0
+            self.queue_depth = 0
+            self.max_queue_depth = 0
+            self._first_started = None
+            self._last_finished = None
@@ -2,6 +2,11 @@
 
 from dataclasses import dataclass
 
+from src.extract.skills import (
+    SkillRegistry,
+    normalize_candidate_signals,
+    normalize_job_requirements,
+)
 from src.extract.types import CandidateSignals, ExtractionDiagnostics, JobRequirements
 from src.llm.client import LLMClient
 from src.llm.errors import coerce_provider_exception
@@ -13,22 +18,27 @@ class ExtractionService:
 
     llm_client: LLMClient
     extractor_model_alias: str = "extractor_default"
+    skill_registry: SkillRegistry | None = None
 
     def extract_job_requirements(self, job_description: str) -> JobRequirements:
-        """Extract structured job requirements from a job description string."""
+        """Extract structured job requirements from a job description string.
+
+        Hard skills are normalized to canonical skill ids before returning.
+        """
         prompt = (
             "Extract structured job requirements from the following job description.\n"
             "Return JSON matching the schema.\n\n"
             f"Job Description:\n{job_description}"
         )
         try:
-            return self.llm_client.generate_structured(
+            requirements = self.llm_client.generate_structured(
                 prompt=prompt,
                 schema=JobRequirements,
                 model_alias=self.extractor_model_alias,
             )
         except Exception as e:
             raise coerce_provider_exception(e) from e
+        return normalize_job_requirements(requirements, self.skill_registry)
 
     def extract_candidate_signals(self, sections: dict[str, str]) -> CandidateSignals:
         """Extract structured candidate signals from parsed resume sections."""
@@ -38,7 +48,10 @@ class ExtractionService:
     def extract_with_diagnostics(
         self, sections: dict[str, str]
     ) -> tuple[CandidateSignals, ExtractionDiagnostics]:
-        """Extract candidate signals and return diagnostics metadata."""
+        """Extract candidate signals and return diagnostics metadata.
+
+        Skills are normalized to canonical skill ids before returning.
+        """
         sections_text = "\n\n".join(
             f"--- {k.upper()} ---\n{v}" for k, v in sections.items() if v.strip()
         )
@@ -64,6 +77,6 @@ class ExtractionService:
                 total_tokens=meta.usage.total_tokens,
                 estimated_cost_usd=meta.usage.estimated_cost_usd,
             )
-            return result, diagnostics
         except Exception as e:
             raise coerce_provider_exception(e) from e
+        return normalize_candidate_signals(result, self.skill_registry), diagnostics
@@ -0,0 +1,189 @@
+"""Canonical skill registry backed by YAML configuration.
+
+The registry compiles every canonical id, label, alias and Spanish variant in
+``config/skill_aliases.yaml`` into one precomputed normalization map, so
+normalizing a skill is a text clean-up plus a single dict lookup. Extraction
+outputs are normalized once (at ingest and job creation) and the canonical ids
+are stored next to the raw skills; scoring then only intersects ids.
+"""
+
+import re
+import threading
+import unicodedata
+from collections.abc import Iterable
+from pathlib import Path
+
+import yaml
+
+from src.core.config import get_settings
+from src.extract.types import CandidateSignals, JobRequirements
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+_EDGE_PUNCTUATION = " .,;:()[]{}\"'"
+
+_SHARED_LOCK = threading.Lock()
+_shared_registry: "SkillRegistry | None" = None
+
+
+def normalize_skill_text(value: str) -> str:
+    """Returns the lookup form of a skill: lowercase, accent-free, single-spaced."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _SEPARATORS.sub(" ", stripped.lower()).strip(_EDGE_PUNCTUATION)
+
+
+class SkillRegistry:
+    """Loads canonical skills and normalizes free-text skills to canonical ids."""
+
+    def __init__(self, config_path: Path) -> None:
+        """Initializes the instance with its required runtime dependencies.
+
+        Args:
+            config_path (Path): Path to the YAML skill registry file.
+        """
+        self.config_path = config_path
+        self._labels, self._lookup = self._load()
+
+    def normalize(self, skill: str) -> str:
+        """Returns the canonical id for ``skill``, or its lookup form when unknown.
+
+        Args:
+            skill (str): Free-text skill as extracted by the LLM.
+
+        Returns:
+            str: Canonical skill id, or the normalized text for unlisted skills.
+        """
+        key = normalize_skill_text(skill)
+        return self._lookup.get(key, key)
+
+    def normalize_many(self, skills: Iterable[str]) -> list[str]:
+        """Returns the sorted, de-duplicated normalized ids of ``skills``; blanks are dropped."""
+        return sorted({normalized for normalized in map(self.normalize, skills) if normalized})
+
+    def label(self, skill_id: str) -> str:
+        """Returns the display label of a canonical id, or the id itself when unknown."""
+        return self._labels.get(skill_id, skill_id)
+
+    def _load(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Reads the YAML config and compiles the normalization map.
+
+        Returns:
+            tuple[dict[str, str], dict[str, str]]: Labels by canonical id, and
+                canonical id by lookup form of every known spelling.
+
+        Raises:
+            FileNotFoundError: If the configured file does not exist.
+            ValueError: If YAML content is malformed or two skills claim the
+                same spelling.
+        """
+        if not self.config_path.exists():
+            raise FileNotFoundError(f"Skill registry config not found: {self.config_path}")
+
+        with self.config_path.open("r", encoding="utf-8") as handle:
+            raw = yaml.safe_load(handle) or {}
+
+        if not isinstance(raw, dict):
+            raise ValueError("Skill registry config must be a mapping at top level")
+
+        labels: dict[str, str] = {}
+        lookup: dict[str, str] = {}
+        for skill_id, value in raw.items():
+            if not isinstance(skill_id, str):
+                raise ValueError("Canonical skill ids must be strings")
+            if not isinstance(value, dict):
+                raise ValueError(f"Skill '{skill_id}' must be a mapping")
+            label = str(value.get("label") or skill_id)
+            spellings = [skill_id, label]
+            for key in ("aliases", "es"):
+                variants = value.get(key) or []
+                if not isinstance(variants, list):
+                    raise ValueError(f"Skill '{skill_id}' field '{key}' must be a list")
+                spellings.extend(str(variant) for variant in variants)
+
+            labels[skill_id] = label
+            for spelling in spellings:
+                key = normalize_skill_text(spelling)
+                owner = lookup.setdefault(key, skill_id)
+                if owner != skill_id:
+                    raise ValueError(
+                        f"Skill spelling '{spelling}' is claimed by both '{owner}' and '{skill_id}'"
+                    )
+        return labels, lookup
+
+
+def get_shared_skill_registry() -> SkillRegistry:
+    """Returns the process-wide skill registry, parsing the YAML config on first use."""
+    global _shared_registry
+    registry = _shared_registry
+    if registry is not None:
+        return registry
+    with _SHARED_LOCK:
+        if _shared_registry is None:
+            _shared_registry = SkillRegistry(get_settings().skill_aliases_path)
+        return _shared_registry
+
+
+def reload_shared_skill_registry() -> None:
+    """Drops the shared registry so the next access re-reads the YAML config."""
+    global _shared_registry
+    with _SHARED_LOCK:
+        _shared_registry = None
+
+
+def normalize_job_requirements(
+    requirements: JobRequirements, registry: SkillRegistry | None = None
+) -> JobRequirements:
+    """Fills ``normalized_hard_skills`` from the raw hard skills, in place.
+
+    Returns:
+        JobRequirements: The same instance, for chaining.
+    """
+    registry = registry or get_shared_skill_registry()
+    requirements.normalized_hard_skills = registry.normalize_many(requirements.hard_skills)
+    return requirements
+
+
+def normalize_candidate_signals(
+    signals: CandidateSignals, registry: SkillRegistry | None = None
+) -> CandidateSignals:
+    """Fills ``normalized_skills`` from the raw skills, in place.
+
+    Returns:
+        CandidateSignals: The same instance, for chaining.
+    """
+    registry = registry or get_shared_skill_registry()
+    signals.normalized_skills = registry.normalize_many(signals.skills)
+    return signals
+
+
+def requirement_skill_ids(requirements: JobRequirements) -> list[str]:
+    """Returns the normalized hard-skill ids of a job, normalizing legacy rows on the fly."""
+    if requirements.normalized_hard_skills or not requirements.hard_skills:
+        return requirements.normalized_hard_skills
+    return get_shared_skill_registry().normalize_many(requirements.hard_skills)
+
+
+def requirement_skill_labels(
+    requirements: JobRequirements, registry: SkillRegistry | None = None
+) -> dict[str, str]:
+    """Maps each normalized hard-skill id of a job to the job's own spelling of it.
+
+    Ids are for matching only; score breakdowns shown to users report the
+    lower-cased skill text of the job, falling back to the registry label
+    when no raw skill maps to the id (e.g. after a registry edit).
+    """
+    registry = registry or get_shared_skill_registry()
+    spellings: dict[str, str] = {}
+    for skill in requirements.hard_skills:
+        spellings.setdefault(registry.normalize(skill), skill.lower())
+    return {
+        skill_id: spellings.get(skill_id) or registry.label(skill_id)
+        for skill_id in requirement_skill_ids(requirements)
+    }
+
+
+def candidate_skill_ids(signals: CandidateSignals) -> list[str]:
+    """Returns the normalized skill ids of a candidate, normalizing legacy rows on the fly."""
+    if signals.normalized_skills or not signals.skills:
+        return signals.normalized_skills
+    return get_shared_skill_registry().normalize_many(signals.skills)
@@ -1,6 +1,7 @@
 """Extraction-layer services and schemas for structured candidate/job signals."""
 
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
 
 class JobRequirements(BaseModel):
@@ -11,6 +12,8 @@ class JobRequirements(BaseModel):
     years_experience_min: int | None = None
     education_requirements: list[str] = Field(default_factory=list)
     certifications: list[str] = Field(default_factory=list)
+    # Canonical skill ids filled at job creation; hidden from the LLM schema.
+    normalized_hard_skills: SkipJsonSchema[list[str]] = Field(default_factory=list)
 
 
 class CandidateSignals(BaseModel):
@@ -21,6 +24,8 @@ class CandidateSignals(BaseModel):
     education: list[str] = Field(default_factory=list)
     certifications: list[str] = Field(default_factory=list)
     summary: str | None = None
+    # Canonical skill ids filled at ingest; hidden from the LLM schema.
+    normalized_skills: SkipJsonSchema[list[str]] = Field(default_factory=list)
 
 
 class ExtractionDiagnostics(BaseModel):
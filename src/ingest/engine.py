@@ -0,0 +1,401 @@
+"""Staged, back-pressured resume ingestion with per-stage worker pools."""
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.metrics import StageStats
+from src.ingest.entities import ParsedResume
+from src.ingest.fingerprint import FileFingerprint
+from src.ingest.service import AnalyzedResume, IngestionResult, IngestionService
+from src.storage.db import get_session
+
+STAGES = ("fingerprint", "parse", "dedupe", "analyze", "persist")
+
+# Marks the end of a stage's input; each worker passes it on to its siblings.
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class ParsedRecord:
+    """Output of the parse and dedupe stages: a new, not yet ingested resume."""
+
+    index: int
+    path: Path
+    parsed: ParsedResume
+    fingerprint: FileFingerprint | None = None
+
+
+@dataclass(frozen=True)
+class AnalyzedRecord:
+    """Output of the analyze stage: LLM-derived artifacts ready to persist."""
+
+    index: int
+    path: Path
+    analyzed: AnalyzedResume
+    fingerprint: FileFingerprint | None = None
+
+
+@dataclass(frozen=True)
+class IngestedRecord:
+    """Final outcome for one file; skipped and failed files reach it early.
+
+    Exactly one of ``result`` and ``error`` is set.
+    """
+
+    index: int
+    path: Path
+    result: IngestionResult | None = None
+    error: str | None = None
+
+    def as_row(self) -> dict:
+        """Returns the per-file result row reported by ingestion tasks."""
+        if self.result is None:
+            return {"source_file": str(self.path), "status": "error", "error": self.error}
+        return {
+            "source_file": self.result.source_file,
+            "status": self.result.status,
+            "candidate_id": self.result.candidate_id,
+            "resume_id": self.result.resume_id,
+        }
+
+
+@dataclass
+class IngestionEngine:
+    """Streams many resume files through the ingestion stages over bounded queues.
+
+    ``IngestionService.ingest_pdf`` is split into stages connected by
+    queues of ``queue_size`` typed records:
+
+    - ``fingerprint``: ``find_existing_file`` path and raw-file fingerprint
+      checks, run before a file is submitted for parsing, so known files and
+      byte-duplicates of an earlier file in the batch are never parsed.
+    - ``parse``: ``parse_pdf`` (CPU-bound PDF to markdown conversion and OCR)
+      on a process pool of ``parse_workers``; ``0`` parses in-process.
+    - ``dedupe``: ``find_existing`` source-file and content-hash checks.
+    - ``analyze``: identity and section fallbacks, extraction and embeddings
+      on ``llm_workers`` threads, sized for provider concurrency.
+    - ``persist``: re-checks for duplicates committed meanwhile, writes the
+      resume and commits each file in its own transaction.
+
+    A full queue blocks its producer, so a slow stage such as ``analyze``
+    stops parsing instead of letting parsed documents pile up in memory.
+    Database stages hold at most ``db_sessions`` open sessions in total.
+    Skipped and failed files skip the remaining stages. Per-stage counters
+    (items, failures, busy time, throughput, input-queue depth) are in
+    ``stats`` and ``metrics()``.
+
+    Attributes:
+        service: Ingestion service whose stages are run; defaults to a new one.
+        session_factory: Returns a new database session.
+        parse_workers: Parser processes; defaults to settings, or the CPU count.
+        llm_workers: Threads for the analyze stage; defaults to settings.
+        db_sessions: Maximum concurrently open sessions; defaults to settings.
+        queue_size: Capacity of each inter-stage queue; defaults to settings.
+    """
+
+    service: IngestionService | None = None
+    session_factory: Callable[[], Session] = get_session
+    parse_workers: int | None = None
+    llm_workers: int | None = None
+    db_sessions: int | None = None
+    queue_size: int | None = None
+    stats: dict[str, StageStats] = field(
+        default_factory=lambda: {stage: StageStats() for stage in STAGES}
+    )
+
+    def __post_init__(self) -> None:
+        settings = get_settings()
+        if self.service is None:
+            self.service = IngestionService()
+        if self.parse_workers is None:
+            self.parse_workers = settings.ingest_parse_workers
+        if self.parse_workers is None:
+            self.parse_workers = os.cpu_count() or 1
+        if self.llm_workers is None:
+            self.llm_workers = settings.ingest_llm_workers
+        if self.db_sessions is None:
+            self.db_sessions = settings.ingest_db_sessions
+        if self.queue_size is None:
+            self.queue_size = settings.ingest_queue_size
+        self._db_slots = threading.BoundedSemaphore(max(1, self.db_sessions))
+
+    def ingest_files(self, files: list[Path]) -> list[dict]:
+        """Ingests ``files`` and returns one result row per file, in input order.
+
+        Args:
+            files (list[Path]): Resume files to ingest.
+
+        Returns:
+            list[dict]: ``source_file``, ``status``, ``candidate_id`` and
+                ``resume_id`` per file; failed files carry ``status="error"``
+                and the ``error`` message instead of IDs.
+        """
+        records = sorted(self.stream(files), key=lambda record: record.index)
+        return [record.as_row() for record in records]
+
+    def stream(self, files: list[Path]) -> Iterator[IngestedRecord]:
+        """Yields each file's outcome as soon as it leaves the pipeline.
+
+        Outcomes arrive in completion order; ``IngestedRecord.index`` is the
+        file's position in ``files``. Closing the generator early stops the
+        pipeline after the items already in flight.
+        """
+        if not files:
+            return
+        for stats in self.stats.values():
+            stats.reset()
+        size = max(1, self.queue_size or 1)
+        parsed_q: queue.Queue = queue.Queue(maxsize=size)
+        new_q: queue.Queue = queue.Queue(maxsize=size)
+        analyzed_q: queue.Queue = queue.Queue(maxsize=size)
+        out_q: queue.Queue = queue.Queue(maxsize=size)
+        cancel = threading.Event()
+
+        db_workers = max(1, self.db_sessions or 1)
+        threads = [
+            threading.Thread(
+                target=self._feed, args=(files, parsed_q, cancel), name="ingest-parse"
+            ),
+            *self._stage_threads("dedupe", self._dedupe, parsed_q, new_q, db_workers, cancel),
+            *self._stage_threads(
+                "analyze", self._analyze, new_q, analyzed_q, max(1, self.llm_workers or 1), cancel
+            ),
+            *self._stage_threads("persist", self._persist, analyzed_q, out_q, db_workers, cancel),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            while (record := _get(out_q, cancel)) is not _DONE:
+                yield record
+        finally:
+            cancel.set()
+            for thread in threads:
+                thread.join()
+
+    def metrics(self) -> dict[str, dict[str, float | int]]:
+        """Returns a snapshot of every stage's counters, keyed by stage name."""
+        return {stage: stats.snapshot() for stage, stats in self.stats.items()}
+
+    def _feed(self, files: list[Path], outbox: queue.Queue, cancel: threading.Event) -> None:
+        """Parse stage: keeps at most ``parse_workers`` files in flight."""
+        stats = self.stats["parse"]
+        seen: dict[tuple[str, int], Path] = {}
+        if not self.parse_workers:
+            for index, path in enumerate(files):
+                skipped, fingerprint = self._check_file(index, path, seen)
+                if skipped is not None:
+                    if not _put(outbox, skipped, cancel):
+                        return
+                    continue
+                started = time.perf_counter()
+                record = self._parse(index, path, fingerprint)
+                stats.record(
+                    started=started,
+                    finished=time.perf_counter(),
+                    failed=isinstance(record, IngestedRecord),
+                )
+                if not _put(outbox, record, cancel):
+                    return
+            _put(outbox, _DONE, cancel)
+            return
+
+        assert self.service is not None and self.service.parser is not None
+        parse = self.service.parser.parse
+        pending: dict[Future, tuple[int, Path, FileFingerprint | None, float]] = {}
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            remaining = iter(enumerate(files))
+            while True:
+                for index, path in remaining:
+                    skipped, fingerprint = self._check_file(index, path, seen)
+                    if skipped is not None:
+                        if not _put(outbox, skipped, cancel):
+                            for future in pending:
+                                future.cancel()
+                            return
+                        continue
+                    sha256 = fingerprint.sha256 if fingerprint is not None else None
+                    future = pool.submit(_parse_file, parse, path, sha256)
+                    pending[future] = (index, path, fingerprint, time.perf_counter())
+                    if len(pending) >= self.parse_workers:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, path, fingerprint, started = pending.pop(future)
+                    try:
+                        record: ParsedRecord | IngestedRecord = ParsedRecord(
+                            index, path, future.result(), fingerprint
+                        )
+                    except Exception as e:
+                        record = IngestedRecord(index, path, error=str(e))
+                    stats.record(
+                        started=started,
+                        finished=time.perf_counter(),
+                        failed=isinstance(record, IngestedRecord),
+                    )
+                    # Blocks while downstream stages are busy: back-pressure on parsing.
+                    if not _put(outbox, record, cancel):
+                        for future in pending:
+                            future.cancel()
+                        return
+        _put(outbox, _DONE, cancel)
+
+    def _check_file(
+        self, index: int, path: Path, seen: dict[tuple[str, int], Path]
+    ) -> tuple[IngestedRecord | None, FileFingerprint | None]:
+        """Fingerprint stage: ends the file before parsing when its bytes are already known.
+
+        ``seen`` maps the fingerprints of earlier files in this batch to their
+        path, so a byte-identical copy is skipped instead of parsed twice.
+        """
+        assert self.service is not None
+        stats = self.stats["fingerprint"]
+        started = time.perf_counter()
+        try:
+            with self._session() as session:
+                result, fingerprint = self.service.find_existing_file(path, session)
+        except Exception as e:
+            stats.record(started=started, finished=time.perf_counter(), failed=True)
+            return IngestedRecord(index, path, error=str(e)), None
+        stats.record(started=started, finished=time.perf_counter())
+        if result is None and fingerprint is not None:
+            first = seen.setdefault((fingerprint.sha256, fingerprint.size), path)
+            if first != path:
+                result = IngestionResult(status="skipped_existing_content", source_file=str(path))
+        if result is not None:
+            return IngestedRecord(index, path, result), None
+        return None, fingerprint
+
+    def _parse(
+        self, index: int, path: Path, fingerprint: FileFingerprint | None
+    ) -> ParsedRecord | IngestedRecord:
+        """Parses one file in-process."""
+        assert self.service is not None
+        sha256 = fingerprint.sha256 if fingerprint is not None else None
+        try:
+            parsed = _parse_file(self.service.parse_pdf, path, sha256)
+            return ParsedRecord(index, path, parsed, fingerprint)
+        except Exception as e:
+            return IngestedRecord(index, path, error=str(e))
+
+    def _dedupe(self, record: ParsedRecord) -> ParsedRecord | IngestedRecord:
+        """Dedupe stage: ends the file early when it was already ingested."""
+        assert self.service is not None
+        with self._session() as session:
+            result = self.service.find_existing(record.parsed, session)
+        return record if result is None else IngestedRecord(record.index, record.path, result)
+
+    def _analyze(self, record: ParsedRecord) -> AnalyzedRecord:
+        """Analyze stage: runs the LLM-bound steps."""
+        assert self.service is not None
+        return AnalyzedRecord(
+            record.index, record.path, self.service.analyze(record.parsed), record.fingerprint
+        )
+
+    def _persist(self, record: AnalyzedRecord) -> IngestedRecord:
+        """Persist stage: writes and commits one resume unless a duplicate landed meanwhile."""
+        assert self.service is not None
+        with self._session() as session:
+            result = self.service.find_existing(record.analyzed.parsed, session)
+            if result is None:
+                result = self.service.persist(
+                    record.analyzed, session, fingerprint=record.fingerprint
+                )
+                session.commit()
+        return IngestedRecord(record.index, record.path, result)
+
+    def _stage_threads(
+        self,
+        name: str,
+        handle: Callable,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        workers: int,
+        cancel: threading.Event,
+    ) -> list[threading.Thread]:
+        """Builds the worker threads of one stage.
+
+        Finished records (skips and failures) pass through untouched. When a
+        worker reads the end marker it hands it back for its siblings; the
+        last worker to stop forwards it downstream.
+        """
+        stats = self.stats[name]
+        alive = [workers]
+        lock = threading.Lock()
+
+        def work() -> None:
+            while (item := _get(inbox, cancel)) is not _DONE:
+                stats.record_queue_depth(inbox.qsize())
+                if not isinstance(item, IngestedRecord):
+                    started = time.perf_counter()
+                    try:
+                        item = handle(item)
+                        failed = False
+                    except Exception as e:
+                        item = IngestedRecord(item.index, item.path, error=str(e))
+                        failed = True
+                    stats.record(started=started, finished=time.perf_counter(), failed=failed)
+                if not _put(outbox, item, cancel):
+                    return
+            _put(inbox, _DONE, cancel)
+            with lock:
+                alive[0] -= 1
+                last = alive[0] == 0
+            if last:
+                _put(outbox, _DONE, cancel)
+
+        return [
+            threading.Thread(target=work, name=f"ingest-{name}-{i}") for i in range(workers)
+        ]
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Holds one of the ``db_sessions`` slots for the lifetime of a session."""
+        with self._db_slots:
+            session = self.session_factory()
+            try:
+                yield session
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+
+def _parse_file(
+    parse: Callable[..., ParsedResume], path: Path, sha256: str | None
+) -> ParsedResume:
+    """Parse task; reuses the fingerprint's digest so the file is not hashed again."""
+    return parse(path) if sha256 is None else parse(path, sha256=sha256)
+
+
+def _put(target: queue.Queue, item: object, cancel: threading.Event) -> bool:
+    """Blocks until ``item`` is queued; ``False`` if the pipeline was cancelled first."""
+    while not cancel.is_set():
+        try:
+            target.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: queue.Queue, cancel: threading.Event) -> object:
+    """Blocks for the next item; the end marker if the pipeline was cancelled first."""
+    while not cancel.is_set():
+        try:
+            return source.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _DONE
@@ -0,0 +1,50 @@
+"""Raw-file fingerprints used to skip already-ingested files before parsing."""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Byte-level identity of a source file plus its stat-based change marker.
+
+    Attributes:
+        sha256: Hex SHA-256 digest of the file bytes.
+        size: File size in bytes.
+        mtime: Modification time (``st_mtime``) when the file was hashed.
+    """
+
+    sha256: str
+    size: int
+    mtime: float
+
+    def as_columns(self) -> dict:
+        """Returns the ``resumes`` column values for this fingerprint."""
+        return {"source_sha256": self.sha256, "source_size": self.size, "source_mtime": self.mtime}
+
+
+def stat_file(path: Path) -> tuple[int, float]:
+    """Returns ``(size, mtime)`` of a file without reading it."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime
+
+
+def hash_file(path: Path) -> str:
+    """Returns the hex SHA-256 digest of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_file(path: Path) -> FileFingerprint | None:
+    """Fingerprints a file; ``None`` when it cannot be read (parsing reports the error)."""
+    try:
+        size, mtime = stat_file(path)
+        return FileFingerprint(sha256=hash_file(path), size=size, mtime=mtime)
+    except OSError:
+        return None
@@ -0,0 +1,146 @@
+"""Content-addressed on-disk cache for PDF-to-markdown conversion results."""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.core.config import get_settings
+from src.core.metrics import CacheStats
+
+# Process-wide counters; each parser process keeps its own.
+PARSE_CACHE_STATS = CacheStats()
+
+_SUFFIX = ".md"
+
+
+def markdown_cache_key(
+    *, sha256: str, extractor_version: str, use_ocr: bool, force_ocr: bool
+) -> str:
+    """Returns the SHA-256 hex digest identifying one markdown extraction.
+
+    Args:
+        sha256 (str): Hex SHA-256 digest of the source file bytes.
+        extractor_version (str): Version of the PDF-to-markdown extractor.
+        use_ocr (bool): Whether OCR was requested for image-only pages.
+        force_ocr (bool): Whether OCR was forced on every page.
+
+    Returns:
+        str: Cache key.
+    """
+    payload = {
+        "sha256": sha256,
+        "extractor_version": extractor_version,
+        "use_ocr": use_ocr,
+        "force_ocr": force_ocr,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class MarkdownCache:
+    """Stores extracted markdown as one file per key under ``root``, capped at ``max_bytes``.
+
+    Reads bump the entry's mtime, so eviction removes the least recently
+    used entries first until the cache fits its cap. Each instance keeps a
+    running total of the cache size, measured once, and only scans the
+    directory when a write takes it past ``max_bytes``; the scan also picks
+    up entries written by other processes. The running total is per process,
+    so with several parser workers each one undercounts the others' writes
+    until its next scan. Writes are atomic renames, so concurrent parser
+    processes can share a cache.
+
+    Attributes:
+        root: Cache directory; created on first write.
+        max_bytes: Total size cap of the cached markdown files.
+    """
+
+    root: Path
+    max_bytes: int
+    _total_bytes: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def get(self, key: str) -> str | None:
+        """Returns the cached markdown for ``key``, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            markdown = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            PARSE_CACHE_STATS.record_miss()
+            return None
+        PARSE_CACHE_STATS.record_hit()
+        return markdown
+
+    def put(self, key: str, markdown: str) -> None:
+        """Stores ``markdown`` under ``key`` and evicts entries once the cache exceeds its cap."""
+        path = self._path(key)
+        total = self.total_bytes()
+        try:
+            total -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(markdown)
+            os.replace(tmp_name, path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._total_bytes = total + len(markdown.encode("utf-8"))
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def total_bytes(self) -> int:
+        """Returns the tracked cache size, scanning the directory on first use."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        return self._total_bytes
+
+    def evict(self) -> int:
+        """Deletes least recently used entries until the cache fits ``max_bytes``.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        return removed
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Returns ``(mtime, size, path)`` for every cached entry."""
+        entries = []
+        for path in self.root.glob(f"*/*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _path(self, key: str) -> Path:
+        """Returns the entry path, fanned out by the first two key characters."""
+        return self.root / key[:2] / f"{key}{_SUFFIX}"
+
+
+def build_markdown_cache() -> MarkdownCache | None:
+    """Builds the cache under ``data_dir`` from settings; ``None`` when disabled."""
+    settings = get_settings()
+    if not settings.ingest_parse_cache_enabled or settings.ingest_parse_cache_max_mb <= 0:
+        return None
+    return MarkdownCache(
+        root=settings.data_dir / "parse_cache",
+        max_bytes=settings.ingest_parse_cache_max_mb * 1024 * 1024,
+    )
@@ -10,6 +10,8 @@ import pymupdf.layout  # noqa: F401  # activates pymupdf-layout enhancements for
 import pymupdf4llm
 
 from src.ingest.entities import HeadingSpan, ParsedResume, SectionItem
+from src.ingest.fingerprint import hash_file
+from src.ingest.parse_cache import MarkdownCache, markdown_cache_key
 
 SECTION_MAPPING = {
     # -------------------
@@ -137,20 +139,29 @@ SECTION_MAPPING = {
 
 @dataclass
 class PDFResumeParser:
-    """Data model for pdfresumeparser values."""
+    """Data model for pdfresumeparser values.
+
+    With a ``markdown_cache``, extracted markdown is reused for files whose
+    bytes, extractor version and OCR flags were seen before, so changes to
+    ``parse_markdown`` only redo the markdown-to-sections pass.
+    """
 
     parser_version: str = "stage3.v1"
+    markdown_cache: MarkdownCache | None = None
+    use_ocr: bool = True
+    force_ocr: bool = False
 
-    def parse(self, path: Path) -> ParsedResume:
+    def parse(self, path: Path, sha256: str | None = None) -> ParsedResume:
         """Runs parse logic.
 
         Args:
             path (Path): Filesystem path of the file being parsed or ingested.
+            sha256 (str | None): Known SHA-256 of the file, passed to ``extract_markdown``.
 
         Returns:
             ParsedResume: Return value for this function.
         """
-        markdown = self.extract_markdown(path)
+        markdown = self.extract_markdown(path, sha256=sha256)
         return self.parse_markdown(markdown=markdown, source_file=str(path))
 
     def parse_markdown(self, markdown: str, source_file: str) -> ParsedResume:
@@ -189,11 +200,13 @@ class PDFResumeParser:
             parser_version=self.parser_version,
         )
 
-    def extract_markdown(self, path: Path) -> str:
+    def extract_markdown(self, path: Path, sha256: str | None = None) -> str:
         """Extracts structured information from parsed or raw resume content.
 
         Args:
             path (Path): Filesystem path of the PDF or source file being processed.
+            sha256 (str | None): Known SHA-256 of the file for the markdown cache
+                key; the file is hashed only when it is missing.
 
         Returns:
             str: Normalized string result produced by this helper.
@@ -203,13 +216,57 @@ class PDFResumeParser:
         """
         if not path.exists():
             raise FileNotFoundError(f"Resume not found: {path}")
+        if self.markdown_cache is None:
+            return self._convert_to_markdown(path)[0]
+        sha256 = sha256 or hash_file(path)
+        markdown = self.markdown_cache.get(self.markdown_cache_key(sha256))
+        if markdown is None:
+            markdown, ocr_applied = self._convert_to_markdown(path)
+            # Text from the no-OCR fallback is cached under the no-OCR key, so a
+            # later run with Tesseract installed still performs the OCR.
+            key = (
+                self.markdown_cache_key(sha256)
+                if ocr_applied
+                else self.markdown_cache_key(sha256, use_ocr=False, force_ocr=False)
+            )
+            self.markdown_cache.put(key, markdown)
+        return markdown
+
+    def markdown_cache_key(
+        self, sha256: str, *, use_ocr: bool | None = None, force_ocr: bool | None = None
+    ) -> str:
+        """Returns the markdown cache key of a file with the given SHA-256 digest.
+
+        The OCR flags default to the parser's own; pass them to key text that
+        was extracted with different flags.
+        """
+        return markdown_cache_key(
+            sha256=sha256,
+            extractor_version=pymupdf4llm.__version__,
+            use_ocr=self.use_ocr if use_ocr is None else use_ocr,
+            force_ocr=self.force_ocr if force_ocr is None else force_ocr,
+        )
+
+    def _convert_to_markdown(self, path: Path) -> tuple[str, bool]:
+        """Runs pymupdf4llm, retrying without OCR when the Tesseract backend is missing.
+
+        Returns:
+            tuple[str, bool]: Markdown, and whether it was extracted with the
+                parser's OCR flags (``False`` after the no-OCR fallback).
+        """
         doc = pymupdf.open(path)
         try:
-            return pymupdf4llm.to_markdown(doc, show_progress=False, use_ocr=True, force_ocr=False)
+            markdown = pymupdf4llm.to_markdown(
+                doc, show_progress=False, use_ocr=self.use_ocr, force_ocr=self.force_ocr
+            )
+            return markdown, True
         except RuntimeError as exc:
             if "Tesseract" not in str(exc):
                 raise
-            return pymupdf4llm.to_markdown(doc, show_progress=False, use_ocr=False, force_ocr=False)
+            markdown = pymupdf4llm.to_markdown(
+                doc, show_progress=False, use_ocr=False, force_ocr=False
+            )
+            return markdown, False
 
     def split_by_blocks(self, text: str) -> list[str]:
         """Runs split by blocks logic.
@@ -60,9 +60,10 @@ class ResumePdfIngestionFlow(FlowSpec):
     def discover_files(self):
         """Discovers input files that match the configured ingestion pattern."""
         service = IngestionService()
-        files = service.discover_pdf_files(
-            Path(self.settings["input_dir"]), self.settings["pattern"]
-        )
+        with get_session() as session:
+            files = service.discover_pdf_files(
+                Path(self.settings["input_dir"]), self.settings["pattern"], session=session
+            )
         self.pdf_files = [str(path) for path in files]
         self.discovery_metrics = {
             "discovered_count": len(self.pdf_files),
@@ -7,17 +7,24 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings
-from src.ingest.entities import ParsedResume
+from src.ingest.entities import IdentityCandidate, ParsedResume
+from src.ingest.fingerprint import FileFingerprint, fingerprint_file, stat_file
 from src.ingest.identity import ModelNameResolver, compute_content_hash, extract_identity
 from src.ingest.model_fallback import LLMFallbackResolver
+from src.ingest.parse_cache import build_markdown_cache
 from src.ingest.parser import PDFResumeParser
 from src.llm.client import LLMClient
-from src.llm.factory import build_default_llm_client
+from src.llm.factory import get_shared_llm_client
 from src.extract.service import ExtractionService
+from src.extract.types import CandidateSignals
+from src.ranking.reverse import ReverseMatcher
+from src.storage import models
 from src.storage.repositories import (
     CandidateRepository,
+    CandidateVectorRepository,
     EmbeddingRepository,
     JobPostingRepository,
+    JobVectorRepository,
     ResumeRepository,
     ResumeSectionRepository,
 )
@@ -36,6 +43,24 @@ class IngestionResult:
     avg_section_confidence: float | None = None
 
 
+@dataclass(frozen=True)
+class AnalyzedResume:
+    """LLM-derived artifacts of one parsed resume, ready to persist.
+
+    Attributes:
+        section_vectors: Section embeddings keyed by index into ``section_payloads``.
+        embedding: Embedding metadata (status, model, cost) for ``parsed_json``.
+    """
+
+    parsed: ParsedResume
+    content_hash: str
+    identity: IdentityCandidate
+    section_payloads: list[dict]
+    signals: CandidateSignals
+    section_vectors: dict[int, list[float]]
+    embedding: dict
+
+
 @dataclass
 class IngestionService:
     """Coordinates parsing, identity resolution, and persistence for resumes."""
@@ -53,7 +78,7 @@ class IngestionService:
         """Initializes default runtime dependencies and configuration values after dataclass construction."""
         settings = get_settings()
         if self.parser is None:
-            self.parser = PDFResumeParser()
+            self.parser = PDFResumeParser(markdown_cache=build_markdown_cache())
         if self.enable_name_model_fallback is None:
             self.enable_name_model_fallback = settings.ingest_enable_name_model_fallback
         if self.enable_section_model_fallback is None:
@@ -67,12 +92,21 @@ class IngestionService:
         if self.section_model_max_chars is None:
             self.section_model_max_chars = settings.ingest_section_model_max_chars
 
-    def discover_pdf_files(self, input_dir: Path, pattern: str = "*.pdf") -> list[Path]:
+    def discover_pdf_files(
+        self, input_dir: Path, pattern: str = "*.pdf", session: Session | None = None
+    ) -> list[Path]:
         """Recursively discovers PDF files that should enter ingestion.
 
+        With a ``session``, files already ingested unchanged are left out
+        before any parsing: a file whose path, size and mtime match a stored
+        resume is dropped without reading it; the remaining files are hashed
+        and dropped when a resume holds the same bytes (same SHA-256 and size).
+        Each check is one bulk query.
+
         Args:
             input_dir (Path): Root directory scanned for candidate PDF files.
             pattern (str): File glob used during recursive discovery.
+            session (Session | None): Database session for the known-file filter.
 
         Returns:
             list[Path]: Sorted list of files that match the supplied pattern.
@@ -82,23 +116,58 @@ class IngestionService:
         """
         if not input_dir.exists():
             raise FileNotFoundError(f"Input directory does not exist: {input_dir}")
-        return sorted(path for path in input_dir.rglob(pattern) if path.is_file())
+        files = sorted(path for path in input_dir.rglob(pattern) if path.is_file())
+        if session is None:
+            return files
+        return self._drop_known_files(files, session)
 
-    def parse_pdf(self, path: Path) -> ParsedResume:
+    def _drop_known_files(self, files: list[Path], session: Session) -> list[Path]:
+        """Filters out files whose bytes already belong to a stored resume."""
+        resume_repo = ResumeRepository(session)
+        stored_stats = resume_repo.get_source_stats([str(path) for path in files])
+        to_hash: list[Path] = []
+        for path in files:
+            # Unchanged since it was ingested: skip without reading the file.
+            if stat_file(path) not in stored_stats.get(str(path), set()):
+                to_hash.append(path)
+
+        fingerprints = {
+            path: fingerprint
+            for path in to_hash
+            if (fingerprint := fingerprint_file(path)) is not None
+        }
+        known = resume_repo.get_known_source_fingerprints(
+            [(fingerprint.sha256, fingerprint.size) for fingerprint in fingerprints.values()]
+        )
+        return [
+            path
+            for path in to_hash
+            if path not in fingerprints
+            or (fingerprints[path].sha256, fingerprints[path].size) not in known
+        ]
+
+    def parse_pdf(self, path: Path, sha256: str | None = None) -> ParsedResume:
         """Parses one PDF file into the normalized ``ParsedResume`` contract.
 
         Args:
             path (Path): Filesystem path of the file being parsed or ingested.
+            sha256 (str | None): Already computed SHA-256 of the file, reused
+                for the markdown cache key instead of hashing the file again.
 
         Returns:
             ParsedResume: Parsed text, sections, language, and link artifacts.
         """
         assert self.parser is not None
-        return self.parser.parse(path)
+        return self.parser.parse(path, sha256=sha256)
 
     def ingest_pdf(self, path: Path, session: Session) -> IngestionResult:
         """Ingests one resume file into candidate/resume/section tables.
 
+        Runs the ingestion stages in sequence: ``find_existing_file`` (path,
+        then raw-file fingerprint, before any parsing), ``parse_pdf``,
+        ``find_existing``, ``analyze`` and ``persist``. ``IngestionEngine``
+        runs the same stages on separate worker pools.
+
         Args:
             path (Path): Filesystem path of the file being parsed or ingested.
             session (Session): Database session used for repository operations in this call.
@@ -106,14 +175,80 @@ class IngestionService:
         Returns:
             IngestionResult: Final status with key IDs and confidence metrics.
         """
-        parsed = self.parse_pdf(path)
-        resume_content_hash = compute_content_hash(parsed.clean_text)
+        existing, fingerprint = self.find_existing_file(path, session)
+        if existing is not None:
+            return existing
+        parsed = (
+            self.parse_pdf(path, sha256=fingerprint.sha256)
+            if fingerprint is not None
+            else self.parse_pdf(path)
+        )
+        existing = self.find_existing(parsed, session)
+        if existing is not None:
+            return existing
+        return self.persist(self.analyze(parsed), session, fingerprint=fingerprint)
 
-        candidate_repo = CandidateRepository(session)
+    def find_existing_file(
+        self, path: Path, session: Session
+    ) -> tuple[IngestionResult | None, FileFingerprint | None]:
+        """Checks whether a file was already ingested, before it is parsed.
+
+        The stored path is checked first; only on a miss is the file read and
+        hashed, and its fingerprint looked up among stored resumes.
+
+        Args:
+            path (Path): Source file about to be parsed.
+            session (Session): Database session used for the lookups.
+
+        Returns:
+            tuple[IngestionResult | None, FileFingerprint | None]: A skip result
+                (``skipped_existing_resume`` for a known path,
+                ``skipped_existing_content`` for byte-identical content) or
+                ``None``, and the file's fingerprint when it was computed and
+                the file is readable.
+        """
         resume_repo = ResumeRepository(session)
-        section_repo = ResumeSectionRepository(session)
-        embedding_repo = EmbeddingRepository(session)
+        existing = resume_repo.get_by_source_file(str(path))
+        if existing is not None:
+            return (
+                IngestionResult(
+                    status="skipped_existing_resume",
+                    source_file=str(path),
+                    candidate_id=existing.candidate_id,
+                    resume_id=existing.id,
+                    section_count=0,
+                ),
+                None,
+            )
+        fingerprint = fingerprint_file(path)
+        if fingerprint is None:
+            return None, None
+        existing_file = resume_repo.get_by_source_fingerprint(fingerprint.sha256, fingerprint.size)
+        if existing_file is not None:
+            return (
+                IngestionResult(
+                    status="skipped_existing_content",
+                    source_file=str(path),
+                    candidate_id=existing_file.candidate_id,
+                    resume_id=existing_file.id,
+                    section_count=0,
+                ),
+                fingerprint,
+            )
+        return None, fingerprint
+
+    def find_existing(self, parsed: ParsedResume, session: Session) -> IngestionResult | None:
+        """Returns a skip result when the file or its content was already ingested.
 
+        Args:
+            parsed (ParsedResume): Parsed resume payload returned by ``parse_pdf``.
+            session (Session): Database session used for the lookups.
+
+        Returns:
+            IngestionResult | None: ``skipped_existing_resume`` or
+                ``skipped_existing_content`` result, or ``None`` for a new resume.
+        """
+        resume_repo = ResumeRepository(session)
         existing = resume_repo.get_by_source_file(parsed.source_file)
         if existing is not None:
             return IngestionResult(
@@ -124,7 +259,9 @@ class IngestionService:
                 section_count=0,
             )
 
-        existing_content = resume_repo.get_by_content_hash(resume_content_hash)
+        existing_content = resume_repo.get_by_content_hash(
+            compute_content_hash(parsed.clean_text)
+        )
         if existing_content is not None:
             return IngestionResult(
                 status="skipped_existing_content",
@@ -133,7 +270,21 @@ class IngestionService:
                 resume_id=existing_content.id,
                 section_count=0,
             )
+        return None
+
+    def analyze(self, parsed: ParsedResume) -> AnalyzedResume:
+        """Runs the LLM-bound steps for one parsed resume; touches no database state.
 
+        Covers identity resolution (with the optional model fallback), section
+        payloads (with the optional section classifier), candidate signal
+        extraction and section embeddings.
+
+        Args:
+            parsed (ParsedResume): Parsed resume payload returned by ``parse_pdf``.
+
+        Returns:
+            AnalyzedResume: Artifacts consumed by ``persist``.
+        """
         fallback_resolver = (
             self._build_llm_fallback_resolver() if self.enable_name_model_fallback else None
         )
@@ -144,6 +295,51 @@ class IngestionService:
             name_fallback_trigger_threshold=float(self.name_rule_trigger_threshold or 0.60),
             name_model_accept_threshold=float(self.name_model_accept_threshold or 0.70),
         )
+
+        section_payloads = self._build_section_payloads(parsed=parsed, resume_id=0)
+
+        # Extract structured candidate signals from parsed sections
+        extraction_service = ExtractionService(
+            llm_client=self._resolve_llm_client() or get_shared_llm_client()
+        )
+        sections_dict = {p["section_type"]: p["content"] for p in section_payloads}
+        candidate_signals = extraction_service.extract_candidate_signals(sections_dict)
+
+        section_vectors, embedding = self._embed_section_payloads(section_payloads)
+        return AnalyzedResume(
+            parsed=parsed,
+            content_hash=compute_content_hash(parsed.clean_text),
+            identity=identity,
+            section_payloads=section_payloads,
+            signals=candidate_signals,
+            section_vectors=section_vectors,
+            embedding=embedding,
+        )
+
+    def persist(
+        self,
+        analyzed: AnalyzedResume,
+        session: Session,
+        fingerprint: FileFingerprint | None = None,
+    ) -> IngestionResult:
+        """Writes an analyzed resume, its sections and embeddings, then reverse-matches it.
+
+        Args:
+            analyzed (AnalyzedResume): Output of ``analyze``.
+            session (Session): Database session used for repository operations in this call.
+            fingerprint (FileFingerprint | None): Raw-file fingerprint stored on the resume.
+
+        Returns:
+            IngestionResult: ``ingested`` result with key IDs and confidence metrics.
+        """
+        parsed = analyzed.parsed
+        identity = analyzed.identity
+        candidate_repo = CandidateRepository(session)
+        resume_repo = ResumeRepository(session)
+        section_repo = ResumeSectionRepository(session)
+        embedding_repo = EmbeddingRepository(session)
+        candidate_vector_repo = CandidateVectorRepository(session)
+
         name_confidence = float(
             (identity.signals.get("confidence_inputs") or {}).get("name_confidence", 0.0)
         )
@@ -156,22 +352,13 @@ class IngestionService:
             name_confidence=name_confidence,
         )
 
-        section_payloads = self._build_section_payloads(parsed=parsed, resume_id=0)
         effective_section_names = list(
-            dict.fromkeys(payload["section_type"] for payload in section_payloads)
+            dict.fromkeys(payload["section_type"] for payload in analyzed.section_payloads)
         )
-
-        # Extract structured candidate signals from parsed sections
-        extraction_service = ExtractionService(
-            llm_client=self._resolve_llm_client() or build_default_llm_client()
-        )
-        sections_dict = {p["section_type"]: p["content"] for p in section_payloads}
-        candidate_signals = extraction_service.extract_candidate_signals(sections_dict)
-
         resume = resume_repo.create(
             candidate_id=candidate.id,
             source_file=parsed.source_file,
-            content_hash=resume_content_hash,
+            content_hash=analyzed.content_hash,
             raw_text=parsed.raw_text,
             parsed_json={
                 "clean_text": parsed.clean_text,
@@ -187,20 +374,22 @@ class IngestionService:
                     "signals": identity.signals,
                 },
             },
-            signals_json=candidate_signals.model_dump(),
+            signals_json=analyzed.signals.model_dump(),
             language=parsed.language,
+            **(fingerprint.as_columns() if fingerprint is not None else {}),
         )
 
         section_count = 0
         section_confidences: list[float] = []
         created_sections = []
-        for payload in section_payloads:
+        for payload in analyzed.section_payloads:
             section = section_repo.create(
                 resume_id=resume.id,
                 section_type=payload["section_type"],
                 content=payload["content"],
                 metadata_json=payload["metadata_json"],
                 tokens=len(payload["content"].split()),
+                language=parsed.language,
             )
             created_sections.append(section)
             section_count += 1
@@ -208,10 +397,22 @@ class IngestionService:
 
         embedding_meta = self._persist_section_embeddings(
             resume_sections=created_sections,
+            section_vectors=analyzed.section_vectors,
+            embedding=analyzed.embedding,
             embedding_repo=embedding_repo,
+            candidate_id=candidate.id,
+            candidate_vector_repo=candidate_vector_repo,
         )
         resume_parsed_json = dict(getattr(resume, "parsed_json", None) or {})
         resume_parsed_json["embedding"] = embedding_meta
+        if embedding_meta["status"] == "ok":
+            resume_parsed_json["reverse_match"] = self._reverse_match(
+                session=session,
+                candidate_id=candidate.id,
+                resume_id=resume.id,
+                signals=analyzed.signals,
+                embedding_meta=embedding_meta,
+            )
         if hasattr(resume, "parsed_json"):
             resume.parsed_json = resume_parsed_json
 
@@ -231,6 +432,180 @@ class IngestionService:
             avg_section_confidence=avg_section_confidence,
         )
 
+    def reparse_resumes(
+        self, session: Session, *, extract_missing: bool = False, force: bool = False
+    ) -> dict[str, int]:
+        """Re-runs ``parse_markdown`` over stored resumes from cached markdown.
+
+        Each re-parsed resume gets the current parser's ``clean_text``,
+        ``links``, ``section_names``, ``parser_version``, ``content_hash`` and
+        ``language``, and its section rows and their embeddings are rebuilt
+        from the new parse. Sections whose text is unchanged keep their stored
+        section type and embeddings, so only new or changed section text goes
+        through the optional section classifier and the embedding provider.
+        Identity and candidate signals are kept. Every resume is committed in
+        its own transaction, so a failure only rolls back that resume.
+
+        Args:
+            session (Session): Database session used for repository operations in this call.
+            extract_missing (bool): Re-extracts markdown from the source file on a
+                cache miss, when the file still has the fingerprint stored at
+                ingestion. Resumes stored without a fingerprint are fingerprinted
+                from their source file, and the fingerprint is saved.
+            force (bool): Also re-parses resumes already at the current ``parser_version``.
+
+        Returns:
+            dict[str, int]: Counts of ``reparsed``, ``current`` (already up to date),
+                ``missing`` (no cached markdown to re-parse) and ``failed`` resumes.
+        """
+        assert self.parser is not None
+        counts = {"reparsed": 0, "current": 0, "missing": 0, "failed": 0}
+        for resume in ResumeRepository(session).list_all():
+            parser_version = (resume.parsed_json or {}).get("parser_version")
+            if not force and parser_version == self.parser.parser_version:
+                counts["current"] += 1
+                continue
+            try:
+                reparsed = self._reparse_resume(resume, session, extract_missing=extract_missing)
+                session.commit()
+            except Exception:
+                session.rollback()
+                counts["failed"] += 1
+                continue
+            counts["reparsed" if reparsed else "missing"] += 1
+        return counts
+
+    def _reparse_resume(
+        self, resume: models.Resume, session: Session, *, extract_missing: bool
+    ) -> bool:
+        """Rebuilds one resume and its sections from its markdown; ``False`` when none is found."""
+        assert self.parser is not None
+        source = self._reparse_source(resume, extract_missing=extract_missing)
+        if source is None:
+            return False
+        markdown, fingerprint = source
+        parsed = self.parser.parse_markdown(markdown=markdown, source_file=resume.source_file)
+
+        section_repo = ResumeSectionRepository(session)
+        embedding_repo = EmbeddingRepository(session)
+        candidate_vector_repo = CandidateVectorRepository(session)
+        previous_sections = section_repo.list_by_resume(resume.id)
+        # Stored vectors keyed by model, then by the embedded text's hash.
+        stored_vectors: dict[str, dict[str, list[float]]] = {}
+        for row in embedding_repo.list_by_owner_ids([section.id for section in previous_sections]):
+            stored_vectors.setdefault(row.model, {})[row.text_hash] = list(row.vector)
+        stored_model = ((resume.parsed_json or {}).get("embedding") or {}).get("selected_model")
+
+        section_payloads = self._build_section_payloads(
+            parsed=parsed,
+            resume_id=resume.id,
+            previous={section.content: section for section in previous_sections},
+        )
+        section_vectors, embedding = self._embed_changed_section_payloads(
+            section_payloads,
+            stored_model=stored_model,
+            stored_vectors=stored_vectors.get(stored_model, {}) if stored_model else {},
+        )
+
+        section_repo.delete_for_resume(resume.id)
+        created_sections = [
+            section_repo.create(
+                resume_id=resume.id,
+                section_type=payload["section_type"],
+                content=payload["content"],
+                metadata_json=payload["metadata_json"],
+                tokens=len(payload["content"].split()),
+                language=parsed.language,
+            )
+            for payload in section_payloads
+        ]
+        embedding_meta = self._persist_section_embeddings(
+            resume_sections=created_sections,
+            section_vectors=section_vectors,
+            embedding=embedding,
+            embedding_repo=embedding_repo,
+            candidate_id=resume.candidate_id,
+            candidate_vector_repo=candidate_vector_repo,
+        )
+        # Vectors of other models (e.g. from backfills) carry over for unchanged text.
+        for model, vectors in stored_vectors.items():
+            if model == embedding_meta.get("selected_model"):
+                continue
+            for section in created_sections:
+                text_hash = _text_hash(section.content)
+                if text_hash in vectors:
+                    embedding_repo.create(
+                        owner_id=section.id,
+                        model=model,
+                        vector=vectors[text_hash],
+                        text_hash=text_hash,
+                    )
+            candidate_vector_repo.refresh(candidate_id=resume.candidate_id, model=model)
+
+        parsed_json = dict(resume.parsed_json or {})
+        parsed_json.update(
+            clean_text=parsed.clean_text,
+            links=parsed.links,
+            parser_version=parsed.parser_version,
+            section_names=list(
+                dict.fromkeys(payload["section_type"] for payload in section_payloads)
+            ),
+            embedding=embedding_meta,
+        )
+        resume.parsed_json = parsed_json
+        resume.content_hash = compute_content_hash(parsed.clean_text)
+        resume.language = parsed.language
+        if fingerprint is not None:
+            for column, value in fingerprint.as_columns().items():
+                setattr(resume, column, value)
+        session.flush()
+        return True
+
+    def _reparse_source(
+        self, resume: models.Resume, *, extract_missing: bool
+    ) -> tuple[str, FileFingerprint | None] | None:
+        """Returns a resume's markdown from the parse cache, or re-extracted from its file.
+
+        Returns:
+            tuple[str, FileFingerprint | None] | None: The markdown and, for a
+                resume stored without a fingerprint, the new one to save; ``None``
+                when no markdown is available.
+        """
+        assert self.parser is not None
+        path = Path(resume.source_file)
+        fingerprint = None
+        sha256 = resume.source_sha256
+        if sha256 is None:
+            if not extract_missing or (fingerprint := fingerprint_file(path)) is None:
+                return None
+            sha256 = fingerprint.sha256
+        markdown = self._cached_markdown(sha256)
+        if markdown is not None:
+            return markdown, fingerprint
+        if not extract_missing:
+            return None
+        if fingerprint is None:
+            current = fingerprint_file(path)
+            if current is None or current.sha256 != sha256:
+                return None
+        return self.parser.extract_markdown(path, sha256=sha256), fingerprint
+
+    def _cached_markdown(self, sha256: str) -> str | None:
+        """Returns the cached markdown of a file with the given SHA-256 digest, if any."""
+        assert self.parser is not None
+        cache = self.parser.markdown_cache
+        if cache is None:
+            return None
+        # Files extracted by the no-OCR fallback are cached under the no-OCR key.
+        for key in (
+            self.parser.markdown_cache_key(sha256),
+            self.parser.markdown_cache_key(sha256, use_ocr=False, force_ocr=False),
+        ):
+            markdown = cache.get(key)
+            if markdown is not None:
+                return markdown
+        return None
+
     def ingest_job(self, title: str, description: str, session: Session) -> int:
         """Extracts requirements and persists a new job posting.
 
@@ -243,7 +618,7 @@ class IngestionService:
             int: The ID of the created job posting.
         """
         extraction_service = ExtractionService(
-            llm_client=self._resolve_llm_client() or build_default_llm_client()
+            llm_client=self._resolve_llm_client() or get_shared_llm_client()
         )
         requirements = extraction_service.extract_job_requirements(description)
 
@@ -253,14 +628,86 @@ class IngestionService:
             description=description,
             requirements_json=requirements.model_dump(),
         )
+        self._persist_job_vector(session=session, job_id=int(job.id), description=description)
         return int(job.id)
 
-    def _build_section_payloads(self, *, parsed: ParsedResume, resume_id: int) -> list[dict]:
+    def _persist_job_vector(self, *, session: Session, job_id: int, description: str) -> dict:
+        """Embeds a job description once for reverse matching and stores it in ``job_vectors``.
+
+        Failures are soft: the job is still created, it just is not found by
+        reverse matching until ``scripts/backfill_job_vectors.py`` runs.
+        """
+        settings = get_settings()
+        client = self._resolve_llm_client()
+        if client is None or not description.strip():
+            return {"status": "skipped", "model_alias": settings.embedding_model_alias}
+        try:
+            vectors, metadata = client.embed_with_meta(
+                texts=[description], embedding_model_alias=settings.embedding_model_alias
+            )
+            selected_model = metadata.selected_model or settings.embedding_model_alias
+            with session.begin_nested():
+                JobVectorRepository(session).upsert(
+                    job_id=job_id,
+                    model=selected_model,
+                    vector=[float(value) for value in vectors[0]],
+                    text_hash=hashlib.sha256(description.encode("utf-8")).hexdigest(),
+                )
+        except Exception as exc:
+            return {
+                "status": "error",
+                "model_alias": settings.embedding_model_alias,
+                "error_type": type(exc).__name__,
+            }
+        return {
+            "status": "ok",
+            "model_alias": settings.embedding_model_alias,
+            "selected_model": selected_model,
+        }
+
+    def _reverse_match(
+        self,
+        *,
+        session: Session,
+        candidate_id: int,
+        resume_id: int,
+        signals: CandidateSignals,
+        embedding_meta: dict,
+    ) -> dict:
+        """Scores a new resume against its top-M jobs; failures never abort ingestion.
+
+        The work runs in a savepoint, so a failed query leaves the resume rows
+        written so far intact.
+        """
+        try:
+            with session.begin_nested():
+                matched = ReverseMatcher(session=session).match_resume(
+                    candidate_id=candidate_id,
+                    resume_id=resume_id,
+                    signals=signals,
+                    model=embedding_meta["selected_model"],
+                    dimensions=embedding_meta["dimensions"],
+                )
+        except Exception as exc:
+            return {"status": "error", "job_count": 0, "error_type": type(exc).__name__}
+        return {"status": "ok", "job_count": len(matched)}
+
+    def _build_section_payloads(
+        self,
+        *,
+        parsed: ParsedResume,
+        resume_id: int,
+        previous: dict[str, models.ResumeSection] | None = None,
+    ) -> list[dict]:
         """Builds normalized section payloads ready for database persistence.
 
         Args:
             parsed (ParsedResume): Parsed resume payload returned by `PDFResumeParser`.
             resume_id (int): Resume primary key used to link section rows.
+            previous (dict[str, models.ResumeSection] | None): Stored sections keyed
+                by content; a section with identical text and parser type keeps
+                its stored type and model routing instead of calling the section
+                classifier again.
 
         Returns:
             list[dict]: Section dictionaries consumed by ``ResumeSectionRepository``.
@@ -278,7 +725,14 @@ class IngestionService:
             model_section_type: str | None = None
             model_section_confidence: float | None = None
             routed = False
-            if (
+            stored = (previous or {}).get(item.content)
+            stored_meta = (stored.metadata_json or {}) if stored is not None else {}
+            if stored is not None and stored_meta.get("original_section_type") == base_type:
+                final_type = stored.section_type
+                model_section_type = stored_meta.get("model_section_type")
+                model_section_confidence = stored_meta.get("model_section_confidence")
+                routed = bool(stored_meta.get("section_routed_by_model"))
+            elif (
                 self._should_route_section(item.normalized_type, item.confidence)
                 and fallback_resolver is not None
             ):
@@ -345,7 +799,7 @@ class IngestionService:
         client = self.llm_client
         if client is None:
             try:
-                client = build_default_llm_client()
+                client = get_shared_llm_client()
             except Exception:
                 return None
         return LLMFallbackResolver(client)
@@ -355,31 +809,28 @@ class IngestionService:
         if self.llm_client is not None:
             return self.llm_client
         try:
-            return build_default_llm_client()
+            return get_shared_llm_client()
         except Exception:
             return None
 
-    def _persist_section_embeddings(
-        self,
-        *,
-        resume_sections: list,
-        embedding_repo: EmbeddingRepository,
-    ) -> dict:
-        """Embeds non-skill sections and persists vectors per section."""
-        settings = get_settings()
-        candidates: list[tuple[int, str]] = []
-        for section in resume_sections:
-            section_type = str(getattr(section, "section_type", "") or "")
-            content = str(getattr(section, "content", "") or "")
-            if section_type == "skills" or not content.strip():
-                continue
-            section_id = getattr(section, "id", None)
-            if not isinstance(section_id, int):
-                continue
-            candidates.append((section_id, content))
+    def _embed_section_payloads(
+        self, section_payloads: list[dict]
+    ) -> tuple[dict[int, list[float]], dict]:
+        """Embeds non-skill section payloads ahead of persistence.
 
+        Returns:
+            tuple[dict[int, list[float]], dict]: Vectors keyed by payload index
+                and the embedding metadata; vectors are empty unless the
+                status is ``ok``.
+        """
+        settings = get_settings()
+        candidates = [
+            (index, payload["content"])
+            for index, payload in enumerate(section_payloads)
+            if payload["section_type"] != "skills" and payload["content"].strip()
+        ]
         if not candidates:
-            return {
+            return {}, {
                 "status": "skipped",
                 "model_alias": settings.embedding_model_alias,
                 "vector_count": 0,
@@ -387,7 +838,7 @@ class IngestionService:
 
         client = self._resolve_llm_client()
         if client is None:
-            return {
+            return {}, {
                 "status": "error",
                 "model_alias": settings.embedding_model_alias,
                 "vector_count": 0,
@@ -401,46 +852,124 @@ class IngestionService:
                 embedding_model_alias=settings.embedding_model_alias,
             )
         except Exception as exc:
-            return {
+            return {}, {
                 "status": "error",
                 "model_alias": settings.embedding_model_alias,
                 "vector_count": 0,
                 "error_type": type(exc).__name__,
             }
         if len(vectors) != len(candidates):
-            return {
+            return {}, {
                 "status": "error",
                 "model_alias": settings.embedding_model_alias,
                 "vector_count": 0,
                 "error_type": "vector_count_mismatch",
             }
 
+        return {index: vector for (index, _), vector in zip(candidates, vectors)}, {
+            "status": "ok",
+            "model_alias": settings.embedding_model_alias,
+            "selected_model": metadata.selected_model or settings.embedding_model_alias,
+            "dimensions": len(vectors[0]),
+            "vector_count": 0,
+            "estimated_cost_usd": metadata.usage.estimated_cost_usd,
+        }
+
+    def _embed_changed_section_payloads(
+        self,
+        section_payloads: list[dict],
+        *,
+        stored_model: str | None,
+        stored_vectors: dict[str, list[float]],
+    ) -> tuple[dict[int, list[float]], dict]:
+        """Embeds section payloads, reusing ``stored_model`` vectors for unchanged text.
+
+        ``stored_vectors`` maps the SHA-256 of embedded section text to its
+        vector. Only payloads without a stored vector are sent to the provider;
+        if the provider answers with a model other than ``stored_model``, every
+        payload is embedded again so all sections share one model.
+
+        Returns:
+            tuple[dict[int, list[float]], dict]: Same shape as ``_embed_section_payloads``.
+        """
+        embeddable = [
+            index
+            for index, payload in enumerate(section_payloads)
+            if payload["section_type"] != "skills" and payload["content"].strip()
+        ]
+        reused = {
+            index: stored_vectors[text_hash]
+            for index in embeddable
+            if (text_hash := _text_hash(section_payloads[index]["content"])) in stored_vectors
+        }
+        if not reused:
+            return self._embed_section_payloads(section_payloads)
+        changed = [index for index in embeddable if index not in reused]
+        if not changed:
+            return reused, {
+                "status": "ok",
+                "model_alias": get_settings().embedding_model_alias,
+                "selected_model": stored_model,
+                "dimensions": len(next(iter(reused.values()))),
+                "vector_count": 0,
+                "estimated_cost_usd": 0.0,
+            }
+        vectors, embedding = self._embed_section_payloads(
+            [section_payloads[index] for index in changed]
+        )
+        if embedding["status"] != "ok":
+            return vectors, embedding
+        if embedding["selected_model"] != stored_model:
+            return self._embed_section_payloads(section_payloads)
+        return {**reused, **{changed[i]: vector for i, vector in vectors.items()}}, embedding
+
+    def _persist_section_embeddings(
+        self,
+        *,
+        resume_sections: list,
+        section_vectors: dict[int, list[float]],
+        embedding: dict,
+        embedding_repo: EmbeddingRepository,
+        candidate_id: int | None = None,
+        candidate_vector_repo: CandidateVectorRepository | None = None,
+    ) -> dict:
+        """Persists precomputed section vectors against the created section rows.
+
+        ``resume_sections`` are in payload order, so ``section_vectors`` keys
+        index into them. When a candidate vector repository is given, the
+        candidate's pooled vector for the selected model is refreshed from the
+        new embeddings.
+        """
+        if embedding["status"] != "ok":
+            return embedding
+
         persisted = 0
-        selected_model = metadata.selected_model or settings.embedding_model_alias
+        selected_model = embedding["selected_model"]
         try:
-            for (section_id, content), vector in zip(candidates, vectors):
+            for index, vector in section_vectors.items():
+                section = resume_sections[index]
+                section_id = getattr(section, "id", None)
+                if not isinstance(section_id, int):
+                    continue
+                content = str(getattr(section, "content", "") or "")
                 embedding_repo.create(
                     owner_id=section_id,
                     model=selected_model,
                     vector=vector,
-                    text_hash=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+                    text_hash=_text_hash(content),
                 )
                 persisted += 1
+            if candidate_vector_repo is not None and candidate_id is not None:
+                candidate_vector_repo.refresh(candidate_id=candidate_id, model=selected_model)
         except Exception as exc:
             return {
                 "status": "error",
-                "model_alias": settings.embedding_model_alias,
+                "model_alias": embedding["model_alias"],
                 "vector_count": 0,
                 "error_type": type(exc).__name__,
             }
 
-        return {
-            "status": "ok",
-            "model_alias": settings.embedding_model_alias,
-            "selected_model": selected_model,
-            "vector_count": persisted,
-            "estimated_cost_usd": metadata.usage.estimated_cost_usd,
-        }
+        return {**embedding, "vector_count": persisted}
 
     def _build_candidate_external_id(self, path: Path) -> str:
         """Helper that handles build candidate external id.
@@ -465,3 +994,8 @@ class IngestionService:
         """
         raw = path.stem.replace("_", " ").replace("-", " ").strip()
         return " ".join(part.capitalize() for part in raw.split())
+
+
+def _text_hash(content: str) -> str:
+    """Returns the SHA-256 hex digest stored as an embedding's ``text_hash``."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
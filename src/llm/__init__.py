@@ -13,7 +13,12 @@ from src.llm.errors import (
     coerce_provider_exception,
     error_type_for_exception,
 )
-from src.llm.factory import build_default_llm_client
+from src.llm.factory import (
+    build_default_llm_client,
+    get_shared_llm_client,
+    get_shared_registry,
+    reload_shared_llm_client,
+)
 from src.llm.registry import ModelAliasRegistry
 from src.llm.types import (
     FallbackPolicy,
@@ -29,6 +34,9 @@ __all__ = [
     "LiteLLMClient",
     "ModelAliasRegistry",
     "build_default_llm_client",
+    "get_shared_llm_client",
+    "get_shared_registry",
+    "reload_shared_llm_client",
     "ModelAlias",
     "ModelRoute",
     "FallbackPolicy",
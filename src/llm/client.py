@@ -1,6 +1,7 @@
 """LLM clients backed by LiteLLM Router for routing and failover."""
 
 import json
+import threading
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
@@ -117,6 +118,7 @@ class LiteLLMClient(LLMClient):
         self._timeout_seconds = timeout_seconds
         self._max_retries = max_retries
         self._routers: dict[str, Any] = {}
+        self._routers_lock = threading.Lock()
 
     def generate_structured(
         self,
@@ -399,6 +401,9 @@ class LiteLLMClient(LLMClient):
     def _router_for_alias(self, alias_name: str) -> Any:
         """Builds or reuses a Router instance configured for one alias.
 
+        Construction is guarded by a lock so concurrent first calls on a shared
+        client build exactly one Router per alias.
+
         Args:
             alias_name: Alias name used to resolve route and policy config.
 
@@ -409,17 +414,22 @@ class LiteLLMClient(LLMClient):
         if router is not None:
             return router
 
-        from litellm import Router
+        with self._routers_lock:
+            router = self._routers.get(alias_name)
+            if router is not None:
+                return router
 
-        alias = self._registry.get(alias_name)
-        router = Router(
-            model_list=alias.to_router_model_list(alias_name),
-            num_retries=alias.fallback_policy.num_retries or self._max_retries,
-            max_fallbacks=alias.fallback_policy.max_fallbacks,
-            timeout=self._timeout_seconds,
-        )
-        self._routers[alias_name] = router
-        return router
+            from litellm import Router
+
+            alias = self._registry.get(alias_name)
+            router = Router(
+                model_list=alias.to_router_model_list(alias_name),
+                num_retries=alias.fallback_policy.num_retries or self._max_retries,
+                max_fallbacks=alias.fallback_policy.max_fallbacks,
+                timeout=self._timeout_seconds,
+            )
+            self._routers[alias_name] = router
+            return router
 
 
 def _extract_text(response_payload: Mapping[str, Any]) -> str:
@@ -1,21 +1,91 @@
-"""Factory helpers for constructing default LLM client instances."""
+"""Factory helpers for constructing default LLM client instances.
+
+``build_default_llm_client`` always builds a fresh client. Long-lived processes
+(API workers, Metaflow steps, the CLI) should use ``get_shared_llm_client`` and
+``get_shared_registry`` instead, which share one parse of the alias YAML and
+keep LiteLLM Routers cached for the process lifetime. Config changes are picked up
+only through an explicit ``reload_shared_llm_client`` call.
+"""
+
+import threading
 
 from src.core.config import get_settings
-from src.llm.client import LiteLLMClient
+from src.llm.client import LiteLLMClient, LLMClient
 from src.llm.registry import ModelAliasRegistry
 
+_SHARED_LOCK = threading.Lock()
+_shared_client: LLMClient | None = None
+_shared_registry: ModelAliasRegistry | None = None
+
 
-def build_default_llm_client() -> LiteLLMClient:
+def build_default_llm_client(registry: ModelAliasRegistry | None = None) -> LiteLLMClient:
     """Builds the default LiteLLM client using runtime settings.
 
+    Args:
+        registry (ModelAliasRegistry | None): Alias registry to route with;
+            parsed from ``settings.model_aliases_path`` when omitted.
+
     Returns:
         LiteLLMClient: Client configured with registry path, timeout, and
             retry defaults from app settings.
     """
     settings = get_settings()
-    registry = ModelAliasRegistry(settings.model_aliases_path)
+    registry = registry or ModelAliasRegistry(settings.model_aliases_path)
     return LiteLLMClient(
         registry=registry,
         timeout_seconds=settings.llm_timeout_seconds,
         max_retries=settings.llm_max_retries,
     )
+
+
+def get_shared_llm_client() -> LLMClient:
+    """Returns the process-wide LLM client, building it on first use.
+
+    The client routes with the shared alias registry, so the alias YAML is
+    parsed once per process for both.
+
+    Returns:
+        LLMClient: Shared client whose per-alias Routers are built lazily and
+            reused by every caller.
+    """
+    global _shared_client
+    client = _shared_client
+    if client is not None:
+        return client
+    with _SHARED_LOCK:
+        if _shared_client is None:
+            _shared_client = build_default_llm_client(_load_shared_registry())
+        return _shared_client
+
+
+def get_shared_registry() -> ModelAliasRegistry:
+    """Returns the process-wide alias registry, parsing the YAML config on first use.
+
+    Returns:
+        ModelAliasRegistry: Shared registry loaded from ``settings.model_aliases_path``.
+    """
+    registry = _shared_registry
+    if registry is not None:
+        return registry
+    with _SHARED_LOCK:
+        return _load_shared_registry()
+
+
+def _load_shared_registry() -> ModelAliasRegistry:
+    """Returns the shared registry, parsing it first; the caller holds ``_SHARED_LOCK``."""
+    global _shared_registry
+    if _shared_registry is None:
+        _shared_registry = ModelAliasRegistry(get_settings().model_aliases_path)
+    return _shared_registry
+
+
+def reload_shared_llm_client() -> None:
+    """Drops the shared client and registry so the next access re-reads config.
+
+    In-flight callers keep the instances they already hold; new callers get
+    clients built from the current alias YAML and settings.
+    """
+    global _shared_client, _shared_registry
+    with _SHARED_LOCK:
+        _shared_client = None
+        _shared_registry = None
@@ -0,0 +1,240 @@
+"""Vectorized deterministic scoring over large candidate pools."""
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.extract.skills import (
+    candidate_skill_ids,
+    requirement_skill_ids,
+    requirement_skill_labels,
+)
+from src.extract.types import JobRequirements
+from src.ranking.soft_match import SkillSoftMatcher
+from src.ranking.types import RankedCandidate, RankInput, ScoreBreakdown
+
+# Must match the weights of ``RankingService._deterministic_score``.
+RETRIEVAL_WEIGHT = 0.5
+SKILL_WEIGHT = 0.5
+
+
+@dataclass
+class CandidateSkillMatrix:
+    """Candidate skills interned to integer ids and held as a CSR-style sparse matrix.
+
+    Row ``i`` holds the sorted, de-duplicated skill ids of ``candidate_ids[i]``
+    in ``indices[indptr[i]:indptr[i + 1]]``. Rows are built from canonical
+    skill ids (see ``src.extract.skills``), lower-cased before interning, and
+    integer ids follow alphabetical order, so id order is name order.
+
+    Attributes:
+        candidate_ids: Candidate id per row.
+        indptr: Row offsets into ``indices``; length ``n_candidates + 1``.
+        indices: Concatenated skill ids of all rows.
+        vocabulary: Lower-cased skill name to skill id.
+    """
+
+    candidate_ids: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    vocabulary: dict[str, int]
+    _names: list[str] = field(init=False, repr=False)
+    _entry_rows: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validates the CSR layout and precomputes the row of every entry."""
+        if len(self.indptr) != len(self.candidate_ids) + 1:
+            raise ValueError("indptr must have one entry per candidate plus one")
+        if int(self.indptr[-1]) != len(self.indices):
+            raise ValueError("indptr must end at len(indices)")
+        self._names = sorted(self.vocabulary, key=self.vocabulary.__getitem__)
+        self._entry_rows = np.repeat(
+            np.arange(len(self.candidate_ids), dtype=np.int64), np.diff(self.indptr)
+        )
+
+    @classmethod
+    def build(
+        cls, candidate_ids: Sequence[int], skills: Sequence[Sequence[str]]
+    ) -> "CandidateSkillMatrix":
+        """Interns every candidate's skills and returns the sparse matrix.
+
+        Args:
+            candidate_ids (Sequence[int]): Candidate id per row.
+            skills (Sequence[Sequence[str]]): Canonical skill ids per row.
+
+        Returns:
+            CandidateSkillMatrix: Matrix ready for scoring.
+        """
+        if len(candidate_ids) != len(skills):
+            raise ValueError("candidate_ids and skills must have the same length")
+        lowered = [{skill.lower() for skill in row} for row in skills]
+        vocabulary = {name: i for i, name in enumerate(sorted(set().union(*lowered)))}
+
+        indptr = np.zeros(len(lowered) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in lowered], out=indptr[1:])
+        indices = np.fromiter(
+            (vocabulary[name] for row in lowered for name in sorted(row)),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+        return cls(
+            candidate_ids=np.asarray(candidate_ids, dtype=np.int64),
+            indptr=indptr,
+            indices=indices,
+            vocabulary=vocabulary,
+        )
+
+    def score(
+        self,
+        requirements: JobRequirements,
+        retrieval_scores: Sequence[float] | np.ndarray,
+        equivalents: Mapping[str, Iterable[str]] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Computes deterministic scores for every row in one vectorized pass.
+
+        Args:
+            requirements (JobRequirements): Job requirements shared by all rows.
+            retrieval_scores (Sequence[float] | np.ndarray): Retrieval score per row.
+            equivalents (Mapping[str, Iterable[str]] | None): Extra skills that
+                satisfy each required skill, e.g. from ``SkillSoftMatcher``.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Final deterministic score and matched
+                hard-skill count per row.
+        """
+        retrieval = np.asarray(retrieval_scores, dtype=np.float64)
+        if retrieval.shape != self.candidate_ids.shape:
+            raise ValueError("retrieval_scores must have one entry per candidate")
+
+        required = {skill.lower() for skill in requirement_skill_ids(requirements)}
+        if equivalents:
+            # Each required skill counts once per row, however many of its
+            # equivalents the row holds.
+            matched_counts = np.zeros(len(self.candidate_ids), dtype=np.int64)
+            for name in required:
+                accepted = [
+                    self.vocabulary[skill]
+                    for skill in {name, *equivalents.get(name, ())}
+                    if skill in self.vocabulary
+                ]
+                if accepted:
+                    rows = np.unique(self._entry_rows[np.isin(self.indices, accepted)])
+                    matched_counts[rows] += 1
+        else:
+            required_ids = np.fromiter(
+                (self.vocabulary[name] for name in required if name in self.vocabulary),
+                dtype=np.int32,
+            )
+            hits = np.isin(self.indices, required_ids)
+            matched_counts = np.bincount(
+                self._entry_rows[hits], minlength=len(self.candidate_ids)
+            ).astype(np.int64)
+
+        if required:
+            skill_scores = matched_counts / len(required)
+        else:
+            skill_scores = np.ones(len(self.candidate_ids), dtype=np.float64)
+        return retrieval * RETRIEVAL_WEIGHT + skill_scores * SKILL_WEIGHT, matched_counts
+
+    def top_n(
+        self,
+        requirements: JobRequirements,
+        retrieval_scores: Sequence[float] | np.ndarray,
+        n: int | None = None,
+        equivalents: Mapping[str, Iterable[str]] | None = None,
+    ) -> list[RankedCandidate]:
+        """Returns the ``n`` best rows as ranked candidates with full score breakdowns.
+
+        Ordering matches a stable descending sort on the final score: ties keep
+        row order. Breakdowns are only materialized for the returned rows.
+
+        Args:
+            requirements (JobRequirements): Job requirements shared by all rows.
+            retrieval_scores (Sequence[float] | np.ndarray): Retrieval score per row.
+            n (int | None): Number of rows to return; ``None`` returns every row.
+            equivalents (Mapping[str, Iterable[str]] | None): Extra skills that
+                satisfy each required skill.
+
+        Returns:
+            list[RankedCandidate]: Ranked candidates, best first, ranks starting at 1.
+        """
+        scores, _ = self.score(requirements, retrieval_scores, equivalents)
+        total = len(scores)
+        keep = total if n is None else max(0, min(n, total))
+        if keep == 0:
+            return []
+        if keep < total:
+            top = np.argpartition(-scores, keep - 1)[:keep]
+            # Rows tied with the cut-off score may sit on either side of the
+            # partition; take every tied row so the stable order decides.
+            cutoff = scores[top].min()
+            top = np.union1d(top, np.flatnonzero(scores == cutoff))
+        else:
+            top = np.arange(total)
+        top = top[np.lexsort((top, -scores[top]))][:keep]
+
+        labels = {
+            skill_id.lower(): label
+            for skill_id, label in requirement_skill_labels(requirements).items()
+        }
+        required = sorted(labels)
+        accepted = {name: {name, *(equivalents or {}).get(name, ())} for name in required}
+        ranked: list[RankedCandidate] = []
+        for rank, row in enumerate(top, 1):
+            row_skills = {
+                self._names[i] for i in self.indices[self.indptr[row] : self.indptr[row + 1]]
+            }
+            score = float(scores[row])
+            ranked.append(
+                RankedCandidate(
+                    candidate_id=int(self.candidate_ids[row]),
+                    rank=rank,
+                    scores=ScoreBreakdown(
+                        deterministic_score=score,
+                        final_score=score,
+                        matched_hard_skills=sorted(
+                            labels[s] for s in required if accepted[s] & row_skills
+                        ),
+                        missing_hard_skills=sorted(
+                            labels[s] for s in required if not accepted[s] & row_skills
+                        ),
+                    ),
+                )
+            )
+        return ranked
+
+
+def score_rank_inputs(
+    inputs: Sequence[RankInput],
+    n: int | None = None,
+    skill_matcher: SkillSoftMatcher | None = None,
+) -> list[RankedCandidate]:
+    """Scores rank inputs for one job with the vectorized scorer.
+
+    Args:
+        inputs (Sequence[RankInput]): Inputs sharing the same job requirements.
+        n (int | None): Number of top candidates to return; ``None`` returns all.
+        skill_matcher (SkillSoftMatcher | None): Optional soft matcher; required
+            skills then also match semantically equivalent candidate skills.
+
+    Returns:
+        list[RankedCandidate]: Ranked candidates, best first, ranks starting at 1.
+
+    Raises:
+        ValueError: If the inputs carry different job requirements.
+    """
+    if not inputs:
+        return []
+    requirements = inputs[0].requirements
+    if any(inp.requirements != requirements for inp in inputs[1:]):
+        raise ValueError("Batch scoring requires every input to share the same job requirements")
+    matrix = CandidateSkillMatrix.build(
+        [inp.candidate_id for inp in inputs], [candidate_skill_ids(inp.signals) for inp in inputs]
+    )
+    equivalents = (
+        skill_matcher.equivalents(requirement_skill_ids(requirements), matrix.vocabulary)
+        if skill_matcher is not None
+        else None
+    )
+    return matrix.top_n(requirements, [inp.retrieval_score for inp in inputs], n, equivalents)
@@ -0,0 +1,178 @@
+"""Per-run cost, token and wall-clock budgets for LLM ranking stages."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.core.config import get_settings
+from src.llm.types import LLMCallMetadata
+
+# Completion size assumed by the pre-flight check; actual usage replaces it afterwards.
+COMPLETION_TOKENS_ESTIMATE = 512
+
+_ENCODING_LOCK = threading.Lock()
+_ENCODING: object | None = None
+_ENCODING_LOADED = False
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the token count of ``text`` with tiktoken's ``cl100k_base`` encoding.
+
+    The encoding is loaded once per process. When it is unavailable (e.g. no
+    network to fetch the BPE file) the estimate falls back to four characters
+    per token.
+    """
+    global _ENCODING, _ENCODING_LOADED
+    with _ENCODING_LOCK:
+        if not _ENCODING_LOADED:
+            try:
+                import tiktoken
+
+                _ENCODING = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                _ENCODING = None
+            _ENCODING_LOADED = True
+        encoding = _ENCODING
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text))  # type: ignore[attr-defined]
+
+
+@dataclass
+class RunBudget:
+    """Spend limits for one ranking run, shared by every LLM call of the run.
+
+    Each call reserves its pre-flight estimate (prompt tokens plus
+    ``COMPLETION_TOKENS_ESTIMATE``) before it starts and settles it with the
+    provider-reported usage, ``estimated_cost_usd`` and ``latency_ms``
+    afterwards. Cost is projected from the cost per token observed so far.
+    The first call that does not fit exhausts the budget for the rest of the
+    run, so the remaining calls are skipped: prep packs (generated after
+    reranking) first, then rerank waves, down to deterministic scores only.
+    Skipped stages are recorded per candidate.
+
+    Attributes:
+        max_cost_usd: Spend cap in USD; ``None`` for no cap.
+        max_tokens: Prompt plus completion token cap; ``None`` for no cap.
+        max_seconds: Wall-clock cap measured from construction; ``None`` for no cap.
+        token_counter: Pre-flight token estimator; defaults to ``estimate_tokens``.
+    """
+
+    max_cost_usd: float | None = None
+    max_tokens: int | None = None
+    max_seconds: float | None = None
+    token_counter: Callable[[str], int] | None = None
+    spent_cost_usd: float = 0.0
+    spent_tokens: int = 0
+    spent_llm_seconds: float = 0.0
+    exhausted_by: str | None = None
+    started_at: float = field(default_factory=time.perf_counter)
+    _reserved_tokens: int = field(default=0, repr=False)
+    _skipped: dict[int, list[str]] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @classmethod
+    def from_settings(cls) -> "RunBudget | None":
+        """Builds a budget from the ``ranking_budget_*`` settings; ``None`` when all are unset."""
+        settings = get_settings()
+        budget = cls(
+            max_cost_usd=settings.ranking_budget_max_cost_usd,
+            max_tokens=settings.ranking_budget_max_tokens,
+            max_seconds=settings.ranking_budget_max_seconds,
+        )
+        limits = (budget.max_cost_usd, budget.max_tokens, budget.max_seconds)
+        return None if all(limit is None for limit in limits) else budget
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether a call has already been refused for lack of budget."""
+        return self.exhausted_by is not None
+
+    def remaining_seconds(self) -> float | None:
+        """Returns the wall-clock time left, or ``None`` without a time cap."""
+        if self.max_seconds is None:
+            return None
+        return self.max_seconds - (time.perf_counter() - self.started_at)
+
+    def reserve(self, prompt: str) -> int | None:
+        """Reserves the pre-flight estimate for one call.
+
+        Args:
+            prompt (str): Full prompt text, including any schema instructions.
+
+        Returns:
+            int | None: Reserved token count to pass to ``settle``, or ``None``
+                when the call does not fit and must be skipped.
+        """
+        estimate = (self.token_counter or estimate_tokens)(prompt) + COMPLETION_TOKENS_ESTIMATE
+        remaining = self.remaining_seconds()
+        with self._lock:
+            if self.exhausted_by is None:
+                committed = self.spent_tokens + self._reserved_tokens + estimate
+                if remaining is not None and remaining <= 0:
+                    self.exhausted_by = "time"
+                elif self.max_tokens is not None and committed > self.max_tokens:
+                    self.exhausted_by = "tokens"
+                elif self.max_cost_usd is not None:
+                    cost_per_token = (
+                        self.spent_cost_usd / self.spent_tokens if self.spent_tokens else 0.0
+                    )
+                    pending_tokens = self._reserved_tokens + estimate
+                    projected = self.spent_cost_usd + pending_tokens * cost_per_token
+                    if projected > self.max_cost_usd:
+                        self.exhausted_by = "cost"
+            if self.exhausted_by is not None:
+                return None
+            self._reserved_tokens += estimate
+            return estimate
+
+    def settle(self, reserved: int, metadata: LLMCallMetadata | None) -> None:
+        """Replaces a reservation with the call's reported usage.
+
+        Calls without metadata (or without reported token counts) are charged
+        their reserved estimate.
+        """
+        usage = metadata.usage if metadata is not None else None
+        tokens = usage.total_tokens if usage is not None and usage.total_tokens else reserved
+        cost = usage.estimated_cost_usd if usage is not None else None
+        latency_ms = metadata.latency_ms if metadata is not None else None
+        with self._lock:
+            self._reserved_tokens -= reserved
+            self.spent_tokens += tokens
+            self.spent_cost_usd += cost or 0.0
+            self.spent_llm_seconds += (latency_ms or 0.0) / 1000
+
+    def mark_skipped(self, candidate_ids: list[int], stage: str) -> None:
+        """Records that ``stage`` was skipped for each candidate for lack of budget."""
+        with self._lock:
+            for candidate_id in candidate_ids:
+                stages = self._skipped.setdefault(candidate_id, [])
+                if stage not in stages:
+                    stages.append(stage)
+
+    def summary(self) -> dict:
+        """Returns the run-level outcome: spend, exhaustion and skipped calls per stage."""
+        with self._lock:
+            skipped: dict[str, int] = {}
+            for stages in self._skipped.values():
+                for stage in stages:
+                    skipped[stage] = skipped.get(stage, 0) + 1
+            return {
+                "exhausted_by": self.exhausted_by,
+                "spent_cost_usd": round(self.spent_cost_usd, 6),
+                "spent_tokens": self.spent_tokens,
+                "spent_llm_seconds": round(self.spent_llm_seconds, 3),
+                "skipped": skipped,
+            }
+
+    def reasons(self, candidate_id: int) -> dict:
+        """Returns the budget outcome for one candidate, for ``reasons_json``."""
+        with self._lock:
+            return {
+                "skipped": list(self._skipped.get(candidate_id, [])),
+                "exhausted_by": self.exhausted_by,
+                "spent_cost_usd": round(self.spent_cost_usd, 6),
+                "spent_tokens": self.spent_tokens,
+                "spent_llm_seconds": round(self.spent_llm_seconds, 3),
+            }
@@ -0,0 +1,133 @@
+"""Content-addressed cache for LLM rerank explanations and interview prep packs."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.metrics import CacheStats
+from src.ranking.types import RankInput
+from src.storage.repositories import RerankCacheRepository
+
+SchemaModelT = TypeVar("SchemaModelT", bound=BaseModel)
+
+# Process-wide counters so hit rates survive across per-job service instances.
+RERANK_CACHE_STATS = CacheStats()
+
+
+def rerank_cache_key(
+    *,
+    kind: str,
+    model_alias: str,
+    prompt_version: str,
+    rank_input: RankInput,
+    context: BaseModel | None = None,
+) -> str:
+    """Returns the SHA-256 hex digest identifying one structured rerank call.
+
+    The key covers the canonical JSON of the job requirements and candidate
+    signals, so it is independent of job, candidate and resume ids.
+
+    Args:
+        kind (str): Payload kind, e.g. ``"explanation"`` or ``"interview_pack"``.
+        model_alias (str): Model alias the call is routed to.
+        prompt_version (str): Version of the prompt template.
+        rank_input (RankInput): Requirements and signals sent to the model.
+        context (BaseModel | None): Extra prompt input, e.g. the explanation a pack builds on.
+
+    Returns:
+        str: Cache key.
+    """
+    payload = {
+        "kind": kind,
+        "model_alias": model_alias,
+        "prompt_version": prompt_version,
+        "requirements": rank_input.requirements.model_dump(mode="json"),
+        "signals": rank_input.signals.model_dump(mode="json"),
+        "context": context.model_dump(mode="json") if context is not None else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class RerankCache:
+    """Looks up and stores structured rerank payloads keyed by their prompt inputs."""
+
+    session: Session
+    stats: CacheStats = field(default_factory=lambda: RERANK_CACHE_STATS)
+
+    def get(
+        self,
+        *,
+        kind: str,
+        schema: type[SchemaModelT],
+        model_alias: str,
+        prompt_version: str,
+        rank_input: RankInput,
+        context: BaseModel | None = None,
+    ) -> SchemaModelT | None:
+        """Returns the cached payload for one call, or ``None`` on a miss.
+
+        Rows that no longer validate against ``schema`` count as misses.
+        """
+        row = RerankCacheRepository(self.session).get(
+            cache_key=rerank_cache_key(
+                kind=kind,
+                model_alias=model_alias,
+                prompt_version=prompt_version,
+                rank_input=rank_input,
+                context=context,
+            )
+        )
+        if row is not None:
+            try:
+                value = schema.model_validate(row.payload)
+            except ValidationError:
+                value = None
+            if value is not None:
+                self.stats.record_hit()
+                return value
+        self.stats.record_miss()
+        return None
+
+    def put(
+        self,
+        *,
+        kind: str,
+        model_alias: str,
+        prompt_version: str,
+        rank_input: RankInput,
+        value: BaseModel,
+        context: BaseModel | None = None,
+    ) -> None:
+        """Stores the payload of one successful call."""
+        RerankCacheRepository(self.session).put(
+            cache_key=rerank_cache_key(
+                kind=kind,
+                model_alias=model_alias,
+                prompt_version=prompt_version,
+                rank_input=rank_input,
+                context=context,
+            ),
+            kind=kind,
+            model_alias=model_alias,
+            prompt_version=prompt_version,
+            payload=value.model_dump(mode="json"),
+        )
+
+
+def build_rerank_cache(session: Session) -> RerankCache | None:
+    """Returns a rerank cache bound to ``session``, or ``None`` when caching is disabled."""
+    if not get_settings().ranking_rerank_cache_enabled:
+        return None
+    return RerankCache(session)
+
+
+def rerank_cache_stats() -> dict[str, float | int]:
+    """Returns process-wide rerank cache counters."""
+    return RERANK_CACHE_STATS.snapshot()
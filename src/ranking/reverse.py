@@ -0,0 +1,109 @@
+"""Reverse matching: scores a newly ingested resume against the best-fitting jobs."""
+
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.batch import score_rank_inputs
+from src.ranking.soft_match import SkillSoftMatcher, build_skill_matcher
+from src.ranking.types import RankInput
+from src.retrieval.service import RetrievalService
+from src.storage import models
+from src.storage.repositories import REVERSE_MATCH_SOURCE, MatchRepository
+
+
+@dataclass
+class ReverseMatcher:
+    """Writes cheap deterministic matches for a new resume on its top-M jobs.
+
+    The resume's section embeddings query the ``job_vectors`` index for the
+    ``top_jobs`` closest job postings (every posting is treated as open).
+    Each hit is scored with the deterministic scorer only, no LLM calls, and
+    stored in ``matches`` with ``reasons_json.source == "reverse_match"``,
+    so new applicants show up on relevant jobs until the next ranking run
+    reranks them.
+
+    Attributes:
+        session: Database session used for retrieval and persistence.
+        top_jobs: Number of jobs to score; defaults to settings.
+    """
+
+    session: Session
+    retrieval_service: RetrievalService | None = None
+    skill_matcher: SkillSoftMatcher | None = None
+    top_jobs: int | None = None
+
+    def match_resume(
+        self,
+        *,
+        candidate_id: int,
+        resume_id: int,
+        signals: CandidateSignals,
+        model: str,
+        dimensions: int,
+    ) -> list[tuple[int, float]]:
+        """Scores one resume against its closest jobs and stores the matches.
+
+        Args:
+            candidate_id (int): Candidate owning the resume.
+            resume_id (int): Resume whose section embeddings were just persisted.
+            signals (CandidateSignals): Extracted signals of the resume.
+            model (str): Provider/model identifier of the section embeddings.
+            dimensions (int): Dimension of the embedding space.
+
+        Returns:
+            list[tuple[int, float]]: (job_id, final_score) for every stored match.
+        """
+        top_jobs = self.top_jobs if self.top_jobs is not None else (
+            get_settings().ingest_reverse_match_top_jobs
+        )
+        if top_jobs <= 0:
+            return []
+
+        retrieval = self.retrieval_service or RetrievalService(session=self.session)
+        hits = retrieval.top_jobs_for_resume(
+            resume_id, model=model, dimensions=dimensions, k=top_jobs
+        )
+        if not hits:
+            return []
+        jobs = {
+            job.id: job
+            for job in self.session.scalars(
+                select(models.JobPosting).where(
+                    models.JobPosting.id.in_([job_id for job_id, _ in hits])
+                )
+            )
+        }
+
+        skill_matcher = self.skill_matcher or build_skill_matcher(self.session)
+        rows: list[dict] = []
+        for job_id, retrieval_score in hits:
+            job = jobs.get(job_id)
+            if job is None or not job.requirements_json:
+                continue
+            rank_input = RankInput(
+                candidate_id=candidate_id,
+                retrieval_score=retrieval_score,
+                requirements=JobRequirements.model_validate(job.requirements_json),
+                signals=signals,
+            )
+            scored = score_rank_inputs([rank_input], skill_matcher=skill_matcher)[0]
+            rows.append(
+                {
+                    "job_id": job_id,
+                    "candidate_id": candidate_id,
+                    "retrieval_score": retrieval_score,
+                    "final_score": scored.scores.final_score,
+                    "reasons_json": {
+                        "source": REVERSE_MATCH_SOURCE,
+                        "resume_id": resume_id,
+                        "breakdown": scored.scores.model_dump(),
+                    },
+                }
+            )
+
+        MatchRepository(self.session).upsert_reverse_matches(rows)
+        return [(row["job_id"], row["final_score"]) for row in rows]
@@ -1,17 +1,56 @@
 """Ranking-layer services and schemas for candidate ordering and explanations."""
 
-from dataclasses import dataclass
+import asyncio
+import heapq
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TypeVar
 
+from pydantic import BaseModel
+
+from src.core.config import get_settings
+from src.core.metrics import PruningStats
+from src.extract.skills import (
+    candidate_skill_ids,
+    requirement_skill_ids,
+    requirement_skill_labels,
+)
 from src.llm.client import LLMClient
-from src.llm.factory import build_default_llm_client
+from src.llm.factory import get_shared_llm_client
+from src.llm.types import LLMCallMetadata
+from src.ranking.batch import score_rank_inputs
+from src.ranking.budget import RunBudget
+from src.ranking.cache import RerankCache
+from src.ranking.soft_match import SkillSoftMatcher
 from src.ranking.types import (
+    LLM_ADJUSTMENT_BOUND,
     InterviewPrepPack,
     RankedCandidate,
     RankExplanation,
     RankInput,
+    RankSlate,
     ScoreBreakdown,
 )
 
+SchemaModelT = TypeVar("SchemaModelT", bound=BaseModel)
+
+_RERANK_MODES = ("pointwise", "listwise")
+
+# Bump a version whenever its prompt changes so cached payloads are not reused.
+RERANK_PROMPT_VERSION = "1"
+SLATE_RERANK_PROMPT_VERSION = "1"
+INTERVIEW_PACK_PROMPT_VERSION = "1"
+
+# Derived fields are redundant with the raw skills and only cost prompt tokens.
+_PROMPT_EXCLUDED_FIELDS = {"normalized_hard_skills", "normalized_skills"}
+
+# Process-wide counters of candidates reranked versus pruned by the bound cascade.
+RERANK_PRUNING_STATS = PruningStats()
+
+_EXPLANATION_KIND = "explanation"
+_INTERVIEW_PACK_KIND = "interview_pack"
+
 
 @dataclass
 class RankingService:
@@ -19,69 +58,180 @@ class RankingService:
 
     llm_client: LLMClient | None = None
     ranker_model_alias: str = "ranker_default"
+    explainer_model_alias: str = "explainer_default"
+    llm_concurrency: int | None = None
+    llm_timeout_seconds: float | None = None
+    rerank_mode: str | None = None
+    slate_size: int | None = None
+    cache: RerankCache | None = None
+    skill_matcher: SkillSoftMatcher | None = None
+    pruning_stats: PruningStats = field(default_factory=lambda: RERANK_PRUNING_STATS)
+    budget: RunBudget | None = None
+    max_reranked: int | None = None
 
     def _resolve_llm_client(self) -> LLMClient:
         """Returns an LLM client instance."""
         if self.llm_client is not None:
             return self.llm_client
-        return build_default_llm_client()
-
-    def rank_candidates(self, inputs: list[RankInput], top_k: int = 5) -> list[RankedCandidate]:
-        """Rank structured candidate inputs and return ranked candidate outputs."""
-        scored: list[RankedCandidate] = []
-        for inp in inputs:
-            breakdown = self._deterministic_score(inp)
-            scored.append(
+        return get_shared_llm_client()
+
+    def rank_candidates(
+        self, inputs: list[RankInput], top_k: int = 5, with_prep_packs: bool = True
+    ) -> list[RankedCandidate]:
+        """Rank structured candidate inputs and return ranked candidate outputs.
+
+        LLM reranking is a bound-pruning cascade. ``RankExplanation`` clamps
+        adjustments to ``±LLM_ADJUSTMENT_BOUND``, so a candidate whose
+        deterministic score plus the bound falls below a lower bound on the
+        k-th final score can never reach the top ``top_k``. Candidates are
+        reranked in waves of ``top_k`` in descending deterministic order;
+        after each wave the k-th-score bound tightens from the reranked scores
+        and the remaining hopeless candidates are skipped.
+
+        At most ``max(top_k, max_reranked)`` candidates are reranked, which
+        bounds the rerank calls of a run. ``max_reranked`` defaults to
+        ``settings.ranking_rerank_max_candidates``, or ``top_k`` (one wave, the
+        deterministic top-k) when unset. The resulting top ``top_k`` is the
+        one reranking every candidate would give whenever the cascade ends
+        before the cap. Reranked and pruned counts are recorded in
+        ``pruning_stats`` (pruned = candidates not reranked).
+
+        Pass ``with_prep_packs=False`` to defer prep packs to
+        ``generate_interview_packs`` once the final ranks are known.
+
+        With a ``budget``, calls that no longer fit are skipped and recorded:
+        packs are generated only after reranking so they are dropped first,
+        then the remaining rerank waves stop, and a budget exhausted up front
+        leaves deterministic scores only.
+
+        Outside an event loop every wave and the late packs share one
+        ``asyncio.run``; inside a running loop they are called sequentially.
+        """
+        if all(inp.requirements == inputs[0].requirements for inp in inputs[1:]):
+            # Vectorized scorer; already sorted by deterministic score descending
+            scored = score_rank_inputs(inputs, skill_matcher=self.skill_matcher)
+        else:
+            scored = [
                 RankedCandidate(
                     candidate_id=inp.candidate_id,
                     rank=0,  # Placeholder
-                    scores=breakdown,
+                    scores=self._deterministic_score(inp),
                 )
+                for inp in inputs
+            ]
+            # Sort by deterministic score descending
+            scored.sort(key=lambda x: x.scores.final_score, reverse=True)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # One event loop for every wave and pack, so the shared client's async
+            # connections and per-alias semaphores are never bound to a closed loop.
+            return asyncio.run(self._arerank_cascade(scored, inputs, top_k, with_prep_packs))
+
+        # Inside a running loop a nested asyncio.run is not allowed; call sequentially.
+        early_packs = with_prep_packs and self.budget is None
+        for i, wave in enumerate(self._rerank_waves(scored, top_k)):
+            _apply_llm_results(
+                wave, self._run_llm_stage(wave, inputs, with_prep_packs=early_packs and i == 0)
             )
+        _assign_ranks(scored)
+        if with_prep_packs:
+            for candidate, inp, explanation in _late_pack_targets(scored, inputs, top_k):
+                candidate.interview_pack = self.generate_interview_pack(inp, explanation)
+        return scored
 
-        # Sort by deterministic score descending
-        scored.sort(key=lambda x: x.scores.final_score, reverse=True)
+    async def _arerank_cascade(
+        self,
+        scored: list[RankedCandidate],
+        inputs: list[RankInput],
+        top_k: int,
+        with_prep_packs: bool,
+    ) -> list[RankedCandidate]:
+        """Runs every rerank wave and the late prep packs of one ranking in one event loop."""
+        # Under a budget, packs wait until reranking is done so they are dropped first.
+        early_packs = with_prep_packs and self.budget is None
+        for i, wave in enumerate(self._rerank_waves(scored, top_k)):
+            # The first wave is the deterministic top-k; its packs start alongside reranking.
+            results = await self.arerank_with_llm(
+                wave, inputs, with_prep_packs=early_packs and i == 0
+            )
+            _apply_llm_results(wave, results)
+        _assign_ranks(scored)
+        if with_prep_packs:
+            # Later waves (and budgeted runs) skip packs; fill them in for whoever reached the top.
+            late = _late_pack_targets(scored, inputs, top_k)
+            packs = await self.agenerate_interview_packs(
+                [(inp, explanation) for _, inp, explanation in late]
+            )
+            for (candidate, _, _), pack in zip(late, packs):
+                candidate.interview_pack = pack
+        return scored
 
-        # Rerank top-N with LLM
-        top_n = scored[:top_k]
-        if top_n:
-            reranked_results = self._rerank_with_llm(top_n, inputs)
-            for candidate, (adjustment, explanation) in zip(top_n, reranked_results):
-                candidate.scores.llm_adjustment = adjustment
-                candidate.scores.final_score += adjustment
-                candidate.explanation = explanation
-                if explanation:
-                    inp = next(x for x in inputs if x.candidate_id == candidate.candidate_id)
-                    candidate.interview_pack = self.generate_interview_pack(inp, explanation)
+    def _rerank_waves(
+        self, scored: list[RankedCandidate], top_k: int
+    ) -> Iterator[list[RankedCandidate]]:
+        """Yields the rerank waves of the bound-pruning cascade over ``scored``.
 
-        # Re-sort after adjustment
-        scored.sort(key=lambda x: x.scores.final_score, reverse=True)
+        The caller applies each wave's LLM results before asking for the next
+        one, since the next wave is pruned with the reranked scores. Reranked
+        and pruned counts are recorded in ``pruning_stats`` once exhausted.
+        """
+        reranked = 0
+        rerank_cap = max(top_k, self._max_reranked(top_k))
+        wave = scored[:top_k]
+        while wave:
+            if self.budget is not None and self.budget.exhausted:
+                self.budget.mark_skipped([c.candidate_id for c in wave], "rerank")
+                break
+            yield wave
+            reranked += len(wave)
 
-        # Assign final ranks
-        for i, candidate in enumerate(scored, 1):
-            candidate.rank = i
+            remaining = scored[reranked:]
+            threshold = _kth_score_lower_bound(scored[:reranked], remaining, top_k)
+            viable = [
+                c
+                for c in remaining
+                if c.scores.deterministic_score + LLM_ADJUSTMENT_BOUND >= threshold
+            ]
+            wave = viable[: min(top_k, rerank_cap - reranked)]
+        self.pruning_stats.record(evaluated=reranked, pruned=len(scored) - reranked)
 
-        return scored
+    def _max_reranked(self, top_k: int) -> int:
+        """Returns the rerank cap of one run; ``top_k`` unless configured."""
+        if self.max_reranked is not None:
+            return self.max_reranked
+        configured = get_settings().ranking_rerank_max_candidates
+        return top_k if configured is None else configured
 
     def _deterministic_score(self, rank_input: RankInput) -> ScoreBreakdown:
         """Compute deterministic score components for one rank input.
 
         Logic:
         - Base score is retrieval_score (normalized to 0-1 range).
-        - Skill overlap: +0.1 per matched hard skill, up to 0.5.
+        - Skill overlap: share of the job's canonical hard-skill ids found
+          among the candidate's canonical skill ids (or, with a
+          ``skill_matcher``, among their semantically equivalent skills).
         - Experience match: (TBD).
+
+        Matched and missing skills are reported with the job's own skill text.
         """
-        req_skills = {s.lower() for s in rank_input.requirements.hard_skills}
-        cand_skills = {s.lower() for s in rank_input.signals.skills}
+        req_skills = set(requirement_skill_ids(rank_input.requirements))
+        cand_skills = set(candidate_skill_ids(rank_input.signals))
 
-        matched = list(req_skills & cand_skills)
-        missing = list(req_skills - cand_skills)
+        equivalents = (
+            self.skill_matcher.equivalents(req_skills, cand_skills) if self.skill_matcher else {}
+        )
+        matched_ids = {s for s in req_skills if {s, *equivalents.get(s, ())} & cand_skills}
+        labels = requirement_skill_labels(rank_input.requirements)
+        matched = sorted(labels[s] for s in matched_ids)
+        missing = sorted(labels[s] for s in req_skills - matched_ids)
 
         # Heuristic: 50% vector retrieval, 50% skill overlap
         retrieval_weight = 0.5
         skill_weight = 0.5
 
-        skill_score = len(matched) / len(req_skills) if req_skills else 1.0
+        skill_score = len(matched_ids) / len(req_skills) if req_skills else 1.0
 
         final_score = (rank_input.retrieval_score * retrieval_weight) + (skill_score * skill_weight)
 
@@ -92,6 +242,414 @@ class RankingService:
             missing_hard_skills=missing,
         )
 
+    def _run_llm_stage(
+        self,
+        top_candidates: list[RankedCandidate],
+        all_inputs: list[RankInput],
+        with_prep_packs: bool = True,
+    ) -> list[tuple[float, RankExplanation | None, InterviewPrepPack | None]]:
+        """Reranks top candidates and builds their prep packs sequentially.
+
+        Used from inside a running event loop, where the concurrent path of
+        ``arerank_with_llm`` cannot be started with ``asyncio.run``.
+        """
+        input_map = {inp.candidate_id: inp for inp in all_inputs}
+        results: list[tuple[float, RankExplanation | None, InterviewPrepPack | None]] = []
+        for cand, (adjustment, explanation) in zip(
+            top_candidates, self._rerank_with_llm(top_candidates, all_inputs)
+        ):
+            pack = (
+                self.generate_interview_pack(input_map[cand.candidate_id], explanation)
+                if explanation and with_prep_packs
+                else None
+            )
+            results.append((adjustment, explanation, pack))
+        return results
+
+    async def arerank_with_llm(
+        self,
+        top_candidates: list[RankedCandidate],
+        all_inputs: list[RankInput],
+        with_prep_packs: bool = True,
+    ) -> list[tuple[float, RankExplanation | None, InterviewPrepPack | None]]:
+        """Reranks top candidates concurrently and generates each prep pack as soon as possible.
+
+        In ``listwise`` mode (``ranking_rerank_mode``) candidates are reranked in
+        slates of ``ranking_rerank_slate_size`` with one LLM call per slate, so
+        the job requirements are sent once per slate instead of once per
+        candidate; candidates missing from a slate response fall back to a
+        pointwise call. Calls share one semaphore per model alias
+        (``ranking_llm_concurrency``) and each call is bounded by
+        ``ranking_llm_timeout_seconds``; time spent waiting for a semaphore slot
+        does not count against the timeout. Results are returned in
+        ``top_candidates`` order. A failed or timed-out rerank yields
+        ``(0.0, None, None)``; a failed pack yields ``None`` for the pack only.
+        With a ``cache`` configured, explanations and packs whose prompt inputs
+        were answered before are served from it instead of the provider.
+
+        Args:
+            top_candidates (list[RankedCandidate]): Candidates to rerank, in rank order.
+            all_inputs (list[RankInput]): Rank inputs containing every top candidate.
+            with_prep_packs (bool): When false, packs are skipped and returned as ``None``.
+
+        Returns:
+            list[tuple[float, RankExplanation | None, InterviewPrepPack | None]]:
+                Per-candidate adjustment, explanation and prep pack.
+
+        Raises:
+            ValueError: If the configured rerank mode is unknown.
+        """
+        client = self._resolve_llm_client()
+        input_map = {inp.candidate_id: inp for inp in all_inputs}
+        limits: dict[str, asyncio.Semaphore] = {}
+        slate_size = self._slate_size()
+
+        async def rerank_one(
+            inp: RankInput, explanation: RankExplanation | None
+        ) -> tuple[float, RankExplanation | None, InterviewPrepPack | None]:
+            if explanation is None:
+                explanation = self._cached_explanation(inp, RERANK_PROMPT_VERSION)
+            if explanation is None:
+                explanation = await self._acall_structured(
+                    client,
+                    limits,
+                    prompt=self._rerank_prompt(inp),
+                    schema=RankExplanation,
+                    model_alias=self.ranker_model_alias,
+                    purpose=f"reranking for candidate {inp.candidate_id}",
+                    stage="rerank",
+                    candidate_ids=[inp.candidate_id],
+                )
+                self._store_explanation(inp, explanation, RERANK_PROMPT_VERSION)
+            if explanation is None:
+                return 0.0, None, None
+            pack = (
+                await self._agenerate_interview_pack(client, limits, inp, explanation)
+                if with_prep_packs
+                else None
+            )
+            return explanation.llm_adjustment_score, explanation, pack
+
+        async def rerank_slate(
+            slate: list[RankInput],
+        ) -> list[tuple[float, RankExplanation | None, InterviewPrepPack | None]]:
+            explanations: dict[int, RankExplanation] = {}
+            if slate_size > 1:
+                for inp in slate:
+                    cached = self._cached_explanation(inp, SLATE_RERANK_PROMPT_VERSION)
+                    if cached is not None:
+                        explanations[inp.candidate_id] = cached
+                pending = [inp for inp in slate if inp.candidate_id not in explanations]
+                if len(pending) > 1:
+                    explanations.update(await self._arerank_slate(client, limits, pending))
+            return list(
+                await asyncio.gather(
+                    *(rerank_one(inp, explanations.get(inp.candidate_id)) for inp in slate)
+                )
+            )
+
+        ordered = [input_map[cand.candidate_id] for cand in top_candidates]
+        slates = [ordered[i : i + slate_size] for i in range(0, len(ordered), slate_size)]
+        slate_results = await asyncio.gather(*(rerank_slate(slate) for slate in slates))
+        return [result for results in slate_results for result in results]
+
+    def generate_interview_packs(
+        self, items: list[tuple[RankInput, RankExplanation]]
+    ) -> list[InterviewPrepPack | None]:
+        """Generates prep packs for several candidates, concurrently when possible.
+
+        Outside an event loop the packs run concurrently under the same
+        per-alias limits and timeouts as reranking; inside a running loop they
+        are generated sequentially.
+
+        Args:
+            items (list[tuple[RankInput, RankExplanation]]): Rank input and
+                explanation per candidate.
+
+        Returns:
+            list[InterviewPrepPack | None]: Pack per item in input order; ``None`` on failure.
+        """
+        if not items:
+            return []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.agenerate_interview_packs(items))
+        return [self.generate_interview_pack(inp, explanation) for inp, explanation in items]
+
+    async def agenerate_interview_packs(
+        self, items: list[tuple[RankInput, RankExplanation]]
+    ) -> list[InterviewPrepPack | None]:
+        """Generates prep packs for several candidates concurrently, in input order."""
+        client = self._resolve_llm_client()
+        limits: dict[str, asyncio.Semaphore] = {}
+        return list(
+            await asyncio.gather(
+                *(
+                    self._agenerate_interview_pack(client, limits, inp, explanation)
+                    for inp, explanation in items
+                )
+            )
+        )
+
+    async def _agenerate_interview_pack(
+        self,
+        client: LLMClient,
+        limits: dict[str, asyncio.Semaphore],
+        inp: RankInput,
+        explanation: RankExplanation,
+    ) -> InterviewPrepPack | None:
+        """Returns the cached pack for a candidate or generates and caches a new one."""
+        pack = self._cached_interview_pack(inp, explanation)
+        if pack is None:
+            pack = await self._acall_structured(
+                client,
+                limits,
+                prompt=self._interview_pack_prompt(inp, explanation),
+                schema=InterviewPrepPack,
+                model_alias=self.explainer_model_alias,
+                purpose=f"interview pack for candidate {inp.candidate_id}",
+                stage="interview_pack",
+                candidate_ids=[inp.candidate_id],
+            )
+            self._store_interview_pack(inp, explanation, pack)
+        return pack
+
+    async def _arerank_slate(
+        self,
+        client: LLMClient,
+        limits: dict[str, asyncio.Semaphore],
+        slate: list[RankInput],
+    ) -> dict[int, RankExplanation]:
+        """Reranks one slate in a single call; returns explanations keyed by candidate id.
+
+        Entries for candidates outside the slate are ignored and the first entry
+        wins when the model repeats a candidate id.
+        """
+        response = await self._acall_structured(
+            client,
+            limits,
+            prompt=self._slate_rerank_prompt(slate),
+            schema=RankSlate,
+            model_alias=self.ranker_model_alias,
+            purpose=f"listwise reranking for candidates {[inp.candidate_id for inp in slate]}",
+            stage="rerank",
+            candidate_ids=[inp.candidate_id for inp in slate],
+        )
+        if response is None:
+            return {}
+        slate_ids = {inp.candidate_id for inp in slate}
+        explanations: dict[int, RankExplanation] = {}
+        for entry in response.rankings:
+            if entry.candidate_id in slate_ids and entry.candidate_id not in explanations:
+                explanations[entry.candidate_id] = RankExplanation.model_validate(
+                    entry.model_dump(exclude={"candidate_id"})
+                )
+        for inp in slate:
+            self._store_explanation(
+                inp, explanations.get(inp.candidate_id), SLATE_RERANK_PROMPT_VERSION
+            )
+        return explanations
+
+    def _slate_size(self) -> int:
+        """Returns the rerank slate size; 1 in pointwise mode."""
+        settings = get_settings()
+        mode = self.rerank_mode or settings.ranking_rerank_mode
+        if mode not in _RERANK_MODES:
+            raise ValueError(
+                f"Unknown ranking rerank mode {mode!r}. Expected 'pointwise' or 'listwise'."
+            )
+        if mode == "pointwise":
+            return 1
+        return max(1, self.slate_size or settings.ranking_rerank_slate_size)
+
+    async def _acall_structured(
+        self,
+        client: LLMClient,
+        limits: dict[str, asyncio.Semaphore],
+        *,
+        prompt: str,
+        schema: type[SchemaModelT],
+        model_alias: str,
+        purpose: str,
+        stage: str,
+        candidate_ids: list[int],
+    ) -> SchemaModelT | None:
+        """Runs one structured call under its alias semaphore and timeout; ``None`` on failure.
+
+        With a ``budget`` the call first reserves its pre-flight estimate and is
+        skipped (recorded under ``stage`` for ``candidate_ids``) when it does
+        not fit; the timeout is capped by the remaining wall-clock budget and
+        the reported usage is charged afterwards.
+        """
+        from src.core.logging import get_run_logger
+
+        settings = get_settings()
+        concurrency = max(1, self.llm_concurrency or settings.ranking_llm_concurrency)
+        timeout = self.llm_timeout_seconds or settings.ranking_llm_timeout_seconds
+        semaphore = limits.setdefault(model_alias, asyncio.Semaphore(concurrency))
+
+        async with semaphore:
+            reserved: int | None = None
+            if self.budget is not None:
+                reserved = _reserve_budget(self.budget, prompt, schema, stage, candidate_ids)
+                if reserved is None:
+                    return None
+                remaining = self.budget.remaining_seconds()
+                if remaining is not None:
+                    timeout = min(timeout, remaining)
+            metadata: LLMCallMetadata | None = None
+            try:
+                if reserved is not None and hasattr(client, "agenerate_structured_with_meta"):
+                    result, metadata = await asyncio.wait_for(
+                        client.agenerate_structured_with_meta(
+                            prompt=prompt, schema=schema, model_alias=model_alias
+                        ),
+                        timeout=timeout,
+                    )
+                    return result
+                if hasattr(client, "agenerate_structured"):
+                    call = client.agenerate_structured(
+                        prompt=prompt, schema=schema, model_alias=model_alias
+                    )
+                else:
+                    call = asyncio.to_thread(
+                        client.generate_structured,
+                        prompt=prompt,
+                        schema=schema,
+                        model_alias=model_alias,
+                    )
+                return await asyncio.wait_for(call, timeout=timeout)
+            except Exception as e:
+                get_run_logger(__name__).error(f"Failed {purpose}: {e!r}")
+                return None
+            finally:
+                if self.budget is not None and reserved is not None:
+                    self.budget.settle(reserved, metadata)
+
+    def _call_structured(
+        self,
+        client: LLMClient,
+        *,
+        prompt: str,
+        schema: type[SchemaModelT],
+        model_alias: str,
+        stage: str,
+        candidate_ids: list[int],
+    ) -> SchemaModelT | None:
+        """Sequential counterpart of ``_acall_structured``; provider errors propagate.
+
+        Returns ``None`` only when the budget skips the call.
+        """
+        if self.budget is None:
+            return client.generate_structured(
+                prompt=prompt, schema=schema, model_alias=model_alias
+            )
+        reserved = _reserve_budget(self.budget, prompt, schema, stage, candidate_ids)
+        if reserved is None:
+            return None
+        metadata: LLMCallMetadata | None = None
+        try:
+            result, metadata = client.generate_structured_with_meta(
+                prompt=prompt, schema=schema, model_alias=model_alias
+            )
+            return result
+        finally:
+            self.budget.settle(reserved, metadata)
+
+    def _cached_explanation(
+        self, rank_input: RankInput, prompt_version: str
+    ) -> RankExplanation | None:
+        """Returns a cached rank explanation for the input and prompt version, if any."""
+        if self.cache is None:
+            return None
+        return self.cache.get(
+            kind=_EXPLANATION_KIND,
+            schema=RankExplanation,
+            model_alias=self.ranker_model_alias,
+            prompt_version=prompt_version,
+            rank_input=rank_input,
+        )
+
+    def _store_explanation(
+        self, rank_input: RankInput, explanation: RankExplanation | None, prompt_version: str
+    ) -> None:
+        """Caches a freshly generated rank explanation; failures are not cached."""
+        if self.cache is None or explanation is None:
+            return
+        self.cache.put(
+            kind=_EXPLANATION_KIND,
+            model_alias=self.ranker_model_alias,
+            prompt_version=prompt_version,
+            rank_input=rank_input,
+            value=explanation,
+        )
+
+    def _cached_interview_pack(
+        self, rank_input: RankInput, explanation: RankExplanation
+    ) -> InterviewPrepPack | None:
+        """Returns a cached interview pack built on the same explanation, if any."""
+        if self.cache is None:
+            return None
+        return self.cache.get(
+            kind=_INTERVIEW_PACK_KIND,
+            schema=InterviewPrepPack,
+            model_alias=self.explainer_model_alias,
+            prompt_version=INTERVIEW_PACK_PROMPT_VERSION,
+            rank_input=rank_input,
+            context=explanation,
+        )
+
+    def _store_interview_pack(
+        self,
+        rank_input: RankInput,
+        explanation: RankExplanation,
+        pack: InterviewPrepPack | None,
+    ) -> None:
+        """Caches a freshly generated interview pack; failures are not cached."""
+        if self.cache is None or pack is None:
+            return
+        self.cache.put(
+            kind=_INTERVIEW_PACK_KIND,
+            model_alias=self.explainer_model_alias,
+            prompt_version=INTERVIEW_PACK_PROMPT_VERSION,
+            rank_input=rank_input,
+            value=pack,
+            context=explanation,
+        )
+
+    def _rerank_prompt(self, inp: RankInput) -> str:
+        """Builds the rerank prompt for one candidate."""
+        return (
+            "Evaluate the fit of this candidate for the job based on the extracted requirements and candidate signals.\n"
+            "Provide a human-readable, evidence-based summary. For each strength, cite a short quote from the candidate signals. "
+            "For gaps and risks, identify missing requirements, assess the impact, and provide a hint for how to clarify this uncertainty in an interview.\n"
+            "Finally, provide an `llm_adjustment_score` between -0.2 (poor qualitative fit) and +0.2 (excellent qualitative fit) "
+            "to adjust the initial deterministic match score based on your holistic assessment.\n\n"
+            f"Job Requirements:\n{_prompt_json(inp.requirements)}\n\n"
+            f"Candidate Signals:\n{_prompt_json(inp.signals)}\n\n"
+            "Return valid JSON matching the requested schema."
+        )
+
+    def _slate_rerank_prompt(self, slate: list[RankInput]) -> str:
+        """Builds the listwise rerank prompt for a slate of candidates for the same job."""
+        candidates = "\n\n".join(
+            f"Candidate {inp.candidate_id} Signals:\n{_prompt_json(inp.signals)}"
+            for inp in slate
+        )
+        return (
+            "Evaluate the fit of each of the following candidates for the job based on the extracted requirements and their candidate signals. "
+            "Assess every candidate independently on its own evidence.\n"
+            "For each candidate, provide a human-readable, evidence-based summary. For each strength, cite a short quote from that candidate's signals. "
+            "For gaps and risks, identify missing requirements, assess the impact, and provide a hint for how to clarify this uncertainty in an interview.\n"
+            "Finally, provide an `llm_adjustment_score` between -0.2 (poor qualitative fit) and +0.2 (excellent qualitative fit) "
+            "to adjust the initial deterministic match score based on your holistic assessment.\n"
+            "Return exactly one entry in `rankings` per candidate, with `candidate_id` set to the candidate's id.\n\n"
+            f"Job Requirements:\n{_prompt_json(slate[0].requirements)}\n\n"
+            f"{candidates}\n\n"
+            "Return valid JSON matching the requested schema."
+        )
+
     def _rerank_with_llm(
         self,
         top_candidates: list[RankedCandidate],
@@ -109,23 +667,20 @@ class RankingService:
 
         for cand in top_candidates:
             inp = input_map[cand.candidate_id]
-            prompt = (
-                "Evaluate the fit of this candidate for the job based on the extracted requirements and candidate signals.\n"
-                "Provide a human-readable, evidence-based summary. For each strength, cite a short quote from the candidate signals. "
-                "For gaps and risks, identify missing requirements, assess the impact, and provide a hint for how to clarify this uncertainty in an interview.\n"
-                "Finally, provide an `llm_adjustment_score` between -0.2 (poor qualitative fit) and +0.2 (excellent qualitative fit) "
-                "to adjust the initial deterministic match score based on your holistic assessment.\n\n"
-                f"Job Requirements:\n{inp.requirements.model_dump_json(indent=2)}\n\n"
-                f"Candidate Signals:\n{inp.signals.model_dump_json(indent=2)}\n\n"
-                "Return valid JSON matching the requested schema."
-            )
-
+            cached = self._cached_explanation(inp, RERANK_PROMPT_VERSION)
+            if cached is not None:
+                results.append((cached.llm_adjustment_score, cached))
+                continue
             try:
-                explanation = client.generate_structured(
-                    prompt=prompt,
+                explanation = self._call_structured(
+                    client,
+                    prompt=self._rerank_prompt(inp),
                     schema=RankExplanation,
                     model_alias=self.ranker_model_alias,
+                    stage="rerank",
+                    candidate_ids=[cand.candidate_id],
                 )
+                self._store_explanation(inp, explanation, RERANK_PROMPT_VERSION)
                 # Use the adjustment score from the LLM
                 adjustment = explanation.llm_adjustment_score if explanation else 0.0
                 results.append((adjustment, explanation))
@@ -139,32 +694,106 @@ class RankingService:
         self, rank_input: RankInput, explanation: RankExplanation
     ) -> InterviewPrepPack | None:
         """Generate tailored interview preparation questions for a candidate."""
+        cached = self._cached_interview_pack(rank_input, explanation)
+        if cached is not None:
+            return cached
         client = self._resolve_llm_client()
         from src.core.logging import get_run_logger
 
         log = get_run_logger(__name__)
 
-        prompt = (
+        try:
+            pack = self._call_structured(
+                client,
+                prompt=self._interview_pack_prompt(rank_input, explanation),
+                schema=InterviewPrepPack,
+                model_alias=self.explainer_model_alias,
+                stage="interview_pack",
+                candidate_ids=[rank_input.candidate_id],
+            )
+            self._store_interview_pack(rank_input, explanation, pack)
+            return pack
+        except Exception as e:
+            log.error(
+                f"Failed to generate interview pack for candidate {rank_input.candidate_id}: {e}"
+            )
+            return None
+
+    def _interview_pack_prompt(self, rank_input: RankInput, explanation: RankExplanation) -> str:
+        """Builds the interview prep pack prompt for one candidate."""
+        return (
             "You are an expert technical interviewer. Generate a high-quality interview preparation pack for a candidate. "
             "Your goal is to provide specific, challenging questions that help evaluate the candidate's fit for the role.\n\n"
             "Requirements:\n"
             "1. technical_questions: Generate 3-5 specific questions about the candidate's core technical skills and how they applied them in their experience.\n"
             "2. behavioral_questions: Generate 2-3 questions about their past experience highlights and soft skills.\n"
             "3. clarification_questions: Generate specific questions to address the 'gaps_and_risks' identified in the ranking explanation. Help the interviewer resolve these uncertainties.\n\n"
-            f"Job Requirements:\n{rank_input.requirements.model_dump_json(indent=2)}\n\n"
-            f"Candidate Signals:\n{rank_input.signals.model_dump_json(indent=2)}\n\n"
+            f"Job Requirements:\n{_prompt_json(rank_input.requirements)}\n\n"
+            f"Candidate Signals:\n{_prompt_json(rank_input.signals)}\n\n"
             f"Candidate Ranking Explanation:\n{explanation.model_dump_json(indent=2)}\n\n"
             "Return valid JSON matching the requested schema. Ensure all question lists are populated with detailed, tailored questions. Do not return empty lists."
         )
 
-        try:
-            return client.generate_structured(
-                prompt=prompt,
-                schema=InterviewPrepPack,
-                model_alias="explainer_default",
-            )
-        except Exception as e:
-            log.error(
-                f"Failed to generate interview pack for candidate {rank_input.candidate_id}: {e}"
-            )
-            return None
+
+def _prompt_json(model: BaseModel) -> str:
+    """Serializes extraction output for prompts, leaving out normalized skill ids."""
+    return model.model_dump_json(indent=2, exclude=_PROMPT_EXCLUDED_FIELDS)
+
+
+def _reserve_budget(
+    budget: RunBudget, prompt: str, schema: type[BaseModel], stage: str, candidate_ids: list[int]
+) -> int | None:
+    """Reserves a call's pre-flight estimate; ``None`` (skip recorded) if it does not fit."""
+    # The client sends the JSON schema alongside the prompt, so it is counted too.
+    reserved = budget.reserve(f"{json.dumps(schema.model_json_schema())}\n{prompt}")
+    if reserved is None:
+        budget.mark_skipped(candidate_ids, stage)
+    return reserved
+
+
+def _apply_llm_results(
+    wave: list[RankedCandidate],
+    results: list[tuple[float, RankExplanation | None, InterviewPrepPack | None]],
+) -> None:
+    """Adds each candidate's rerank adjustment and stores its explanation and pack."""
+    for candidate, (adjustment, explanation, pack) in zip(wave, results):
+        candidate.scores.llm_adjustment = adjustment
+        candidate.scores.final_score += adjustment
+        candidate.explanation = explanation
+        candidate.interview_pack = pack
+
+
+def _assign_ranks(scored: list[RankedCandidate]) -> None:
+    """Re-sorts candidates by final score and numbers their ranks from 1."""
+    scored.sort(key=lambda x: x.scores.final_score, reverse=True)
+    for i, candidate in enumerate(scored, 1):
+        candidate.rank = i
+
+
+def _late_pack_targets(
+    scored: list[RankedCandidate], inputs: list[RankInput], top_k: int
+) -> list[tuple[RankedCandidate, RankInput, RankExplanation]]:
+    """Returns top-``top_k`` candidates that were explained but still lack a prep pack."""
+    input_map = {inp.candidate_id: inp for inp in inputs}
+    return [
+        (c, input_map[c.candidate_id], c.explanation)
+        for c in scored[:top_k]
+        if c.explanation and c.interview_pack is None
+    ]
+
+
+def _kth_score_lower_bound(
+    reranked: list[RankedCandidate], remaining: list[RankedCandidate], k: int
+) -> float:
+    """Returns a lower bound on the k-th best final score.
+
+    Reranked candidates contribute their final score; the others their
+    deterministic score minus ``LLM_ADJUSTMENT_BOUND``, the worst a rerank
+    could do to them.
+    """
+    bounds = [c.scores.final_score for c in reranked] + [
+        c.scores.deterministic_score - LLM_ADJUSTMENT_BOUND for c in remaining
+    ]
+    if k <= 0 or len(bounds) < k:
+        return float("-inf")
+    return heapq.nlargest(k, bounds)[-1]
@@ -0,0 +1,150 @@
+"""Embedding-based soft matching between required and candidate skills."""
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.metrics import CacheStats
+from src.extract.skills import SkillRegistry, get_shared_skill_registry
+from src.llm.client import LLMClient
+from src.llm.factory import get_shared_llm_client, get_shared_registry
+from src.llm.registry import ModelAliasRegistry
+from src.storage.repositories import SkillEmbeddingRepository
+
+# Process-wide counters and vectors: skill vocabularies are small and repeat
+# across jobs, so after warm-up nearly every lookup is served from memory.
+SKILL_EMBEDDING_CACHE_STATS = CacheStats()
+_VECTOR_CACHE: dict[tuple[str, str], np.ndarray] = {}
+_VECTOR_CACHE_LOCK = threading.Lock()
+
+
+@dataclass
+class SkillSoftMatcher:
+    """Finds candidate skills that are semantically equivalent to required skills.
+
+    Skills are canonical ids (see ``src.extract.skills``). Each distinct id is
+    embedded once per embedding model, using its registry label as the text,
+    and cached in process memory and in the ``skill_embeddings`` table.
+    A candidate skill is equivalent to a required skill when the cosine
+    similarity of their vectors reaches ``threshold``.
+
+    Attributes:
+        session: Database session for the persistent cache; ``None`` keeps
+            vectors in process memory only.
+        threshold: Minimum cosine similarity; defaults to settings.
+        embedding_model_alias: Embedding alias; defaults to settings.
+    """
+
+    session: Session | None = None
+    llm_client: LLMClient | None = None
+    registry: ModelAliasRegistry | None = None
+    skill_registry: SkillRegistry | None = None
+    threshold: float | None = None
+    embedding_model_alias: str | None = None
+    stats: CacheStats = field(default_factory=lambda: SKILL_EMBEDDING_CACHE_STATS)
+
+    def equivalents(
+        self, required: Iterable[str], candidate_skills: Iterable[str]
+    ) -> dict[str, set[str]]:
+        """Returns, per required skill, the candidate skills that soft-match it.
+
+        Similarities are computed as one ``required x candidate`` matrix
+        product over unit-normalized vectors. When embedding fails the result
+        is empty, so scoring falls back to exact matching.
+
+        Args:
+            required (Iterable[str]): Canonical ids of the job's hard skills.
+            candidate_skills (Iterable[str]): Canonical ids of candidate skills.
+
+        Returns:
+            dict[str, set[str]]: Matching candidate skills keyed by required
+                skill; required skills without a match are absent.
+        """
+        required_ids = sorted(set(required))
+        candidate_ids = sorted(set(candidate_skills))
+        if not required_ids or not candidate_ids:
+            return {}
+
+        try:
+            vectors = self._vectors(sorted(set(required_ids) | set(candidate_ids)))
+        except Exception as e:
+            from src.core.logging import get_run_logger
+
+            get_run_logger(__name__).error(f"Failed to embed skills for soft matching: {e!r}")
+            return {}
+
+        required_matrix = np.stack([vectors[skill] for skill in required_ids])
+        candidate_matrix = np.stack([vectors[skill] for skill in candidate_ids])
+        similarity = required_matrix @ candidate_matrix.T
+
+        threshold = (
+            self.threshold
+            if self.threshold is not None
+            else get_settings().ranking_skill_soft_match_threshold
+        )
+        matches: dict[str, set[str]] = {}
+        for i, j in zip(*np.nonzero(similarity >= threshold)):
+            matches.setdefault(required_ids[i], set()).add(candidate_ids[j])
+        return matches
+
+    def _vectors(self, skill_ids: list[str]) -> dict[str, np.ndarray]:
+        """Returns unit-length vectors for ``skill_ids``, embedding only cache misses."""
+        alias_name = (
+            self.embedding_model_alias or get_settings().ranking_skill_embedding_model_alias
+        )
+        model = (self.registry or get_shared_registry()).get(alias_name).default_model
+
+        vectors: dict[str, np.ndarray] = {}
+        with _VECTOR_CACHE_LOCK:
+            for skill in skill_ids:
+                cached = _VECTOR_CACHE.get((model, skill))
+                if cached is not None:
+                    vectors[skill] = cached
+        self.stats.record_hit(len(vectors))
+
+        missing = [skill for skill in skill_ids if skill not in vectors]
+        if not missing:
+            return vectors
+        self.stats.record_miss(len(missing))
+
+        repo = SkillEmbeddingRepository(self.session) if self.session is not None else None
+        loaded = repo.get_many(skill_texts=missing, model=model) if repo is not None else {}
+        to_embed = [skill for skill in missing if skill not in loaded]
+        if to_embed:
+            skill_registry = self.skill_registry or get_shared_skill_registry()
+            embedded = (self.llm_client or get_shared_llm_client()).embed(
+                texts=[skill_registry.label(skill) for skill in to_embed],
+                embedding_model_alias=alias_name,
+            )
+            fresh = {
+                skill: [float(v) for v in vector] for skill, vector in zip(to_embed, embedded)
+            }
+            if repo is not None:
+                repo.put_many(vectors=fresh, model=model)
+            loaded.update(fresh)
+
+        with _VECTOR_CACHE_LOCK:
+            for skill, raw in loaded.items():
+                vector = np.asarray(raw, dtype=np.float32)
+                norm = float(np.linalg.norm(vector))
+                vector = vector / norm if norm else vector
+                _VECTOR_CACHE[(model, skill)] = vector
+                vectors[skill] = vector
+        return vectors
+
+
+def build_skill_matcher(session: Session) -> SkillSoftMatcher | None:
+    """Returns a soft matcher bound to ``session``, or ``None`` when soft matching is off."""
+    if not get_settings().ranking_skill_soft_match:
+        return None
+    return SkillSoftMatcher(session=session)
+
+
+def clear_skill_vector_cache() -> None:
+    """Drops every in-process skill vector so the next lookup reloads them."""
+    with _VECTOR_CACHE_LOCK:
+        _VECTOR_CACHE.clear()
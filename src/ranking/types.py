@@ -1,9 +1,12 @@
 """Ranking-layer services and schemas for candidate ordering and explanations."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from src.extract.types import CandidateSignals, JobRequirements
 
+# Reranking may move a deterministic score by at most this much in either direction.
+LLM_ADJUSTMENT_BOUND = 0.2
+
 
 class RankInput(BaseModel):
     """Input payload for candidate ranking."""
@@ -47,9 +50,34 @@ class RankExplanation(BaseModel):
     gaps_and_risks: list[GapOrRisk] = Field(default_factory=list)
     llm_adjustment_score: float = Field(
         default=0.0,
+        ge=-LLM_ADJUSTMENT_BOUND,
+        le=LLM_ADJUSTMENT_BOUND,
         description="A score adjustment between -0.2 (poor qualitative fit) and +0.2 (excellent qualitative fit) based on qualitative assessment.",
     )
 
+    @field_validator("llm_adjustment_score", mode="before")
+    @classmethod
+    def _clamp_adjustment(cls, value: object) -> object:
+        """Clamps numeric adjustments into the bound instead of rejecting the explanation."""
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            return max(-LLM_ADJUSTMENT_BOUND, min(LLM_ADJUSTMENT_BOUND, float(value)))
+        return value
+
+
+class SlateRankExplanation(RankExplanation):
+    """Rank explanation for one candidate inside a listwise rerank response."""
+
+    candidate_id: int
+
+
+class RankSlate(BaseModel):
+    """Listwise rerank response covering a slate of candidates."""
+
+    rankings: list[SlateRankExplanation] = Field(
+        default_factory=list,
+        description="One entry per candidate in the slate, keyed by candidate_id.",
+    )
+
 
 class InterviewPrepPack(BaseModel):
     """Interview questions tailored to candidate fit and gaps."""
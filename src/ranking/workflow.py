@@ -1,22 +1,49 @@
 """Workflow orchestration for job/candidate retrieval and ranking."""
 
-from dataclasses import dataclass
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.budget import RunBudget
+from src.ranking.cache import build_rerank_cache
 from src.ranking.service import RankingService
+from src.ranking.soft_match import build_skill_matcher
 from src.ranking.types import RankInput, RankedCandidate, ScoreBreakdown, RankExplanation
+from src.core.config import get_settings
+from src.retrieval.cache import QueryEmbeddingCache
 from src.retrieval.service import RetrievalService
 from src.storage import models
-from src.storage.repositories import MatchRepository, ResumeRepository
+from src.storage.repositories import (
+    REVERSE_MATCH_SOURCE,
+    MatchRepository,
+    RankingWatermarkRepository,
+    ResumeRepository,
+)
 
 
 @dataclass
 class RankingWorkflow:
-    """Orchestrates the end-to-end retrieval and hybrid ranking pipeline."""
+    """Orchestrates the end-to-end retrieval and hybrid ranking pipeline.
+
+    Attributes:
+        session: Database session used for retrieval and persistence.
+        budget_factory: Builds the spend limits of one job's ranking; called
+            once per job, so every job of ``run_many``/``run_all`` gets its own
+            budget and wall-clock. Defaults to the ``ranking_budget_*``
+            settings (no limits when unset).
+        budget_reports: Budget outcome of each job ranked under a budget,
+            keyed by job id: spend, ``exhausted_by`` and skipped calls per
+            stage (e.g. ``{"rerank": 3}``).
+    """
 
     session: Session
+    budget_factory: Callable[[], RunBudget | None] = RunBudget.from_settings
+    budget_reports: dict[int, dict] = field(default_factory=dict)
 
     def run(self, job_id: int, top_k: int = 5, generate_prep_packs: int = 3) -> list:
         """Runs the pipeline for a specific job posting."""
@@ -25,59 +52,208 @@ class RankingWorkflow:
         if not job:
             raise ValueError(f"Job posting with ID {job_id} not found.")
 
-        requirements = JobRequirements.model_validate(job.requirements_json)
-
         # 2. Vector Retrieval
-        retrieval_service = RetrievalService(session=self.session)
-        top_candidates = retrieval_service.top_k(job.description, k=top_k * 2)
+        top_candidates = self._retrieval_service().top_k(
+            job.description, k=top_k * 2, lexical_query=_lexical_query(job)
+        )
+
+        return self._rank_job(job, top_candidates, top_k, generate_prep_packs)
+
+    def run_many(
+        self, job_ids: list[int], top_k: int = 5, generate_prep_packs: int = 3
+    ) -> dict[int, list]:
+        """Runs the pipeline for several job postings with one batched retrieval pass.
+
+        Job descriptions are embedded in one batch and searched in one SQL
+        round-trip through ``RetrievalService.top_k_many``; ranking and
+        persistence then proceed per job exactly as in ``run``.
+
+        Args:
+            job_ids (list[int]): Job posting identifiers to rank.
+            top_k (int): Number of top candidates to keep per job.
+            generate_prep_packs (int): Number of top ranks that receive prep packs.
+
+        Returns:
+            dict[int, list]: Ranked candidates keyed by job id, in ``job_ids`` order.
+        """
+        if not job_ids:
+            return {}
+        jobs_by_id = {
+            job.id: job
+            for job in self.session.scalars(
+                select(models.JobPosting).where(models.JobPosting.id.in_(job_ids))
+            ).all()
+        }
+        missing = [job_id for job_id in job_ids if job_id not in jobs_by_id]
+        if missing:
+            raise ValueError(f"Job posting(s) with ID {missing} not found.")
+
+        jobs = [jobs_by_id[job_id] for job_id in dict.fromkeys(job_ids)]
+        retrieved = self._retrieval_service().top_k_many(
+            [job.description for job in jobs],
+            k=top_k * 2,
+            lexical_queries=[_lexical_query(job) for job in jobs],
+        )
+        return {
+            job.id: self._rank_job(job, top_candidates, top_k, generate_prep_packs)
+            for job, top_candidates in zip(jobs, retrieved)
+        }
+
+    def run_all(
+        self, top_k: int = 5, generate_prep_packs: int = 3, incremental: bool = False
+    ) -> dict[int, list]:
+        """Ranks every job posting in one batched run.
+
+        Job postings carry no open/closed status, so every stored posting is
+        treated as open. With ``incremental`` each job goes through
+        ``run_incremental`` instead of the batched full pass.
+        """
+        job_ids = list(
+            self.session.scalars(select(models.JobPosting.id).order_by(models.JobPosting.id))
+        )
+        if incremental:
+            return {
+                job_id: self.run_incremental(
+                    job_id, top_k=top_k, generate_prep_packs=generate_prep_packs
+                )
+                for job_id in job_ids
+            }
+        return self.run_many(job_ids, top_k=top_k, generate_prep_packs=generate_prep_packs)
+
+    def run_incremental(self, job_id: int, top_k: int = 5, generate_prep_packs: int = 3) -> list:
+        """Re-ranks one job, scoring only candidates whose resumes changed since the last run.
+
+        The job's ``ranking_watermarks`` row records the hash of the job text
+        and requirements, ``top_k`` and the newest resume ``(created_at, id)``
+        covered by the previous run. Only candidates with a resume past that
+        watermark are scored (retrieval restricted to them, deterministic
+        scoring, LLM rerank) and merged into the job's stored matches, along
+        with candidates whose stored match cannot be reused (e.g. written by
+        reverse matching); every merged match is persisted with its new rank.
+
+        A full ``run`` is done instead when there is no watermark, the job
+        text, requirements or ``top_k`` changed, the job holds fewer than
+        ``top_k`` reusable (ranked) matches, the previous run's budget skipped
+        reranks (candidates it left unranked may have no stored match), or
+        retrieval runs in ``hybrid`` mode (fusion scores are not comparable
+        with the per-candidate exact scores).
+
+        Args:
+            job_id (int): Job posting identifier.
+            top_k (int): Number of top candidates to keep.
+            generate_prep_packs (int): Number of top ranks that receive prep packs.
+
+        Returns:
+            list: Merged top ``top_k`` ranked candidates.
+        """
+        job = self.session.get(models.JobPosting, job_id)
+        if not job:
+            raise ValueError(f"Job posting with ID {job_id} not found.")
+
+        requirements_hash = _requirements_hash(job)
+        resume_repo = ResumeRepository(self.session)
+        match_repo = MatchRepository(self.session)
+        watermark_repo = RankingWatermarkRepository(self.session)
+        # Taken before ranking, so resumes ingested mid-run are picked up next time.
+        resume_watermark = resume_repo.get_resume_watermark()
+        watermark = watermark_repo.get(job_id)
+        existing_matches = match_repo.get_by_job(job_id)
+
+        settings = get_settings()
+        full_run = (
+            watermark is None
+            or watermark.requirements_hash != requirements_hash
+            or watermark.top_k != top_k
+            or sum(_ranked_from_match(m) is not None for m in existing_matches.values()) < top_k
+            or any(_rerank_skipped(m) for m in existing_matches.values())
+            or (
+                settings.retrieval_backend == "pgvector"
+                and settings.retrieval_query_mode == "hybrid"
+            )
+        )
+        if full_run:
+            ranked = self.run(job_id, top_k=top_k, generate_prep_packs=generate_prep_packs)
+        else:
+            previous = (
+                (watermark.resume_created_at, watermark.resume_id)
+                if watermark.resume_created_at is not None and watermark.resume_id is not None
+                else None
+            )
+            changed_ids = (
+                resume_repo.get_candidate_ids_with_resumes_between(previous, resume_watermark)
+                if resume_watermark is not None and resume_watermark != previous
+                else []
+            )
+            # Stored matches that cannot be reused are scored again in full.
+            changed_ids += [
+                candidate_id
+                for candidate_id, match in existing_matches.items()
+                if candidate_id not in changed_ids and _ranked_from_match(match) is None
+            ]
+            ranked = self._merge_changed_candidates(
+                job, changed_ids, existing_matches, top_k, generate_prep_packs
+            )
+
+        watermark_repo.upsert(
+            job_id=job_id,
+            requirements_hash=requirements_hash,
+            top_k=top_k,
+            resume_watermark=resume_watermark,
+        )
+        return ranked
+
+    def _retrieval_service(self) -> RetrievalService:
+        """Builds the retrieval service bound to this workflow's session."""
+        query_cache = (
+            QueryEmbeddingCache(self.session)
+            if get_settings().retrieval_query_cache_enabled
+            else None
+        )
+        return RetrievalService(session=self.session, query_cache=query_cache)
+
+    def _rank_job(
+        self,
+        job: models.JobPosting,
+        top_candidates: list[tuple[int, float]],
+        top_k: int,
+        generate_prep_packs: int,
+    ) -> list:
+        """Scores, reranks and persists retrieved candidates for one job posting."""
+        job_id = job.id
+        requirements = JobRequirements.model_validate(job.requirements_json)
 
         # 3. Load structured signals and prepare inputs
         resume_repo = ResumeRepository(self.session)
         match_repo = MatchRepository(self.session)
-        
+        candidate_ids = [candidate_id for candidate_id, _ in top_candidates]
+        retrieval_scores = dict(top_candidates)
+        existing_matches = match_repo.get_by_job_and_candidates(job_id, candidate_ids)
+        latest_resumes = resume_repo.get_latest_resumes_by_candidate_ids(candidate_ids)
+
         rank_inputs: list[RankInput] = []
         input_map: dict[int, RankInput] = {}
         existing_ranked: list[RankedCandidate] = []
-        
+
         for candidate_id, score in top_candidates:
-            existing = match_repo.get_by_job_and_candidate(job_id=job_id, candidate_id=candidate_id)
-            
-            if existing and existing.reasons_json and existing.final_score is not None:
-                try:
-                    reasons = existing.reasons_json
-                    bd = reasons.get("breakdown", {})
-                    exp = reasons.get("explanation")
-                    
-                    scores = ScoreBreakdown(**bd) if bd else ScoreBreakdown(
-                        deterministic_score=existing.final_score,
-                        final_score=existing.final_score,
-                        matched_hard_skills=[],
-                        missing_hard_skills=[]
-                    )
-                    explanation = RankExplanation(**exp) if exp else None
-                    
-                    existing_ranked.append(RankedCandidate(
+            existing = existing_matches.get(candidate_id)
+            existing_candidate = _ranked_from_match(existing) if existing else None
+
+            if existing_candidate is not None:
+                existing_ranked.append(existing_candidate)
+
+                # Store in input_map for potential prep pack generation
+                latest_resume = latest_resumes.get(candidate_id)
+                if latest_resume and latest_resume.signals_json:
+                    signals = CandidateSignals.model_validate(latest_resume.signals_json)
+                    input_map[candidate_id] = RankInput(
                         candidate_id=candidate_id,
-                        rank=reasons.get("rank", 0),
-                        scores=scores,
-                        explanation=explanation
-                    ))
-                    
-                    # Store in input_map for potential prep pack generation
-                    latest_resume = resume_repo.get_latest_resume_by_candidate_id(candidate_id)
-                    if latest_resume and latest_resume.signals_json:
-                        signals = CandidateSignals.model_validate(latest_resume.signals_json)
-                        input_map[candidate_id] = RankInput(
-                            candidate_id=candidate_id,
-                            retrieval_score=score,
-                            requirements=requirements,
-                            signals=signals,
-                        )
-                    continue
-                except Exception:
-                    pass
-
-            latest_resume = resume_repo.get_latest_resume_by_candidate_id(candidate_id)
+                        retrieval_score=score,
+                        requirements=requirements,
+                        signals=signals,
+                    )
+                continue
+
+            latest_resume = latest_resumes.get(candidate_id)
             if not latest_resume or not latest_resume.signals_json:
                 continue
 
@@ -92,8 +268,12 @@ class RankingWorkflow:
             input_map[candidate_id] = rank_input
 
         # 4. Hybrid Ranking
-        ranking_service = RankingService()
-        new_ranked = ranking_service.rank_candidates(rank_inputs, top_k=top_k) if rank_inputs else []
+        ranking_service = self._ranking_service()
+        new_ranked = (
+            ranking_service.rank_candidates(rank_inputs, top_k=top_k, with_prep_packs=False)
+            if rank_inputs
+            else []
+        )
 
         all_ranked = existing_ranked + new_ranked
         all_ranked.sort(key=lambda x: x.scores.final_score, reverse=True)
@@ -103,43 +283,246 @@ class RankingWorkflow:
 
         ranked = all_ranked[:top_k]
 
-        # 5. Persist Results
-        for r in ranked:
-            prep_pack_json = None
-            existing = match_repo.get_by_job_and_candidate(job_id=job_id, candidate_id=r.candidate_id)
-            
-            if r.rank <= generate_prep_packs and r.explanation:
-                if existing and existing.interview_pack_json:
-                    prep_pack_json = existing.interview_pack_json
-                else:
-                    pack = ranking_service.generate_interview_pack(input_map[r.candidate_id], r.explanation)
-                    if pack:
-                        prep_pack_json = pack.model_dump()
-
-            if existing:
-                existing.retrieval_score = next((s for cid, s in top_candidates if cid == r.candidate_id), existing.retrieval_score)
-                existing.rerank_score = r.scores.llm_adjustment
-                existing.final_score = r.scores.final_score
-                existing.reasons_json = {
-                    "rank": r.rank,
-                    "explanation": r.explanation.model_dump() if r.explanation else None,
-                    "breakdown": r.scores.model_dump(),
-                }
-                if prep_pack_json:
-                    existing.interview_pack_json = prep_pack_json
-            else:
-                match_repo.create(
-                    job_id=job_id,
-                    candidate_id=r.candidate_id,
-                    retrieval_score=next((s for cid, s in top_candidates if cid == r.candidate_id), None),
-                    rerank_score=r.scores.llm_adjustment,
-                    final_score=r.scores.final_score,
-                    reasons_json={
+        # 5-6. Deferred prep packs and persistence
+        self._finalize(
+            job_id,
+            ranked,
+            ranking_service=ranking_service,
+            input_map=input_map,
+            existing_matches=existing_matches,
+            retrieval_scores=retrieval_scores,
+            generate_prep_packs=generate_prep_packs,
+        )
+        return ranked
+
+    def _merge_changed_candidates(
+        self,
+        job: models.JobPosting,
+        changed_ids: list[int],
+        existing_matches: dict[int, models.Match],
+        top_k: int,
+        generate_prep_packs: int,
+    ) -> list:
+        """Scores ``changed_ids`` and merges them into the job's stored matches."""
+        job_id = job.id
+        requirements = JobRequirements.model_validate(job.requirements_json)
+        changed = set(changed_ids)
+
+        stored_ranked = [
+            candidate
+            for candidate_id, match in existing_matches.items()
+            if candidate_id not in changed
+            and (candidate := _ranked_from_match(match)) is not None
+        ]
+
+        retrieval_scores = (
+            dict(self._retrieval_service().score_candidates(job.description, changed_ids))
+            if changed_ids
+            else {}
+        )
+        latest_resumes = ResumeRepository(self.session).get_latest_resumes_by_candidate_ids(
+            changed_ids
+        )
+        rank_inputs = [
+            RankInput(
+                candidate_id=candidate_id,
+                retrieval_score=retrieval_scores[candidate_id],
+                requirements=requirements,
+                signals=CandidateSignals.model_validate(resume.signals_json),
+            )
+            for candidate_id in changed_ids
+            if candidate_id in retrieval_scores
+            and (resume := latest_resumes.get(candidate_id)) is not None
+            and resume.signals_json
+        ]
+
+        ranking_service = self._ranking_service()
+        new_ranked = (
+            ranking_service.rank_candidates(rank_inputs, top_k=top_k, with_prep_packs=False)
+            if rank_inputs
+            else []
+        )
+
+        merged = stored_ranked + new_ranked
+        merged.sort(key=lambda x: x.scores.final_score, reverse=True)
+        for i, candidate in enumerate(merged, 1):
+            candidate.rank = i
+        ranked = merged[:top_k]
+
+        # Prep packs need signals for stored candidates that reached the top too.
+        input_map = {inp.candidate_id: inp for inp in rank_inputs}
+        pack_ids = [
+            r.candidate_id
+            for r in ranked
+            if r.rank <= generate_prep_packs and r.candidate_id not in input_map
+        ]
+        for candidate_id, resume in (
+            ResumeRepository(self.session).get_latest_resumes_by_candidate_ids(pack_ids).items()
+        ):
+            if resume.signals_json:
+                input_map[candidate_id] = RankInput(
+                    candidate_id=candidate_id,
+                    retrieval_score=existing_matches[candidate_id].retrieval_score or 0.0,
+                    requirements=requirements,
+                    signals=CandidateSignals.model_validate(resume.signals_json),
+                )
+
+        # Candidates that fell out of the top are persisted too: re-scored ones
+        # so their stale scores cannot resurface in a later merge, stored ones
+        # so their rank is renumbered. Packs stored for re-scored candidates
+        # describe an older resume and do not block a fresh one.
+        self._finalize(
+            job_id,
+            ranked,
+            ranking_service=ranking_service,
+            input_map=input_map,
+            existing_matches={
+                candidate_id: match
+                for candidate_id, match in existing_matches.items()
+                if candidate_id not in changed
+            },
+            retrieval_scores=retrieval_scores,
+            generate_prep_packs=generate_prep_packs,
+            extra=merged[top_k:],
+        )
+        for candidate_id in changed & existing_matches.keys():
+            self.session.expire(existing_matches[candidate_id])
+        return ranked
+
+    def _ranking_service(self) -> RankingService:
+        """Builds the ranking service bound to this workflow's session."""
+        return RankingService(
+            cache=build_rerank_cache(self.session),
+            skill_matcher=build_skill_matcher(self.session),
+            budget=self.budget_factory(),
+        )
+
+    def _finalize(
+        self,
+        job_id: int,
+        ranked: list[RankedCandidate],
+        *,
+        ranking_service: RankingService,
+        input_map: dict[int, RankInput],
+        existing_matches: dict[int, models.Match],
+        retrieval_scores: dict[int, float],
+        generate_prep_packs: int,
+        extra: list[RankedCandidate] | None = None,
+    ) -> None:
+        """Generates deferred prep packs for the final top ranks and persists the results."""
+        # Deferred prep packs: only final persisted top ranks, at most once per run
+        pack_targets = [
+            r
+            for r in ranked
+            if r.rank <= generate_prep_packs
+            and r.explanation
+            and r.interview_pack is None
+            and r.candidate_id in input_map
+            and not (
+                r.candidate_id in existing_matches
+                and existing_matches[r.candidate_id].interview_pack_json
+            )
+        ]
+        packs = ranking_service.generate_interview_packs(
+            [(input_map[r.candidate_id], r.explanation) for r in pack_targets]
+        )
+        for r, pack in zip(pack_targets, packs):
+            r.interview_pack = pack
+
+        # Persist Results in one upsert; a missing pack keeps the stored one
+        budget = ranking_service.budget
+        if budget is not None:
+            self.budget_reports[job_id] = budget.summary()
+        MatchRepository(self.session).upsert_many(
+            job_id,
+            [
+                {
+                    "candidate_id": r.candidate_id,
+                    "retrieval_score": retrieval_scores.get(r.candidate_id),
+                    "rerank_score": r.scores.llm_adjustment,
+                    "final_score": r.scores.final_score,
+                    "reasons_json": {
                         "rank": r.rank,
                         "explanation": r.explanation.model_dump() if r.explanation else None,
                         "breakdown": r.scores.model_dump(),
+                        **({"budget": budget.reasons(r.candidate_id)} if budget else {}),
                     },
-                    interview_pack_json=prep_pack_json,
-                )
+                    "interview_pack_json": (
+                        r.interview_pack.model_dump()
+                        if r.rank <= generate_prep_packs and r.explanation and r.interview_pack
+                        else None
+                    ),
+                }
+                for r in [*ranked, *(extra or [])]
+            ],
+        )
+        for existing in existing_matches.values():
+            self.session.expire(existing)
 
-        return ranked
+
+def _ranked_from_match(match: models.Match) -> RankedCandidate | None:
+    """Rebuilds a ranked candidate from a stored match, or ``None`` if it cannot be reused.
+
+    Deterministic-only rows written by reverse matching at ingest time, or
+    by a run whose budget skipped their rerank, are never reused, so later
+    runs score and rerank those candidates in full.
+    """
+    if not match.reasons_json or match.final_score is None:
+        return None
+    if match.reasons_json.get("source") == REVERSE_MATCH_SOURCE:
+        return None
+    if _rerank_skipped(match):
+        return None
+    try:
+        reasons = match.reasons_json
+        bd = reasons.get("breakdown", {})
+        exp = reasons.get("explanation")
+
+        scores = ScoreBreakdown(**bd) if bd else ScoreBreakdown(
+            deterministic_score=match.final_score,
+            final_score=match.final_score,
+            matched_hard_skills=[],
+            missing_hard_skills=[]
+        )
+        explanation = RankExplanation(**exp) if exp else None
+    except Exception:
+        return None
+    return RankedCandidate(
+        candidate_id=match.candidate_id,
+        rank=reasons.get("rank", 0),
+        scores=scores,
+        explanation=explanation,
+    )
+
+
+def _rerank_skipped(match: models.Match) -> bool:
+    """Returns whether the run that stored ``match`` skipped its rerank for budget."""
+    budget = (match.reasons_json or {}).get("budget") or {}
+    return "rerank" in budget.get("skipped", [])
+
+
+def _requirements_hash(job: models.JobPosting) -> str:
+    """Returns a SHA-256 hex digest of the job text and requirements a ranking ran against."""
+    payload = json.dumps(
+        {"description": job.description, "requirements": job.requirements_json},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _lexical_query(job: models.JobPosting) -> str | None:
+    """Returns the job's leading hard skills as full-text terms for hybrid retrieval.
+
+    Only the first ``retrieval_hybrid_max_terms`` distinct skills are kept, in the
+    order extraction listed them; every term is OR-ed into the lexical leg, so a
+    long skill list would match most resumes.
+    """
+    hard_skills = (job.requirements_json or {}).get("hard_skills") or []
+    terms: dict[str, str] = {}
+    for skill in hard_skills:
+        term = str(skill).strip() if skill else ""
+        if term:
+            terms.setdefault(term.casefold(), term)
+    limit = max(0, get_settings().retrieval_hybrid_max_terms)
+    return " ".join(list(terms.values())[:limit]) or None
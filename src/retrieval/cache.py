@@ -0,0 +1,72 @@
+"""Persistent cache for job/query embeddings used by retrieval."""
+
+import hashlib
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.metrics import CacheStats
+from src.storage import models
+from src.storage.repositories import QueryEmbeddingRepository
+
+# Process-wide counters so hit rates survive across per-request service instances.
+QUERY_EMBEDDING_CACHE_STATS = CacheStats()
+
+
+def query_text_hash(text: str) -> str:
+    """Returns the SHA-256 hex digest used as the cache key for query text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class QueryEmbeddingCache:
+    """Looks up and stores query vectors keyed by (text hash, model, dimensions)."""
+
+    session: Session
+    stats: CacheStats = field(default_factory=lambda: QUERY_EMBEDDING_CACHE_STATS)
+
+    def get(self, *, text: str, model: str) -> list[float] | None:
+        """Returns the cached vector for ``text`` in ``model``'s embedding space.
+
+        When the model is already registered in ``embedding_models`` only vectors
+        with the registered dimension count are considered, so a model that was
+        re-configured to a different size never serves stale vectors.
+
+        Args:
+            text (str): Query or job-description text.
+            model (str): Provider/model identifier the vector must belong to.
+
+        Returns:
+            list[float] | None: Cached vector, or ``None`` on a miss.
+        """
+        dimensions = self.session.scalar(
+            select(models.EmbeddingModel.dimensions).where(models.EmbeddingModel.model == model)
+        )
+        row = QueryEmbeddingRepository(self.session).get(
+            text_hash=query_text_hash(text),
+            model=model,
+            dimensions=int(dimensions) if dimensions is not None else None,
+        )
+        if row is None:
+            self.stats.record_miss()
+            return None
+        self.stats.record_hit()
+        return [float(value) for value in row.vector]
+
+    def put(self, *, text: str, model: str, vector: list[float]) -> None:
+        """Stores ``vector`` for ``text`` in ``model``'s embedding space.
+
+        Args:
+            text (str): Query or job-description text.
+            model (str): Provider/model identifier the vector belongs to.
+            vector (list[float]): Embedding vector payload.
+        """
+        QueryEmbeddingRepository(self.session).put(
+            text_hash=query_text_hash(text), model=model, vector=vector
+        )
+
+
+def query_embedding_cache_stats() -> dict[str, float | int]:
+    """Returns process-wide query embedding cache counters."""
+    return QUERY_EMBEDDING_CACHE_STATS.snapshot()
@@ -0,0 +1,452 @@
+"""In-process exact vector search over section embeddings held in NumPy arrays."""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.storage import models
+
+SNAPSHOT_FORMAT_VERSION = 2
+
+_INDEX_CACHE: dict[tuple[str, int], "NumpyVectorIndex"] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+@dataclass
+class NumpyVectorIndex:
+    """Contiguous float32 matrix of pre-normalized section vectors for one model space.
+
+    Rows are kept sorted by candidate so per-candidate scores reduce with
+    ``reduceat`` over contiguous row groups.
+
+    Attributes:
+        model: Provider/model identifier of the embedding space.
+        dimensions: Vector dimension of the embedding space.
+        matrix: ``(n_sections, dimensions)`` float32 matrix of unit-length rows.
+        section_ids: Section id per matrix row.
+        candidate_ids: Candidate id per matrix row, non-decreasing.
+        section_types: ``section_type`` per matrix row, used for section
+            weights and type filters; ``None`` scores every row with weight 1.
+        version: ``space_version`` of the embedding space when the rows were
+            read; a cached index is reloaded once the stored version moves on.
+    """
+
+    model: str
+    dimensions: int
+    matrix: np.ndarray
+    section_ids: np.ndarray
+    candidate_ids: np.ndarray
+    section_types: np.ndarray | None = None
+    version: tuple[int, int] | None = None
+    _group_starts: np.ndarray = field(init=False, repr=False)
+    _group_candidates: np.ndarray = field(init=False, repr=False)
+    _row_groups: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validates array shapes and precomputes candidate row groups."""
+        if self.matrix.ndim != 2 or self.matrix.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Expected a (n, {self.dimensions}) matrix, got shape {self.matrix.shape}"
+            )
+        if not (len(self.section_ids) == len(self.candidate_ids) == self.matrix.shape[0]):
+            raise ValueError("section_ids and candidate_ids must have one entry per matrix row")
+        if self.section_types is not None and len(self.section_types) != self.matrix.shape[0]:
+            raise ValueError("section_types must have one entry per matrix row")
+        if len(self.candidate_ids) and np.any(np.diff(self.candidate_ids) < 0):
+            raise ValueError("Rows must be sorted by candidate id; use NumpyVectorIndex.build")
+        if len(self.candidate_ids):
+            boundaries = np.flatnonzero(np.diff(self.candidate_ids)) + 1
+            self._group_starts = np.concatenate(([0], boundaries)).astype(np.int64)
+        else:
+            self._group_starts = np.empty(0, dtype=np.int64)
+        self._group_candidates = np.asarray(self.candidate_ids)[self._group_starts]
+        group_sizes = np.diff(np.append(self._group_starts, len(self.candidate_ids)))
+        self._row_groups = np.repeat(np.arange(len(self._group_starts)), group_sizes)
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        model: str,
+        dimensions: int,
+        vectors: np.ndarray,
+        section_ids: np.ndarray,
+        candidate_ids: np.ndarray,
+        section_types: np.ndarray | None = None,
+        version: tuple[int, int] | None = None,
+    ) -> "NumpyVectorIndex":
+        """Normalizes raw vectors, sorts rows by candidate and returns an index.
+
+        Args:
+            model (str): Provider/model identifier of the embedding space.
+            dimensions (int): Vector dimension of the embedding space.
+            vectors (np.ndarray): Raw ``(n, dimensions)`` section vectors.
+            section_ids (np.ndarray): Section id per vector.
+            candidate_ids (np.ndarray): Candidate id per vector.
+            section_types (np.ndarray | None): Section type per vector.
+            version (tuple[int, int] | None): ``space_version`` the vectors were read at.
+
+        Returns:
+            NumpyVectorIndex: Search-ready index.
+        """
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, dimensions)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        candidate_ids = np.asarray(candidate_ids, dtype=np.int64)
+        order = np.argsort(candidate_ids, kind="stable")
+        return cls(
+            model=model,
+            dimensions=dimensions,
+            matrix=np.ascontiguousarray(matrix[order]),
+            section_ids=np.asarray(section_ids, dtype=np.int64)[order],
+            candidate_ids=candidate_ids[order],
+            section_types=(
+                np.asarray(section_types, dtype=str)[order] if section_types is not None else None
+            ),
+            version=version,
+        )
+
+    @classmethod
+    def from_session(cls, session: Session, *, model: str, dimensions: int) -> "NumpyVectorIndex":
+        """Loads every section vector of one model+dimension space from the database.
+
+        The space's ``space_version`` is read first, so rows written while
+        loading make the index look stale rather than current.
+
+        Args:
+            session (Session): Database session used for the bulk read.
+            model (str): Provider/model identifier of the embedding space.
+            dimensions (int): Vector dimension of the embedding space.
+
+        Returns:
+            NumpyVectorIndex: Search-ready index.
+        """
+        version = space_version(session, model=model, dimensions=dimensions)
+        rows = session.execute(
+            select(
+                models.Embedding.owner_id,
+                models.Resume.candidate_id,
+                models.ResumeSection.section_type,
+                models.Embedding.vector,
+            )
+            .join(models.ResumeSection, models.ResumeSection.id == models.Embedding.owner_id)
+            .join(models.Resume, models.Resume.id == models.ResumeSection.resume_id)
+            .where(models.Embedding.model == model)
+            .where(models.Embedding.dimensions == dimensions)
+        ).all()
+
+        vectors = np.empty((len(rows), dimensions), dtype=np.float32)
+        section_ids = np.empty(len(rows), dtype=np.int64)
+        candidate_ids = np.empty(len(rows), dtype=np.int64)
+        section_types: list[str] = []
+        for i, (section_id, candidate_id, section_type, vector) in enumerate(rows):
+            vectors[i] = vector
+            section_ids[i] = section_id
+            candidate_ids[i] = candidate_id
+            section_types.append(section_type)
+        return cls.build(
+            model=model,
+            dimensions=dimensions,
+            vectors=vectors,
+            section_ids=section_ids,
+            candidate_ids=candidate_ids,
+            section_types=np.asarray(section_types, dtype=str),
+            version=version,
+        )
+
+    def save(self, directory: Path) -> None:
+        """Writes the index as ``.npy`` arrays plus a JSON manifest.
+
+        Each file is written under a temporary name and renamed into place,
+        so indexes still memory-mapping an older snapshot keep reading it.
+
+        Args:
+            directory (Path): Snapshot directory; created when missing.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "matrix": self.matrix,
+            "section_ids": self.section_ids,
+            "candidate_ids": self.candidate_ids,
+        }
+        if self.section_types is not None:
+            arrays["section_types"] = self.section_types
+        for name, array in arrays.items():
+            tmp_path = directory / f"{name}.tmp.npy"
+            np.save(tmp_path, array)
+            os.replace(tmp_path, directory / f"{name}.npy")
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "model": self.model,
+            "dimensions": self.dimensions,
+            "rows": int(self.matrix.shape[0]),
+            "version": list(self.version) if self.version is not None else None,
+        }
+        tmp_manifest = directory / "manifest.tmp.json"
+        tmp_manifest.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp_manifest, directory / "manifest.json")
+
+    @classmethod
+    def load(cls, directory: Path, *, mmap: bool = True) -> "NumpyVectorIndex":
+        """Loads a snapshot written by ``save``, memory-mapping the matrix by default.
+
+        Args:
+            directory (Path): Snapshot directory.
+            mmap (bool): When true the matrix is memory-mapped read-only.
+
+        Returns:
+            NumpyVectorIndex: Search-ready index.
+
+        Raises:
+            FileNotFoundError: If the snapshot manifest does not exist.
+            ValueError: If the snapshot was written by an unsupported format version.
+        """
+        manifest_path = directory / "manifest.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Vector snapshot not found: {directory}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported vector snapshot format: {manifest.get('format_version')}"
+            )
+        section_types_path = directory / "section_types.npy"
+        version = manifest.get("version")
+        return cls(
+            model=str(manifest["model"]),
+            dimensions=int(manifest["dimensions"]),
+            matrix=np.load(directory / "matrix.npy", mmap_mode="r" if mmap else None),
+            section_ids=np.load(directory / "section_ids.npy"),
+            candidate_ids=np.load(directory / "candidate_ids.npy"),
+            section_types=np.load(section_types_path) if section_types_path.exists() else None,
+            version=(int(version[0]), int(version[1])) if version else None,
+        )
+
+    def top_k(self, query_vector: list[float], k: int, **scoring) -> list[tuple[int, float]]:
+        """Returns the ``k`` best candidates by pooled cosine similarity over their sections.
+
+        Args:
+            query_vector (list[float]): Query embedding in this model space.
+            k (int): Maximum number of candidates to return.
+            **scoring: Section weighting and pooling options of ``top_k_many``.
+
+        Returns:
+            list[tuple[int, float]]: Ordered list of (candidate_id, score).
+        """
+        return self.top_k_many([query_vector], k, **scoring)[0]
+
+    def top_k_many(
+        self,
+        query_vectors: list[list[float]],
+        k: int,
+        *,
+        aggregation: str = "max",
+        section_weights: dict[str, float] | None = None,
+        section_types: list[str] | None = None,
+        top_n: int = 3,
+        temperature: float = 0.1,
+    ) -> list[list[tuple[int, float]]]:
+        """Scores many queries with one matrix product and returns top candidates per query.
+
+        Section similarities are weighted and pooled per candidate like the
+        SQL of the ``pgvector`` backend: ``max`` keeps the best weighted
+        section, ``weighted_mean`` averages the ``top_n`` best by weight and
+        ``softmax`` pools every section at ``temperature``. Candidates without
+        a section of the requested ``section_types`` are left out.
+
+        Args:
+            query_vectors (list[list[float]]): Query embeddings in this model space.
+            k (int): Maximum number of candidates to return per query.
+            aggregation (str): ``max``, ``weighted_mean`` or ``softmax``.
+            section_weights (dict[str, float] | None): Per-``section_type``
+                multipliers; other sections count with ``1.0``.
+            section_types (list[str] | None): When non-empty, only these section
+                types are scored.
+            top_n (int): Section count used by ``weighted_mean``.
+            temperature (float): Softmax temperature used by ``softmax``.
+
+        Returns:
+            list[list[tuple[int, float]]]: Per-query ordered (candidate_id, score) lists.
+        """
+        if not query_vectors:
+            return []
+        if k <= 0 or self.matrix.shape[0] == 0:
+            return [[] for _ in query_vectors]
+
+        queries = np.asarray(query_vectors, dtype=np.float32).reshape(-1, self.dimensions)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        queries = queries / norms
+
+        section_scores = self.matrix @ queries.T
+        weights, included = self._row_weights(section_weights, section_types)
+        if aggregation == "max" and weights is None and included is None:
+            candidate_scores = np.maximum.reduceat(section_scores, self._group_starts, axis=0)
+            present = np.arange(len(self._group_starts))
+        else:
+            n_rows = self.matrix.shape[0]
+            weights = weights if weights is not None else np.ones(n_rows, dtype=np.float32)
+            included = included if included is not None else np.ones(n_rows, dtype=bool)
+            candidate_scores = self._pool(
+                section_scores * weights[:, None],
+                weights,
+                included,
+                aggregation=aggregation,
+                top_n=top_n,
+                temperature=temperature,
+            )
+            present = np.flatnonzero(np.logical_or.reduceat(included, self._group_starts))
+            candidate_scores = candidate_scores[present]
+
+        n_candidates = candidate_scores.shape[0]
+        keep = min(k, n_candidates)
+        if keep == 0:
+            return [[] for _ in query_vectors]
+        group_candidates = self._group_candidates[present]
+        results: list[list[tuple[int, float]]] = []
+        for column in candidate_scores.T:
+            if keep < n_candidates:
+                top = np.argpartition(-column, keep - 1)[:keep]
+            else:
+                top = np.arange(n_candidates)
+            top = top[np.lexsort((group_candidates[top], -column[top]))]
+            results.append([(int(group_candidates[i]), float(column[i])) for i in top])
+        return results
+
+    def _row_weights(
+        self, section_weights: dict[str, float] | None, section_types: list[str] | None
+    ) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """Returns per-row weights and the row filter; ``None`` when they are no-ops."""
+        if not section_weights and not section_types:
+            return None, None
+        if self.section_types is None:
+            raise ValueError(
+                "Section weights and types need an index with section types; rebuild the snapshot"
+            )
+        weights = None
+        if section_weights:
+            weights = np.ones(len(self.section_types), dtype=np.float32)
+            for section_type, weight in section_weights.items():
+                weights[self.section_types == section_type] = weight
+        included = np.isin(self.section_types, list(section_types)) if section_types else None
+        return weights, included
+
+    def _pool(
+        self,
+        weighted: np.ndarray,
+        weights: np.ndarray,
+        included: np.ndarray,
+        *,
+        aggregation: str,
+        top_n: int,
+        temperature: float,
+    ) -> np.ndarray:
+        """Pools weighted ``(n_rows, n_queries)`` similarities into per-candidate scores."""
+        starts = self._group_starts
+        masked = np.where(included[:, None], weighted, -np.inf)
+        if aggregation == "max":
+            return np.maximum.reduceat(masked, starts, axis=0)
+        if aggregation == "softmax":
+            temperature = max(float(temperature), 1e-6)
+            best = np.maximum.reduceat(masked, starts, axis=0)[self._row_groups]
+            with np.errstate(invalid="ignore", over="ignore"):
+                exp = np.where(included[:, None], np.exp((weighted - best) / temperature), 0.0)
+            numerator = np.add.reduceat(weighted * exp, starts, axis=0)
+            denominator = np.add.reduceat(exp, starts, axis=0)
+            return numerator / np.where(denominator == 0, 1.0, denominator)
+        if aggregation == "weighted_mean":
+            positions = np.arange(len(weighted))
+            pooled = np.empty((len(starts), weighted.shape[1]), dtype=np.float64)
+            for column in range(weighted.shape[1]):
+                # Best sections first within each candidate's contiguous rows.
+                order = np.lexsort((-masked[:, column], self._row_groups))
+                keep = np.zeros(len(weighted), dtype=bool)
+                keep[order] = positions - starts[self._row_groups] < max(int(top_n), 1)
+                keep &= included
+                numerator = np.add.reduceat(np.where(keep, weighted[:, column], 0.0), starts)
+                denominator = np.add.reduceat(np.where(keep, weights, 0.0), starts)
+                pooled[:, column] = np.where(
+                    denominator == 0, 0.0, numerator / np.where(denominator == 0, 1.0, denominator)
+                )
+            return pooled
+        raise ValueError(
+            f"Unknown retrieval aggregation '{aggregation}'. "
+            "Expected 'max', 'weighted_mean' or 'softmax'."
+        )
+
+
+def snapshot_directory(root: Path, *, model: str, dimensions: int) -> Path:
+    """Returns the snapshot directory for one model+dimension space under ``root``."""
+    digest = hashlib.sha1(model.encode("utf-8")).hexdigest()[:8]
+    return root / f"vectors_{dimensions}_{digest}"
+
+
+def space_version(session: Session, *, model: str, dimensions: int) -> tuple[int, int]:
+    """Returns a cheap change marker of one embedding space: ``(row count, max id)``.
+
+    Inserting or deleting section embeddings changes it, so a cached index or
+    snapshot built at an older version is known to be stale.
+    """
+    count, max_id = session.execute(
+        select(func.count(), func.max(models.Embedding.id))
+        .where(models.Embedding.model == model)
+        .where(models.Embedding.dimensions == dimensions)
+    ).one()
+    return int(count or 0), int(max_id or 0)
+
+
+def get_numpy_index(
+    session: Session,
+    *,
+    model: str,
+    dimensions: int,
+    snapshot_dir: Path | None = None,
+) -> NumpyVectorIndex:
+    """Returns the process-wide index for one embedding space, reloading it when stale.
+
+    Every lookup reads the space's ``space_version``; the cached index is
+    reused while it matches. Otherwise a memory-mapped snapshot under
+    ``snapshot_dir`` is used when it was written at that version, and the
+    vectors are read from the database (and the snapshot rewritten when a
+    directory is configured) when it was not.
+    """
+    key = (model, dimensions)
+    version = space_version(session, model=model, dimensions=dimensions)
+    with _INDEX_CACHE_LOCK:
+        index = _INDEX_CACHE.get(key)
+        if index is not None and index.version == version:
+            return index
+
+        directory = (
+            snapshot_directory(snapshot_dir, model=model, dimensions=dimensions)
+            if snapshot_dir is not None
+            else None
+        )
+        index = None
+        if directory is not None and (directory / "manifest.json").exists():
+            try:
+                snapshot = NumpyVectorIndex.load(directory)
+            except ValueError:
+                snapshot = None
+            if snapshot is not None and snapshot.version == version:
+                index = snapshot
+        if index is None:
+            index = NumpyVectorIndex.from_session(session, model=model, dimensions=dimensions)
+            if directory is not None:
+                index.save(directory)
+        _INDEX_CACHE[key] = index
+        return index
+
+
+def clear_numpy_index_cache() -> None:
+    """Drops every loaded index so the next query reloads from snapshot or database."""
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE.clear()
@@ -1,16 +1,26 @@
 """Retrieval service boundary for selecting top candidate ids."""
 
-from dataclasses import dataclass
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
 
 from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings
 from src.llm.client import LLMClient
-from src.llm.factory import build_default_llm_client
+from src.llm.factory import get_shared_llm_client, get_shared_registry
 from src.llm.registry import ModelAliasRegistry
+from src.retrieval.cache import QueryEmbeddingCache
+from src.retrieval.numpy_backend import NumpyVectorIndex, get_numpy_index
 from src.storage.db import get_session
 
+# pgvector caps hnsw.ef_search at 1000; an HNSW scan never yields more rows than this.
+HNSW_MAX_EF_SEARCH = 1000
+
 
 @dataclass
 class RetrievalService:
@@ -19,9 +29,18 @@ class RetrievalService:
     session: Session | None = None
     llm_client: LLMClient | None = None
     registry: ModelAliasRegistry | None = None
+    query_mode: str | None = None
+    query_cache: QueryEmbeddingCache | None = None
+    backend: str | None = None
+    aggregation: str | None = None
+    section_types: list[str] | None = None
 
     def top_k(
-        self, job_description: str, k: int, embedding_model_alias: str | None = None
+        self,
+        job_description: str,
+        k: int,
+        embedding_model_alias: str | None = None,
+        lexical_query: str | None = None,
     ) -> list[tuple[int, float]]:
         """Runs top k logic.
 
@@ -29,6 +48,8 @@ class RetrievalService:
             job_description (str): Job description text used for retrieval/extraction.
             k (int): Maximum number of rows/items to return.
             embedding_model_alias (str | None): Optional embedding alias override.
+            lexical_query (str | None): Terms for the full-text leg of ``hybrid``
+                mode; defaults to ``job_description``.
 
         Returns:
             list[tuple[int, float]]: Ordered list of (candidate_id, score) produced by this operation.
@@ -38,18 +59,249 @@ class RetrievalService:
 
         alias = embedding_model_alias or get_settings().embedding_model_alias
         model = self._resolve_model_for_alias(alias)
-        query_vector = self._embed_job_description(
-            job_description=job_description, embedding_model_alias=alias
+        query_vector = self._embed_query(
+            job_description=job_description, embedding_model_alias=alias, model=model
         )
         if not query_vector:
             return []
-        return self._query_top_candidates(model=model, query_vector=query_vector, k=k)
+        return self._query_top_candidates(
+            model=model,
+            query_vector=query_vector,
+            k=k,
+            lexical_query=lexical_query or job_description,
+        )
+
+    def score_candidates(
+        self,
+        job_description: str,
+        candidate_ids: list[int],
+        embedding_model_alias: str | None = None,
+    ) -> list[tuple[int, float]]:
+        """Scores only the given candidates against a job description.
+
+        Sections are scored exactly, with the same weighting and aggregation
+        as the ``exact`` query mode, so results are comparable with the
+        cosine-based modes (not with ``hybrid`` fusion scores).
+
+        Args:
+            job_description (str): Job description text used for retrieval.
+            candidate_ids (list[int]): Candidates to score.
+            embedding_model_alias (str | None): Optional embedding alias override.
+
+        Returns:
+            list[tuple[int, float]]: Ordered list of (candidate_id, score);
+                candidates without section embeddings are absent.
+        """
+        if not candidate_ids:
+            return []
+
+        alias = embedding_model_alias or get_settings().embedding_model_alias
+        model = self._resolve_model_for_alias(alias)
+        query_vector = self._embed_query(
+            job_description=job_description, embedding_model_alias=alias, model=model
+        )
+        if not query_vector:
+            return []
+        return self._query_top_candidates_exact(
+            model=model,
+            query_vector=query_vector,
+            k=len(candidate_ids),
+            candidate_ids=candidate_ids,
+        )
+
+    def top_k_many(
+        self,
+        job_descriptions: list[str],
+        k: int,
+        embedding_model_alias: str | None = None,
+        lexical_queries: list[str | None] | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """Runs top k retrieval for many job descriptions at once.
+
+        All cache misses are embedded in a single ``embed_with_meta`` batch and,
+        in ``ann`` mode, every vector search runs in one SQL round-trip via a
+        ``LATERAL`` join over the array of query vectors. Other query modes
+        fall back to one ``_query_top_candidates`` call per description.
+
+        Args:
+            job_descriptions (list[str]): Job description texts, one per query.
+            k (int): Maximum number of candidates to return per query.
+            embedding_model_alias (str | None): Optional embedding alias override.
+            lexical_queries (list[str | None] | None): Optional per-description terms
+                for the full-text leg of ``hybrid`` mode, aligned with ``job_descriptions``.
+
+        Returns:
+            list[list[tuple[int, float]]]: Per-description ordered (candidate_id, score)
+                lists, aligned with ``job_descriptions``.
+        """
+        if k <= 0 or not job_descriptions:
+            return [[] for _ in job_descriptions]
+
+        alias = embedding_model_alias or get_settings().embedding_model_alias
+        model = self._resolve_model_for_alias(alias)
+        query_vectors = self._embed_queries(
+            job_descriptions=job_descriptions, embedding_model_alias=alias, model=model
+        )
+
+        results: list[list[tuple[int, float]]] = [[] for _ in job_descriptions]
+        present = [i for i, vector in enumerate(query_vectors) if vector]
+        if not present:
+            return results
+
+        if self._backend() == "numpy":
+            dimension = len(query_vectors[present[0]])
+            index = self._numpy_index(model=model, dimensions=dimension)
+            batched = index.top_k_many(
+                [query_vectors[i] for i in present], k, **self._section_scoring().numpy_options()
+            )
+            for i, rows in zip(present, batched):
+                results[i] = rows
+            return results
+
+        mode = self.query_mode or get_settings().retrieval_query_mode
+        if mode != "ann":
+            for i in present:
+                lexical_query = lexical_queries[i] if lexical_queries is not None else None
+                results[i] = self._query_top_candidates(
+                    model=model,
+                    query_vector=query_vectors[i],
+                    k=k,
+                    lexical_query=lexical_query or job_descriptions[i],
+                )
+            return results
+
+        batched = self._query_top_candidates_ann_many(
+            model=model, query_vectors=[query_vectors[i] for i in present], k=k
+        )
+        for i, rows in zip(present, batched):
+            results[i] = rows
+        return results
+
+    def top_jobs_for_resume(
+        self, resume_id: int, *, model: str, dimensions: int, k: int
+    ) -> list[tuple[int, float]]:
+        """Finds the jobs whose description vectors best match one resume (reverse matching).
+
+        Each section embedding of the resume runs an index-matching
+        ``ORDER BY ... LIMIT`` over ``job_vectors`` in a ``LATERAL`` subquery
+        (the per-model HNSW index from ``scripts/create_embedding_hnsw_indexes.py``);
+        hits are pooled per job with an unweighted max.
+
+        Args:
+            resume_id (int): Resume whose section embeddings are the queries.
+            model (str): Provider/model identifier of the section embeddings.
+            dimensions (int): Dimension of the embedding space.
+            k (int): Maximum number of jobs to return.
+
+        Returns:
+            list[tuple[int, float]]: Ordered list of (job_id, score).
+        """
+        if k <= 0:
+            return []
+        dim = int(dimensions)
+        distance = f"(jv.vector::vector({dim})) <=> s.query_vector"
+        sql = text(
+            f"""
+            WITH s AS (
+                SELECT e.vector::vector({dim}) AS query_vector
+                FROM embeddings e
+                JOIN resume_sections rs ON rs.id = e.owner_id
+                WHERE rs.resume_id = :resume_id
+                  AND e.model = {_sql_literal(model)}
+                  AND e.dimensions = {dim}
+            )
+            SELECT hits.job_id, MAX(hits.similarity) AS score
+            FROM s
+            CROSS JOIN LATERAL (
+                SELECT jv.job_id, 1 - ({distance}) AS similarity
+                FROM job_vectors jv
+                WHERE jv.model = {_sql_literal(model)}
+                  AND jv.dimensions = {dim}
+                ORDER BY {distance}
+                LIMIT :k
+            ) hits
+            GROUP BY hits.job_id
+            ORDER BY score DESC, hits.job_id
+            LIMIT :k
+            """
+        ).bindparams(
+            bindparam("resume_id", value=resume_id),
+            bindparam("k", value=k),
+        )
+
+        with self._session_scope() as session:
+            _set_hnsw_ef_search(session, k)
+            rows = session.execute(sql).fetchall()
+            return [(int(row[0]), float(row[1])) for row in rows]
+
+    def _embed_queries(
+        self, *, job_descriptions: list[str], embedding_model_alias: str, model: str
+    ) -> list[list[float]]:
+        """Returns one query vector per description, embedding all cache misses in one batch."""
+        vectors: list[list[float]] = [[] for _ in job_descriptions]
+        missing: list[int] = []
+        for i, description in enumerate(job_descriptions):
+            cached = (
+                self.query_cache.get(text=description, model=model)
+                if self.query_cache is not None
+                else None
+            )
+            if cached:
+                vectors[i] = cached
+            else:
+                missing.append(i)
+        if not missing:
+            return vectors
+
+        unique_texts = list(dict.fromkeys(job_descriptions[i] for i in missing))
+        embedded, metadata = self._resolve_llm_client().embed_with_meta(
+            texts=unique_texts, embedding_model_alias=embedding_model_alias
+        )
+        if len(embedded) != len(unique_texts):
+            raise ValueError(
+                f"Expected {len(unique_texts)} query embeddings, got {len(embedded)}"
+            )
+        by_text = {
+            text_value: [float(value) for value in vector]
+            for text_value, vector in zip(unique_texts, embedded)
+        }
+        for i in missing:
+            vectors[i] = by_text[job_descriptions[i]]
+        selected_model = metadata.selected_model if metadata is not None else None
+        if self.query_cache is not None and _same_embedding_space(selected_model, model):
+            for text_value, vector in by_text.items():
+                if vector:
+                    self.query_cache.put(text=text_value, model=model, vector=vector)
+        return vectors
+
+    def _embed_query(
+        self, *, job_description: str, embedding_model_alias: str, model: str
+    ) -> list[float]:
+        """Returns the query vector, serving it from ``query_cache`` when possible.
+
+        On a miss the text is embedded through the provider and written back to
+        the cache, so re-ranking the same job skips the provider round-trip.
+        A vector produced by a fallback model is not cached under ``model``.
+        """
+        if self.query_cache is not None:
+            cached = self.query_cache.get(text=job_description, model=model)
+            if cached:
+                return cached
+
+        query_vector, selected_model = self._embed_job_description(
+            job_description=job_description, embedding_model_alias=embedding_model_alias
+        )
+        if (
+            query_vector
+            and self.query_cache is not None
+            and _same_embedding_space(selected_model, model)
+        ):
+            self.query_cache.put(text=job_description, model=model, vector=query_vector)
+        return query_vector
 
     def _resolve_model_for_alias(self, alias_name: str) -> str:
         """Resolves configured default provider-model for an embedding alias."""
-        registry = self.registry
-        if registry is None:
-            registry = ModelAliasRegistry(get_settings().model_aliases_path)
+        registry = self.registry or get_shared_registry()
         alias = registry.get(alias_name)
         return alias.default_model
 
@@ -57,26 +309,151 @@ class RetrievalService:
         """Returns an LLM client instance."""
         if self.llm_client is not None:
             return self.llm_client
-        return build_default_llm_client()
+        return get_shared_llm_client()
+
+    def _backend(self) -> str:
+        """Returns the configured retrieval backend name."""
+        backend = self.backend or get_settings().retrieval_backend
+        if backend not in {"pgvector", "numpy"}:
+            raise ValueError(
+                f"Unknown retrieval backend '{backend}'. Expected 'pgvector' or 'numpy'."
+            )
+        return backend
+
+    def _section_scoring(self) -> "_SectionScoring":
+        """Returns section weighting/aggregation options from overrides and settings."""
+        settings = get_settings()
+        scoring = _SectionScoring(
+            aggregation=self.aggregation or settings.retrieval_aggregation,
+            section_weights=dict(settings.retrieval_section_weights),
+            section_types=list(
+                self.section_types
+                if self.section_types is not None
+                else settings.retrieval_section_types
+            ),
+            top_n=settings.retrieval_aggregation_top_n,
+            temperature=settings.retrieval_softmax_temperature,
+        )
+        if scoring.aggregation not in _AGGREGATIONS:
+            raise ValueError(
+                f"Unknown retrieval aggregation '{scoring.aggregation}'. "
+                "Expected 'max', 'weighted_mean' or 'softmax'."
+            )
+        return scoring
+
+    def _numpy_index(self, *, model: str, dimensions: int) -> NumpyVectorIndex:
+        """Returns the process-wide in-memory index for one embedding space."""
+        with self._session_scope() as session:
+            return get_numpy_index(
+                session,
+                model=model,
+                dimensions=dimensions,
+                snapshot_dir=get_settings().retrieval_numpy_snapshot_dir,
+            )
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        """Yields the injected session, or a short-lived one that is closed afterwards."""
+        if self.session is not None:
+            yield self.session
+            return
+        session = get_session()
+        try:
+            yield session
+        finally:
+            session.close()
 
     def _query_top_candidates(
-        self, *, model: str, query_vector: list[float], k: int
+        self,
+        *,
+        model: str,
+        query_vector: list[float],
+        k: int,
+        lexical_query: str | None = None,
     ) -> list[tuple[int, float]]:
-        """Queries top candidate ids for one model+dimension embedding space."""
-        session = self.session or get_session()
-        close_session = self.session is None
+        """Queries top candidate ids for one model+dimension embedding space.
+
+        With the ``numpy`` backend the search runs in-process against a
+        ``NumpyVectorIndex`` with the same section weighting. Otherwise it
+        dispatches on ``query_mode`` (or ``settings.retrieval_query_mode``):
+        ``exact`` scans every section vector of the model, ``ann`` runs an
+        index-backed nearest-neighbour search over sections first, ``quantized``
+        runs that search on the compact column and re-scores exactly,
+        ``centroid`` shortlists candidates by their pooled vector before
+        section scoring, and ``hybrid`` fuses ANN and full-text rankings.
+        """
+        if self._backend() == "numpy":
+            index = self._numpy_index(model=model, dimensions=len(query_vector))
+            return index.top_k(query_vector, k, **self._section_scoring().numpy_options())
+
+        mode = self.query_mode or get_settings().retrieval_query_mode
+        if mode == "exact":
+            return self._query_top_candidates_exact(model=model, query_vector=query_vector, k=k)
+        if mode == "ann":
+            return self._query_top_candidates_ann(model=model, query_vector=query_vector, k=k)
+        if mode == "quantized":
+            return self._query_top_candidates_ann(
+                model=model,
+                query_vector=query_vector,
+                k=k,
+                representation=get_settings().retrieval_quantized_representation,
+            )
+        if mode == "centroid":
+            return self._query_top_candidates_centroid(
+                model=model, query_vector=query_vector, k=k
+            )
+        if mode == "hybrid":
+            return self._query_top_candidates_hybrid(
+                model=model, query_vector=query_vector, lexical_query=lexical_query or "", k=k
+            )
+        raise ValueError(
+            f"Unknown retrieval query mode '{mode}'. "
+            "Expected 'exact', 'ann', 'quantized', 'centroid' or 'hybrid'."
+        )
+
+    def _query_top_candidates_exact(
+        self,
+        *,
+        model: str,
+        query_vector: list[float],
+        k: int,
+        candidate_ids: list[int] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Scores every section of the embedding space and aggregates per candidate.
+
+        A ``section_types`` restriction is applied before scoring, so only the
+        chosen sections are compared against the query vector; ``candidate_ids``
+        likewise restricts scoring to those candidates.
+        """
         dimension = len(query_vector)
+        scoring = self._section_scoring()
+        weight = scoring.weight_sql()
+        candidate_filter = (
+            "AND r.candidate_id = ANY(:candidate_ids)" if candidate_ids is not None else ""
+        )
+        candidate_params = (
+            [bindparam("candidate_ids", value=list(candidate_ids))]
+            if candidate_ids is not None
+            else []
+        )
 
         # We use explicit bindparam to handle vector casting safely
         sql = text(
-            """
-            SELECT r.candidate_id, MAX(1 - (e.vector <=> cast(:query_vector as vector))) as score
-            FROM embeddings e
-            JOIN resume_sections rs ON rs.id = e.owner_id
-            JOIN resumes r ON r.id = rs.resume_id
-            WHERE e.model = :model
-              AND e.dimensions = :dimensions
-            GROUP BY r.candidate_id
+            f"""
+            WITH scored AS (
+                SELECT r.candidate_id,
+                       {weight} * (1 - (e.vector <=> cast(:query_vector as vector)))
+                           AS weighted_similarity,
+                       {weight} AS weight
+                FROM embeddings e
+                JOIN resume_sections rs ON rs.id = e.owner_id
+                JOIN resumes r ON r.id = rs.resume_id
+                WHERE e.model = :model
+                  AND e.dimensions = :dimensions
+                  {scoring.section_filter_sql("AND")}
+                  {candidate_filter}
+            )
+            {scoring.aggregate_sql("scored", "candidate_id")}
             ORDER BY score DESC
             LIMIT :k
             """
@@ -85,24 +462,684 @@ class RetrievalService:
             bindparam("model", value=model),
             bindparam("dimensions", value=dimension),
             bindparam("k", value=k),
+            *scoring.bindparams(),
+            *candidate_params,
         )
 
-        try:
+        with self._session_scope() as session:
             rows = session.execute(sql).fetchall()
             return [(int(row[0]), float(row[1])) for row in rows]
-        finally:
-            if close_session:
-                session.close()
+
+    def _query_top_candidates_centroid(
+        self, *, model: str, query_vector: list[float], k: int
+    ) -> list[tuple[int, float]]:
+        """Shortlists candidates by pooled vector, then scores only their sections.
+
+        The shortlist ``ORDER BY ... LIMIT`` over ``candidate_vectors`` matches
+        the per-model HNSW index from ``scripts/create_embedding_hnsw_indexes.py``.
+        Only the ``k * retrieval_centroid_shortlist_factor`` shortlisted
+        candidates are scored section by section, going straight from each
+        candidate vector's ``resume_id`` to its sections, so the hot path never
+        joins the full embeddings, sections and resumes tables. Candidates are
+        represented by their latest resume in this mode.
+        """
+        settings = get_settings()
+        dimension = len(query_vector)
+        shortlist_limit = max(k * settings.retrieval_centroid_shortlist_factor, k)
+        scoring = self._section_scoring()
+        weight = scoring.weight_sql()
+        centroid_distance = (
+            f"(cv.vector::vector({dimension})) <=> cast(:query_vector as vector({dimension}))"
+        )
+
+        sql = text(
+            f"""
+            WITH shortlist AS (
+                SELECT cv.candidate_id, cv.resume_id
+                FROM candidate_vectors cv
+                WHERE cv.model = {_sql_literal(model)}
+                  AND cv.dimensions = {dimension}
+                ORDER BY {centroid_distance}
+                LIMIT :shortlist_limit
+            ),
+            scored AS (
+                SELECT s.candidate_id,
+                       {weight} * (1 - ({_cosine_distance_sql(dimension)})) AS weighted_similarity,
+                       {weight} AS weight
+                FROM shortlist s
+                JOIN resume_sections rs ON rs.resume_id = s.resume_id
+                JOIN embeddings e ON e.owner_id = rs.id
+                WHERE e.model = {_sql_literal(model)}
+                  AND e.dimensions = {dimension}
+                  {scoring.section_filter_sql("AND")}
+            )
+            {scoring.aggregate_sql("scored", "candidate_id")}
+            ORDER BY score DESC
+            LIMIT :k
+            """
+        ).bindparams(
+            bindparam("query_vector", value=query_vector),
+            bindparam("shortlist_limit", value=shortlist_limit),
+            bindparam("k", value=k),
+            *scoring.bindparams(),
+        )
+
+        with self._session_scope() as session:
+            _set_hnsw_ef_search(session, shortlist_limit)
+            rows = session.execute(sql).fetchall()
+            return [(int(row[0]), float(row[1])) for row in rows]
+
+    def _query_top_candidates_ann(
+        self,
+        *,
+        model: str,
+        query_vector: list[float],
+        k: int,
+        representation: str | None = None,
+    ) -> list[tuple[int, float]]:
+        """Runs section-level ANN search and widens it until ``k`` candidates are found.
+
+        Each round fetches ``inner_limit`` nearest sections and groups them to
+        candidates. Since several sections can belong to one candidate, the
+        inner limit doubles until ``k`` distinct candidates come back, the
+        embedding space is exhausted, or ``retrieval_ann_max_inner_limit`` is hit.
+        An HNSW scan returns at most ``HNSW_MAX_EF_SEARCH`` rows, so once the
+        inner limit would exceed it the search falls back to the exact query.
+        When ``representation`` is ``halfvec`` or ``bit`` each round searches the
+        compact column and re-scores its hits against the full vectors.
+        """
+        settings = get_settings()
+        max_inner_limit = max(k, settings.retrieval_ann_max_inner_limit)
+        inner_limit = min(max(k * settings.retrieval_ann_oversample, k), max_inner_limit)
+        run_round = (
+            self._run_ann_query
+            if representation is None
+            else partial(self._run_quantized_query, representation=representation)
+        )
+
+        with self._session_scope() as session:
+            while inner_limit <= HNSW_MAX_EF_SEARCH:
+                rows, hit_count = run_round(
+                    session,
+                    model=model,
+                    query_vector=query_vector,
+                    k=k,
+                    inner_limit=inner_limit,
+                )
+                if len(rows) >= k or hit_count < inner_limit or inner_limit >= max_inner_limit:
+                    return rows
+                inner_limit = min(inner_limit * 2, max_inner_limit)
+        # Wider rounds would see the same ef_search-capped hits.
+        return self._query_top_candidates_exact(model=model, query_vector=query_vector, k=k)
+
+    def _run_ann_query(
+        self,
+        session: Session,
+        *,
+        model: str,
+        query_vector: list[float],
+        k: int,
+        inner_limit: int,
+    ) -> tuple[list[tuple[int, float]], int]:
+        """Executes one ANN round and returns grouped candidates plus the inner hit count.
+
+        The inner ``ORDER BY ... LIMIT`` is written against the exact expression
+        and predicate of the partial indexes built by
+        ``scripts/create_embedding_hnsw_indexes.py``; model and dimensions are
+        inlined as literals so the planner can prove the partial-index predicate
+        even when the statement is served from a generic prepared plan. Section
+        weights and the ``section_types`` restriction apply to the hits, so a
+        restricted search widens until enough matching sections come back.
+        """
+        dimension = len(query_vector)
+        distance = _cosine_distance_sql(dimension)
+        hits_sql = f"""
+            WITH hits AS (
+                SELECT e.owner_id AS section_id, 1 - ({distance}) AS similarity
+                FROM embeddings e
+                WHERE e.model = {_sql_literal(model)}
+                  AND e.dimensions = {dimension}
+                ORDER BY {distance}
+                LIMIT :inner_limit
+            )"""
+        return self._run_grouped_hits(
+            session, hits_sql=hits_sql, query_vector=query_vector, k=k, inner_limit=inner_limit
+        )
+
+    def _run_quantized_query(
+        self,
+        session: Session,
+        *,
+        model: str,
+        query_vector: list[float],
+        k: int,
+        inner_limit: int,
+        representation: str,
+    ) -> tuple[list[tuple[int, float]], int]:
+        """Executes one two-stage round: compact ANN search, then exact re-scoring.
+
+        The coarse ``ORDER BY ... LIMIT`` matches the ``halfvec`` or ``bit``
+        partial indexes from ``scripts/create_embedding_hnsw_indexes.py``; its
+        ``inner_limit`` hits are re-scored with exact cosine similarity on the
+        full-precision ``vector`` before grouping. Rows whose compact columns
+        have not been backfilled are not reachable in this mode.
+        """
+        dimension = len(query_vector)
+        coarse_distance = _quantized_distance_sql(representation, dimension)
+        hits_sql = f"""
+            WITH coarse AS (
+                SELECT e.id
+                FROM embeddings e
+                WHERE e.model = {_sql_literal(model)}
+                  AND e.dimensions = {dimension}
+                ORDER BY {coarse_distance}
+                LIMIT :inner_limit
+            ),
+            hits AS (
+                SELECT e.owner_id AS section_id,
+                       1 - (e.vector <=> cast(:query_vector as vector({dimension}))) AS similarity
+                FROM coarse c
+                JOIN embeddings e ON e.id = c.id
+            )"""
+        return self._run_grouped_hits(
+            session, hits_sql=hits_sql, query_vector=query_vector, k=k, inner_limit=inner_limit
+        )
+
+    def _run_grouped_hits(
+        self,
+        session: Session,
+        *,
+        hits_sql: str,
+        query_vector: list[float],
+        k: int,
+        inner_limit: int,
+    ) -> tuple[list[tuple[int, float]], int]:
+        """Groups a ``hits(section_id, similarity)`` CTE to ranked candidates plus its size."""
+        scoring = self._section_scoring()
+        weight = scoring.weight_sql()
+        _set_hnsw_ef_search(session, inner_limit)
+        sql = text(
+            f"""
+            {hits_sql},
+            scored AS (
+                SELECT r.candidate_id,
+                       {weight} * h.similarity AS weighted_similarity,
+                       {weight} AS weight
+                FROM hits h
+                JOIN resume_sections rs ON rs.id = h.section_id
+                JOIN resumes r ON r.id = rs.resume_id
+                {scoring.section_filter_sql("WHERE")}
+            ),
+            candidates AS (
+                {scoring.aggregate_sql("scored", "candidate_id")}
+            )
+            SELECT c.candidate_id, c.score, hc.hit_count
+            FROM (SELECT COUNT(*) AS hit_count FROM hits) hc
+            LEFT JOIN LATERAL (
+                SELECT candidate_id, score FROM candidates ORDER BY score DESC LIMIT :k
+            ) c ON TRUE
+            ORDER BY c.score DESC
+            """
+        ).bindparams(
+            bindparam("query_vector", value=query_vector),
+            bindparam("inner_limit", value=inner_limit),
+            bindparam("k", value=k),
+            *scoring.bindparams(),
+        )
+        rows = session.execute(sql).fetchall()
+        hit_count = int(rows[0][2]) if rows else 0
+        return [(int(row[0]), float(row[1])) for row in rows if row[0] is not None], hit_count
+
+    def _query_top_candidates_hybrid(
+        self, *, model: str, query_vector: list[float], lexical_query: str, k: int
+    ) -> list[tuple[int, float]]:
+        """Fuses vector and full-text candidate rankings with reciprocal rank fusion.
+
+        Both legs run in one statement. The vector leg is the index-matching
+        ANN section search grouped to candidates; the lexical leg matches
+        ``resume_sections.search_vector`` against the query terms parsed with
+        both the English and Spanish configs, OR-ed so any exact term counts
+        (callers pass a short term list, see ``retrieval_hybrid_max_terms``).
+        Each leg keeps its best ``leg_limit`` candidates and contributes
+        ``1 / (rrf_k + rank)``. Fused scores are divided by the maximum possible
+        value (rank 1 in both legs) so they stay in 0-1 like cosine scores.
+
+        Like ``ann``, a round that fuses fewer than ``k`` candidates is widened:
+        the vector leg's section limit and both legs' candidate limits double
+        until ``k`` candidates come back, both legs are exhausted, or the
+        section limit reaches ``retrieval_ann_max_inner_limit`` (at most
+        ``HNSW_MAX_EF_SEARCH``).
+        """
+        settings = get_settings()
+        leg_limit = max(k, settings.retrieval_hybrid_leg_limit)
+        max_inner_limit = min(
+            max(leg_limit, settings.retrieval_ann_max_inner_limit), HNSW_MAX_EF_SEARCH
+        )
+        inner_limit = min(
+            max(leg_limit * settings.retrieval_ann_oversample, leg_limit), max_inner_limit
+        )
+
+        with self._session_scope() as session:
+            while True:
+                rows, vector_hits, lexical_hits = self._run_hybrid_query(
+                    session,
+                    model=model,
+                    query_vector=query_vector,
+                    lexical_query=lexical_query,
+                    k=k,
+                    inner_limit=inner_limit,
+                    leg_limit=leg_limit,
+                )
+                exhausted = vector_hits < inner_limit and lexical_hits < leg_limit
+                if len(rows) >= k or exhausted or inner_limit >= max_inner_limit:
+                    return rows
+                inner_limit = min(inner_limit * 2, max_inner_limit)
+                leg_limit *= 2
+
+    def _run_hybrid_query(
+        self,
+        session: Session,
+        *,
+        model: str,
+        query_vector: list[float],
+        lexical_query: str,
+        k: int,
+        inner_limit: int,
+        leg_limit: int,
+    ) -> tuple[list[tuple[int, float]], int, int]:
+        """Executes one fusion round; returns fused candidates and both legs' hit counts."""
+        settings = get_settings()
+        dimension = len(query_vector)
+        distance = _cosine_distance_sql(dimension)
+        scoring = self._section_scoring()
+        weight = scoring.weight_sql()
+        rrf_k = settings.retrieval_hybrid_rrf_k
+
+        sql = text(
+            f"""
+            WITH vector_hits AS (
+                SELECT e.owner_id AS section_id, 1 - ({distance}) AS similarity
+                FROM embeddings e
+                WHERE e.model = {_sql_literal(model)}
+                  AND e.dimensions = {dimension}
+                ORDER BY {distance}
+                LIMIT :inner_limit
+            ),
+            vector_scored AS (
+                SELECT r.candidate_id,
+                       {weight} * h.similarity AS weighted_similarity,
+                       {weight} AS weight
+                FROM vector_hits h
+                JOIN resume_sections rs ON rs.id = h.section_id
+                JOIN resumes r ON r.id = rs.resume_id
+                {scoring.section_filter_sql("WHERE")}
+            ),
+            vector_scores AS (
+                {scoring.aggregate_sql("vector_scored", "candidate_id")}
+            ),
+            vector_ranked AS (
+                SELECT candidate_id, ROW_NUMBER() OVER (ORDER BY score DESC) AS position
+                FROM vector_scores
+                ORDER BY position
+                LIMIT :leg_limit
+            ),
+            lexical_query AS (
+                SELECT cast(replace(cast(plainto_tsquery('english', :lexical_query) AS text),
+                                    '&', '|') AS tsquery)
+                       || cast(replace(cast(plainto_tsquery('spanish', :lexical_query) AS text),
+                                       '&', '|') AS tsquery) AS query
+            ),
+            lexical_ranked AS (
+                SELECT r.candidate_id,
+                       ROW_NUMBER() OVER (
+                           ORDER BY MAX(ts_rank_cd(rs.search_vector, lq.query)) DESC
+                       ) AS position
+                FROM lexical_query lq
+                JOIN resume_sections rs ON rs.search_vector @@ lq.query
+                JOIN resumes r ON r.id = rs.resume_id
+                {scoring.section_filter_sql("WHERE")}
+                GROUP BY r.candidate_id
+                ORDER BY position
+                LIMIT :leg_limit
+            ),
+            fused AS (
+                SELECT candidate_id, SUM(1.0 / (:rrf_k + position)) AS rrf_score
+                FROM (
+                    SELECT candidate_id, position FROM vector_ranked
+                    UNION ALL
+                    SELECT candidate_id, position FROM lexical_ranked
+                ) legs
+                GROUP BY candidate_id
+            )
+            SELECT f.candidate_id, f.score, hc.vector_hits, hc.lexical_hits
+            FROM (
+                SELECT (SELECT COUNT(*) FROM vector_hits) AS vector_hits,
+                       (SELECT COUNT(*) FROM lexical_ranked) AS lexical_hits
+            ) hc
+            LEFT JOIN LATERAL (
+                SELECT candidate_id, rrf_score / (2.0 / (:rrf_k + 1)) AS score
+                FROM fused
+                ORDER BY score DESC, candidate_id
+                LIMIT :k
+            ) f ON TRUE
+            ORDER BY f.score DESC, f.candidate_id
+            """
+        ).bindparams(
+            bindparam("query_vector", value=query_vector),
+            bindparam("lexical_query", value=lexical_query),
+            bindparam("inner_limit", value=inner_limit),
+            bindparam("leg_limit", value=leg_limit),
+            bindparam("rrf_k", value=rrf_k),
+            bindparam("k", value=k),
+            *scoring.bindparams(),
+        )
+
+        _set_hnsw_ef_search(session, inner_limit)
+        rows = session.execute(sql).fetchall()
+        vector_hits = int(rows[0][2]) if rows else 0
+        lexical_hits = int(rows[0][3]) if rows else 0
+        return (
+            [(int(row[0]), float(row[1])) for row in rows if row[0] is not None],
+            vector_hits,
+            lexical_hits,
+        )
+
+    def _query_top_candidates_ann_many(
+        self, *, model: str, query_vectors: list[list[float]], k: int
+    ) -> list[list[tuple[int, float]]]:
+        """Runs one batched ANN round, then widens only the queries that came back short."""
+        settings = get_settings()
+        max_inner_limit = max(k, settings.retrieval_ann_max_inner_limit)
+        inner_limit = min(max(k * settings.retrieval_ann_oversample, k), max_inner_limit)
+        if inner_limit > HNSW_MAX_EF_SEARCH:
+            return [
+                self._query_top_candidates_exact(model=model, query_vector=query_vector, k=k)
+                for query_vector in query_vectors
+            ]
+
+        with self._session_scope() as session:
+            batched = self._run_ann_many_query(
+                session,
+                model=model,
+                query_vectors=query_vectors,
+                k=k,
+                inner_limit=inner_limit,
+            )
+        results: list[list[tuple[int, float]]] = []
+        for query_vector, (rows, hit_count) in zip(query_vectors, batched):
+            if len(rows) < k and hit_count >= inner_limit and inner_limit < max_inner_limit:
+                rows = self._query_top_candidates_ann(model=model, query_vector=query_vector, k=k)
+            results.append(rows)
+        return results
+
+    def _run_ann_many_query(
+        self,
+        session: Session,
+        *,
+        model: str,
+        query_vectors: list[list[float]],
+        k: int,
+        inner_limit: int,
+    ) -> list[tuple[list[tuple[int, float]], int]]:
+        """Executes ANN search for many query vectors in a single statement.
+
+        Query vectors are passed as one ``text[]`` array and unnested with their
+        ordinal; a ``LATERAL`` subquery runs the index-matching ``ORDER BY ...
+        LIMIT`` per query vector before grouping hits to candidates.
+
+        Returns:
+            list[tuple[list[tuple[int, float]], int]]: Per-query ranked candidates and
+                inner hit count, aligned with ``query_vectors``.
+        """
+        dimensions = {len(vector) for vector in query_vectors}
+        if len(dimensions) != 1:
+            raise ValueError("All query vectors in a batch must share one dimension")
+        dimension = dimensions.pop()
+        distance = _cosine_distance_sql(dimension, query_sql="q.query_vector")
+        scoring = self._section_scoring()
+        weight = scoring.weight_sql()
+
+        _set_hnsw_ef_search(session, inner_limit)
+        sql = text(
+            f"""
+            WITH q AS (
+                SELECT u.ord, cast(u.vec AS vector({dimension})) AS query_vector
+                FROM unnest(cast(:query_vectors AS text[])) WITH ORDINALITY AS u(vec, ord)
+            ),
+            hits AS (
+                SELECT q.ord, h.section_id, h.similarity
+                FROM q
+                CROSS JOIN LATERAL (
+                    SELECT e.owner_id AS section_id, 1 - ({distance}) AS similarity
+                    FROM embeddings e
+                    WHERE e.model = {_sql_literal(model)}
+                      AND e.dimensions = {dimension}
+                    ORDER BY {distance}
+                    LIMIT :inner_limit
+                ) h
+            ),
+            hit_counts AS (
+                SELECT ord, COUNT(*) AS hit_count FROM hits GROUP BY ord
+            ),
+            scored AS (
+                SELECT h.ord,
+                       r.candidate_id,
+                       {weight} * h.similarity AS weighted_similarity,
+                       {weight} AS weight
+                FROM hits h
+                JOIN resume_sections rs ON rs.id = h.section_id
+                JOIN resumes r ON r.id = rs.resume_id
+                {scoring.section_filter_sql("WHERE")}
+            ),
+            candidates AS (
+                {scoring.aggregate_sql("scored", "ord, candidate_id")}
+            ),
+            ranked AS (
+                SELECT ord,
+                       candidate_id,
+                       score,
+                       ROW_NUMBER() OVER (PARTITION BY ord ORDER BY score DESC) AS position
+                FROM candidates
+            )
+            SELECT hit_counts.ord, ranked.candidate_id, ranked.score, hit_counts.hit_count
+            FROM hit_counts
+            LEFT JOIN ranked
+              ON ranked.ord = hit_counts.ord
+             AND ranked.position <= :k
+            ORDER BY hit_counts.ord, ranked.position
+            """
+        ).bindparams(
+            bindparam("query_vectors", value=[_vector_literal(v) for v in query_vectors]),
+            bindparam("inner_limit", value=inner_limit),
+            bindparam("k", value=k),
+            *scoring.bindparams(),
+        )
+        rows = session.execute(sql).fetchall()
+
+        results: list[tuple[list[tuple[int, float]], int]] = [([], 0) for _ in query_vectors]
+        for ord_value, candidate_id, score, hit_count in rows:
+            index = int(ord_value) - 1
+            ranked, _ = results[index]
+            if candidate_id is not None:
+                ranked.append((int(candidate_id), float(score)))
+            results[index] = (ranked, int(hit_count))
+        return results
 
     def _embed_job_description(
         self, *, job_description: str, embedding_model_alias: str
-    ) -> list[float]:
-        """Embeds the input job text using the configured embedding alias."""
-        vectors = self._resolve_llm_client().embed(
+    ) -> tuple[list[float], str | None]:
+        """Embeds the input job text; returns the vector and the model that produced it."""
+        vectors, metadata = self._resolve_llm_client().embed_with_meta(
             texts=[job_description],
             embedding_model_alias=embedding_model_alias,
         )
+        selected_model = metadata.selected_model if metadata is not None else None
         if not vectors:
-            return []
+            return [], selected_model
         first = vectors[0]
-        return [float(value) for value in first]
+        return [float(value) for value in first], selected_model
+
+
+_AGGREGATIONS = ("max", "weighted_mean", "softmax")
+
+
+def _same_embedding_space(selected_model: str | None, model: str) -> bool:
+    """Returns whether a vector reported as ``selected_model`` may be cached under ``model``.
+
+    The router can answer with a fallback model; its vectors live in another
+    embedding space and must not be served later as ``model`` vectors.
+    Providers that do not report the model are trusted to use the default.
+    """
+    return selected_model is None or selected_model == model
+
+
+@dataclass(frozen=True)
+class _SectionScoring:
+    """SQL fragments for weighting section similarities and pooling them per candidate.
+
+    Queries build a relation with ``weighted_similarity`` (section weight times
+    cosine similarity) and ``weight`` columns, joined to ``resume_sections rs``
+    so weights are looked up by ``rs.section_type``. Sections without a
+    configured weight count with ``1.0``.
+
+    Attributes:
+        aggregation: ``max`` keeps the best weighted section, ``weighted_mean``
+            averages the ``top_n`` best sections by weight, and ``softmax``
+            pools all sections with softmax weights at ``temperature``.
+        section_weights: Per-``section_type`` multipliers.
+        section_types: When non-empty, only these section types are scored.
+        top_n: Section count used by ``weighted_mean``.
+        temperature: Softmax temperature used by ``softmax``.
+    """
+
+    aggregation: str = "max"
+    section_weights: dict[str, float] = field(default_factory=dict)
+    section_types: list[str] = field(default_factory=list)
+    top_n: int = 3
+    temperature: float = 0.1
+
+    def numpy_options(self) -> dict[str, Any]:
+        """Returns these options as keyword arguments of ``NumpyVectorIndex.top_k_many``."""
+        return {
+            "aggregation": self.aggregation,
+            "section_weights": self.section_weights,
+            "section_types": self.section_types,
+            "top_n": self.top_n,
+            "temperature": self.temperature,
+        }
+
+    def weight_sql(self) -> str:
+        """Returns the per-section weight expression."""
+        if not self.section_weights:
+            return "1.0"
+        return (
+            "COALESCE(cast(cast(:section_weights AS jsonb) ->> rs.section_type "
+            "AS double precision), 1.0)"
+        )
+
+    def section_filter_sql(self, keyword: str) -> str:
+        """Returns the ``section_types`` predicate prefixed by ``keyword`` (``WHERE``/``AND``)."""
+        if not self.section_types:
+            return ""
+        return f"{keyword} rs.section_type = ANY(:section_types)"
+
+    def aggregate_sql(self, source: str, group_by: str) -> str:
+        """Returns a ``SELECT {group_by}, score`` statement pooling ``source`` rows."""
+        if self.aggregation == "weighted_mean":
+            return f"""
+                SELECT {group_by},
+                       COALESCE(SUM(weighted_similarity) / NULLIF(SUM(weight), 0), 0) AS score
+                FROM (
+                    SELECT src.*,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY {group_by} ORDER BY src.weighted_similarity DESC
+                           ) AS section_rank
+                    FROM {source} src
+                ) ranked_sections
+                WHERE section_rank <= {max(int(self.top_n), 1)}
+                GROUP BY {group_by}
+            """
+        if self.aggregation == "softmax":
+            temperature = max(float(self.temperature), 1e-6)
+            return f"""
+                SELECT {group_by},
+                       SUM(weighted_similarity * exp((weighted_similarity - best) / {temperature}))
+                           / SUM(exp((weighted_similarity - best) / {temperature})) AS score
+                FROM (
+                    SELECT src.*,
+                           MAX(src.weighted_similarity) OVER (PARTITION BY {group_by}) AS best
+                    FROM {source} src
+                ) pooled_sections
+                GROUP BY {group_by}
+            """
+        return f"""
+                SELECT {group_by}, MAX(weighted_similarity) AS score
+                FROM {source}
+                GROUP BY {group_by}
+            """
+
+    def bindparams(self) -> list:
+        """Returns the bind parameters referenced by the generated fragments."""
+        params = []
+        if self.section_weights:
+            params.append(bindparam("section_weights", value=json.dumps(self.section_weights)))
+        if self.section_types:
+            params.append(bindparam("section_types", value=list(self.section_types)))
+        return params
+
+
+def _cosine_distance_sql(dimension: int, query_sql: str | None = None) -> str:
+    """Builds the cosine-distance expression matching the model-scoped HNSW indexes.
+
+    Args:
+        dimension (int): Dimension of the embedding space being searched.
+        query_sql (str | None): SQL expression for the query vector; defaults to
+            the ``:query_vector`` bind parameter cast to ``vector(dimension)``.
+    """
+    dim = int(dimension)
+    query = query_sql or f"cast(:query_vector as vector({dim}))"
+    return f"(e.vector::vector({dim})) <=> {query}"
+
+
+def _quantized_distance_sql(representation: str, dimension: int) -> str:
+    """Builds the coarse distance expression matching the compact-column HNSW indexes.
+
+    Args:
+        representation (str): ``halfvec`` (cosine on half precision) or ``bit``
+            (Hamming on binary-quantized vectors).
+        dimension (int): Dimension of the embedding space being searched.
+
+    Raises:
+        ValueError: If ``representation`` is not supported.
+    """
+    dim = int(dimension)
+    if representation == "halfvec":
+        return f"(e.vector_half::halfvec({dim})) <=> cast(:query_vector as halfvec({dim}))"
+    if representation == "bit":
+        return (
+            f"(e.vector_bit::bit({dim})) "
+            f"<~> cast(binary_quantize(cast(:query_vector as vector({dim}))) as bit({dim}))"
+        )
+    raise ValueError(
+        f"Unknown quantized representation '{representation}'. Expected 'halfvec' or 'bit'."
+    )
+
+
+def _set_hnsw_ef_search(session: Session, inner_limit: int) -> None:
+    """Raises ``hnsw.ef_search`` for the current transaction so ANN scans can fill the limit."""
+    ef_search = min(max(inner_limit, 40), HNSW_MAX_EF_SEARCH)
+    session.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)").bindparams(
+            bindparam("ef_search", value=str(ef_search))
+        )
+    )
+
+
+def _vector_literal(vector: list[float]) -> str:
+    """Renders a vector in pgvector's text input format."""
+    return "[" + ",".join(repr(float(value)) for value in vector) + "]"
+
+
+def _sql_literal(value: str) -> str:
+    """Renders a string as a quoted SQL literal for planner-visible predicates."""
+    return "'" + value.replace("'", "''") + "'"
@@ -2,9 +2,11 @@
 
 from datetime import datetime, timezone
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -14,7 +16,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.storage.db import Base
@@ -45,8 +47,12 @@ class Resume(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.id"), nullable=False)
-    source_file: Mapped[str] = mapped_column(String(512), nullable=False)
+    source_file: Mapped[str] = mapped_column(String(512), nullable=False, index=True)
     content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    # Raw-file fingerprint, checked before parsing; NULL for resumes ingested before it existed.
+    source_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    source_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    source_mtime: Mapped[float | None] = mapped_column(Float, nullable=True)
     raw_text: Mapped[str] = mapped_column(Text, nullable=False)
     parsed_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     signals_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
@@ -70,6 +76,20 @@ class ResumeSection(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     metadata_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    language: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector(CASE WHEN language = 'es' THEN 'spanish'::regconfig "
+            "ELSE 'english'::regconfig END, content)",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        Index("ix_resume_sections_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     resume: Mapped[Resume] = relationship(back_populates="sections")
 
@@ -98,6 +118,8 @@ class Embedding(Base):
     model: Mapped[str] = mapped_column(String(128), nullable=False)
     dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
     vector: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+    vector_half: Mapped[list[float] | None] = mapped_column(HALFVEC(), nullable=True)
+    vector_bit: Mapped[str | None] = mapped_column(BIT(varying=True), nullable=True)
     text_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
@@ -135,6 +157,154 @@ class EmbeddingModel(Base):
     )
 
 
+class QueryEmbedding(Base):
+    """Data model for cached query/job-description embedding values."""
+
+    __tablename__ = "query_embeddings"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    model: Mapped[str] = mapped_column(String(128), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint("dimensions > 0", name="ck_query_embeddings_dimensions_positive"),
+        CheckConstraint(
+            "dimensions = vector_dims(vector)", name="ck_query_embeddings_dimensions_match_vector"
+        ),
+        Index(
+            "ux_query_embeddings_hash_model_dimensions",
+            "text_hash",
+            "model",
+            "dimensions",
+            unique=True,
+        ),
+    )
+
+
+class SkillEmbedding(Base):
+    """Data model for cached embeddings of normalized skill names."""
+
+    __tablename__ = "skill_embeddings"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    skill_text: Mapped[str] = mapped_column(String(256), nullable=False)
+    model: Mapped[str] = mapped_column(String(128), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint("dimensions > 0", name="ck_skill_embeddings_dimensions_positive"),
+        CheckConstraint(
+            "dimensions = vector_dims(vector)", name="ck_skill_embeddings_dimensions_match_vector"
+        ),
+        Index("ux_skill_embeddings_text_model", "skill_text", "model", unique=True),
+    )
+
+
+class CandidateVector(Base):
+    """Data model for pooled per-candidate vectors used by coarse retrieval.
+
+    One row per candidate and model holds the mean of the section embeddings
+    of the candidate's latest resume.
+    """
+
+    __tablename__ = "candidate_vectors"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    candidate_id: Mapped[int] = mapped_column(
+        ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False
+    )
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False
+    )
+    model: Mapped[str] = mapped_column(String(128), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+    section_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint("dimensions > 0", name="ck_candidate_vectors_dimensions_positive"),
+        CheckConstraint(
+            "dimensions = vector_dims(vector)", name="ck_candidate_vectors_dimensions_match_vector"
+        ),
+        ForeignKeyConstraint(
+            ["model", "dimensions"],
+            ["embedding_models.model", "embedding_models.dimensions"],
+            name="fk_candidate_vectors_model_dimensions",
+        ),
+        Index("ux_candidate_vectors_candidate_model", "candidate_id", "model", unique=True),
+    )
+
+
+class JobVector(Base):
+    """Data model for job description embeddings used by reverse matching.
+
+    One row per job posting and model; new resumes query these vectors to
+    find the jobs they fit best.
+    """
+
+    __tablename__ = "job_vectors"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("job_postings.id", ondelete="CASCADE"), nullable=False
+    )
+    model: Mapped[str] = mapped_column(String(128), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+    text_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint("dimensions > 0", name="ck_job_vectors_dimensions_positive"),
+        CheckConstraint(
+            "dimensions = vector_dims(vector)", name="ck_job_vectors_dimensions_match_vector"
+        ),
+        ForeignKeyConstraint(
+            ["model", "dimensions"],
+            ["embedding_models.model", "embedding_models.dimensions"],
+            name="fk_job_vectors_model_dimensions",
+        ),
+        Index("ux_job_vectors_job_model", "job_id", "model", unique=True),
+    )
+
+
+class RerankCacheEntry(Base):
+    """Data model for cached LLM rerank explanations and interview prep packs.
+
+    Rows are content-addressed: ``cache_key`` hashes the job requirements,
+    candidate signals, model alias and prompt version, so identical pairs are
+    reused across jobs and re-ingested resumes.
+    """
+
+    __tablename__ = "rerank_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    cache_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    model_alias: Mapped[str] = mapped_column(String(128), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    __table_args__ = (Index("ux_rerank_cache_cache_key", "cache_key", unique=True),)
+
+
 class Match(Base):
     """Data model for match values."""
 
@@ -154,6 +324,32 @@ class Match(Base):
 
     candidate: Mapped["Candidate"] = relationship()
 
+    __table_args__ = (Index("ux_matches_job_candidate", "job_id", "candidate_id", unique=True),)
+
+
+class RankingWatermark(Base):
+    """Data model for the per-job watermark of the last ranking run.
+
+    Incremental ranking compares the stored requirements hash and newest
+    resume ``(created_at, id)`` against the current state to find the
+    candidates that need scoring.
+    """
+
+    __tablename__ = "ranking_watermarks"
+
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True
+    )
+    requirements_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    top_k: Mapped[int] = mapped_column(Integer, nullable=False)
+    resume_created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    resume_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
 
 class AsyncTask(Base):
     """Data model for background task tracking."""
@@ -1,12 +1,17 @@
 """Repository classes for creating and querying ATS persistence models."""
 
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, literal, null, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.storage import models
 
+# ``reasons_json.source`` of matches written by reverse matching at ingest time.
+REVERSE_MATCH_SOURCE = "reverse_match"
+
 
 @dataclass
 class CandidateRepository:
@@ -252,6 +257,81 @@ class ResumeRepository:
             select(models.Resume).where(models.Resume.content_hash == content_hash)
         )
 
+    def get_by_source_fingerprint(self, sha256: str, size: int) -> models.Resume | None:
+        """Finds a resume ingested from a byte-identical source file.
+
+        Args:
+            sha256 (str): Hex SHA-256 digest of the source file bytes.
+            size (int): Source file size in bytes.
+
+        Returns:
+            models.Resume | None: Matching resume, if any.
+        """
+        return self.session.scalar(
+            select(models.Resume)
+            .where(models.Resume.source_sha256 == sha256, models.Resume.source_size == size)
+            .limit(1)
+        )
+
+    def get_source_stats(self, source_files: list[str]) -> dict[str, set[tuple[int, float]]]:
+        """Returns the stored ``(size, mtime)`` fingerprints of the given source paths.
+
+        Args:
+            source_files (list[str]): Source file path strings.
+
+        Returns:
+            dict[str, set[tuple[int, float]]]: Fingerprints keyed by path; paths
+                without resumes are absent and resumes without a fingerprint
+                contribute nothing.
+        """
+        if not source_files:
+            return {}
+        rows = self.session.execute(
+            select(
+                models.Resume.source_file, models.Resume.source_size, models.Resume.source_mtime
+            ).where(
+                models.Resume.source_file.in_(source_files),
+                models.Resume.source_size.is_not(None),
+                models.Resume.source_mtime.is_not(None),
+            )
+        ).all()
+        stats: dict[str, set[tuple[int, float]]] = {}
+        for source_file, size, mtime in rows:
+            stats.setdefault(source_file, set()).add((int(size), float(mtime)))
+        return stats
+
+    def get_known_source_fingerprints(
+        self, fingerprints: list[tuple[str, int]]
+    ) -> set[tuple[str, int]]:
+        """Returns which ``(sha256, size)`` fingerprints already belong to a resume.
+
+        Args:
+            fingerprints (list[tuple[str, int]]): Candidate ``(sha256, size)`` pairs.
+
+        Returns:
+            set[tuple[str, int]]: The subset of ``fingerprints`` already stored.
+        """
+        if not fingerprints:
+            return set()
+        rows = self.session.execute(
+            select(models.Resume.source_sha256, models.Resume.source_size)
+            .where(
+                tuple_(models.Resume.source_sha256, models.Resume.source_size).in_(
+                    list(set(fingerprints))
+                )
+            )
+            .distinct()
+        ).all()
+        return {(sha256, int(size)) for sha256, size in rows}
+
+    def list_all(self) -> list[models.Resume]:
+        """Returns every resume row, ordered by id.
+
+        Returns:
+            list[models.Resume]: Persisted resume rows.
+        """
+        return list(self.session.scalars(select(models.Resume).order_by(models.Resume.id)))
+
     def get_latest_resume_by_candidate_id(self, candidate_id: int) -> models.Resume | None:
         """Returns the most recent resume for a candidate.
 
@@ -268,6 +348,75 @@ class ResumeRepository:
             .limit(1)
         )
 
+    def get_latest_resumes_by_candidate_ids(
+        self, candidate_ids: list[int]
+    ) -> dict[int, models.Resume]:
+        """Returns the most recent resume of each candidate in one query.
+
+        Uses ``DISTINCT ON (candidate_id)`` ordered by newest first, with the
+        resume id breaking ties between equal timestamps.
+
+        Args:
+            candidate_ids (list[int]): Candidate identifiers.
+
+        Returns:
+            dict[int, models.Resume]: Latest resume keyed by candidate id;
+                candidates without resumes are absent.
+        """
+        if not candidate_ids:
+            return {}
+        resumes = self.session.scalars(
+            select(models.Resume)
+            .where(models.Resume.candidate_id.in_(candidate_ids))
+            .distinct(models.Resume.candidate_id)
+            .order_by(
+                models.Resume.candidate_id,
+                models.Resume.created_at.desc(),
+                models.Resume.id.desc(),
+            )
+        ).all()
+        return {resume.candidate_id: resume for resume in resumes}
+
+    def get_resume_watermark(self) -> tuple[datetime, int] | None:
+        """Returns the ``(created_at, id)`` of the newest resume, if any."""
+        row = self.session.execute(
+            select(models.Resume.created_at, models.Resume.id)
+            .order_by(models.Resume.created_at.desc(), models.Resume.id.desc())
+            .limit(1)
+        ).first()
+        return (row[0], int(row[1])) if row else None
+
+    def get_candidate_ids_with_resumes_between(
+        self,
+        after: tuple[datetime, int] | None,
+        until: tuple[datetime, int],
+    ) -> list[int]:
+        """Returns candidates holding a resume newer than ``after`` and not newer than ``until``.
+
+        Resumes are ordered by ``(created_at, id)``, the same key as
+        ``get_resume_watermark``.
+
+        Args:
+            after (tuple[datetime, int] | None): Exclusive lower bound; ``None``
+                means every resume up to ``until``.
+            until (tuple[datetime, int]): Inclusive upper bound.
+
+        Returns:
+            list[int]: Distinct candidate identifiers in ascending order.
+        """
+        key = tuple_(models.Resume.created_at, models.Resume.id)
+        created_at_type = models.Resume.created_at.type
+        query = (
+            select(models.Resume.candidate_id)
+            .distinct()
+            .where(key <= tuple_(literal(until[0], created_at_type), literal(until[1])))
+        )
+        if after is not None:
+            query = query.where(
+                key > tuple_(literal(after[0], created_at_type), literal(after[1]))
+            )
+        return list(self.session.scalars(query.order_by(models.Resume.candidate_id)))
+
     def create(
         self,
         candidate_id: int,
@@ -278,6 +427,9 @@ class ResumeRepository:
         parsed_json: dict | None = None,
         signals_json: dict | None = None,
         language: str | None = None,
+        source_sha256: str | None = None,
+        source_size: int | None = None,
+        source_mtime: float | None = None,
     ) -> models.Resume:
         """Creates and flushes a new persistence model row.
 
@@ -288,6 +440,9 @@ class ResumeRepository:
             raw_text (str): Raw resume text/markdown to persist.
             parsed_json (dict | None): Parser artifact payload persisted in the resume row.
             language (str | None): Detected document language code.
+            source_sha256 (str | None): SHA-256 of the source file bytes.
+            source_size (int | None): Source file size in bytes.
+            source_mtime (float | None): Source file modification time when hashed.
 
         Returns:
             models.Resume: Persisted ORM instance returned after flush.
@@ -300,6 +455,9 @@ class ResumeRepository:
             parsed_json=parsed_json,
             signals_json=signals_json,
             language=language,
+            source_sha256=source_sha256,
+            source_size=source_size,
+            source_mtime=source_mtime,
         )
         self.session.add(resume)
         self.session.flush()
@@ -320,6 +478,7 @@ class ResumeSectionRepository:
         content: str,
         metadata_json: dict | None = None,
         tokens: int | None = None,
+        language: str | None = None,
     ) -> models.ResumeSection:
         """Creates and flushes a new persistence model row.
 
@@ -329,6 +488,7 @@ class ResumeSectionRepository:
             content (str): Section body content associated with the heading.
             metadata_json (dict | None): Input value used by `metadata_json`.
             tokens (int | None): Input value used by `tokens`.
+            language (str | None): Resume language code; selects the full-text config.
 
         Returns:
             models.ResumeSection: Persisted ORM instance returned after flush.
@@ -339,11 +499,79 @@ class ResumeSectionRepository:
             content=content,
             metadata_json=metadata_json,
             tokens=tokens,
+            language=language,
         )
         self.session.add(section)
         self.session.flush()
         return section
 
+    def list_by_resume(self, resume_id: int) -> list[models.ResumeSection]:
+        """Returns the section rows of one resume, ordered by id.
+
+        Args:
+            resume_id (int): Resume primary key.
+
+        Returns:
+            list[models.ResumeSection]: Persisted section rows.
+        """
+        return list(
+            self.session.scalars(
+                select(models.ResumeSection)
+                .where(models.ResumeSection.resume_id == resume_id)
+                .order_by(models.ResumeSection.id)
+            )
+        )
+
+    def delete_for_resume(self, resume_id: int) -> int:
+        """Deletes a resume's section rows together with the embeddings they own.
+
+        Args:
+            resume_id (int): Resume primary key whose sections are removed.
+
+        Returns:
+            int: Number of section rows deleted.
+        """
+        section_ids = select(models.ResumeSection.id).where(
+            models.ResumeSection.resume_id == resume_id
+        )
+        self.session.execute(
+            delete(models.Embedding).where(models.Embedding.owner_id.in_(section_ids))
+        )
+        result = self.session.execute(
+            delete(models.ResumeSection).where(models.ResumeSection.resume_id == resume_id)
+        )
+        return int(result.rowcount or 0)
+
+
+def binary_quantize(vector: list[float]) -> str:
+    """Returns the bit-string form of ``vector`` matching pgvector's ``binary_quantize``.
+
+    Args:
+        vector (list[float]): Embedding vector payload.
+
+    Returns:
+        str: One ``1`` per positive component and ``0`` otherwise.
+    """
+    return "".join("1" if value > 0 else "0" for value in vector)
+
+
+def _register_embedding_model(session: Session, *, model: str, dimensions: int) -> None:
+    """Registers ``model`` in ``embedding_models`` or checks its stored dimension.
+
+    Raises:
+        ValueError: When the model is registered with a different dimension.
+    """
+    registered = session.scalar(
+        select(models.EmbeddingModel).where(models.EmbeddingModel.model == model)
+    )
+    if registered is None:
+        session.add(models.EmbeddingModel(model=model, dimensions=dimensions))
+        session.flush()
+    elif int(registered.dimensions) != dimensions:
+        raise ValueError(
+            f"Embedding model '{model}' expects {registered.dimensions} dimensions, got {dimensions}"
+        )
+
 
 @dataclass
 class EmbeddingRepository:
@@ -367,6 +595,9 @@ class EmbeddingRepository:
             vector (list[float]): Embedding vector payload.
             text_hash (str): Deterministic content hash for the embedded text.
 
+        The row also stores the compact ``halfvec`` and binary-quantized ``bit``
+        forms used by the ``quantized`` retrieval mode.
+
         Returns:
             models.Embedding: Persisted ORM instance returned after flush.
         """
@@ -374,28 +605,297 @@ class EmbeddingRepository:
         if dimensions <= 0:
             raise ValueError("Embedding vector must contain at least one dimension")
 
-        registered = self.session.scalar(
-            select(models.EmbeddingModel).where(models.EmbeddingModel.model == model)
-        )
-        if registered is None:
-            self.session.add(models.EmbeddingModel(model=model, dimensions=dimensions))
-            self.session.flush()
-        elif int(registered.dimensions) != dimensions:
-            raise ValueError(
-                f"Embedding model '{model}' expects {registered.dimensions} dimensions, got {dimensions}"
-            )
+        _register_embedding_model(self.session, model=model, dimensions=dimensions)
 
         embedding = models.Embedding(
             owner_id=owner_id,
             model=model,
             dimensions=dimensions,
             vector=vector,
+            vector_half=vector,
+            vector_bit=binary_quantize(vector),
             text_hash=text_hash,
         )
         self.session.add(embedding)
         self.session.flush()
         return embedding
 
+    def list_by_owner_ids(self, owner_ids: list[int]) -> list[models.Embedding]:
+        """Returns the embeddings owned by the given section ids, in one query.
+
+        Args:
+            owner_ids (list[int]): Owning entity identifiers.
+
+        Returns:
+            list[models.Embedding]: Matching embedding rows.
+        """
+        if not owner_ids:
+            return []
+        return list(
+            self.session.scalars(
+                select(models.Embedding).where(models.Embedding.owner_id.in_(owner_ids))
+            )
+        )
+
+
+@dataclass
+class CandidateVectorRepository:
+    """Repository for maintaining pooled per-candidate vectors."""
+
+    session: Session
+
+    def refresh(self, *, candidate_id: int | None = None, model: str | None = None) -> int:
+        """Recomputes candidate vectors from the section embeddings of each latest resume.
+
+        Existing rows in scope are replaced, so candidates whose latest resume no
+        longer has embeddings for a model lose their stale vector. Without
+        arguments every candidate and model is rebuilt.
+
+        Args:
+            candidate_id (int | None): Restricts the refresh to one candidate.
+            model (str | None): Restricts the refresh to one provider/model.
+
+        Returns:
+            int: Number of candidate vector rows written.
+        """
+        delete_filters: list[str] = []
+        resume_filter = ""
+        embedding_filter = ""
+        params = []
+        if candidate_id is not None:
+            delete_filters.append("candidate_id = :candidate_id")
+            resume_filter = "WHERE candidate_id = :candidate_id"
+            params.append(bindparam("candidate_id", value=candidate_id))
+        if model is not None:
+            delete_filters.append("model = :model")
+            embedding_filter = "WHERE e.model = :model"
+            params.append(bindparam("model", value=model))
+
+        delete_where = f"WHERE {' AND '.join(delete_filters)}" if delete_filters else ""
+        self.session.execute(
+            text(f"DELETE FROM candidate_vectors {delete_where}").bindparams(*params)
+        )
+        result = self.session.execute(
+            text(
+                f"""
+                INSERT INTO candidate_vectors (
+                    candidate_id, resume_id, model, dimensions, vector, section_count, updated_at
+                )
+                SELECT l.candidate_id, l.id, e.model, e.dimensions, AVG(e.vector), COUNT(*), NOW()
+                FROM (
+                    SELECT DISTINCT ON (candidate_id) id, candidate_id
+                    FROM resumes
+                    {resume_filter}
+                    ORDER BY candidate_id, created_at DESC, id DESC
+                ) l
+                JOIN resume_sections rs ON rs.resume_id = l.id
+                JOIN embeddings e ON e.owner_id = rs.id
+                {embedding_filter}
+                GROUP BY l.candidate_id, l.id, e.model, e.dimensions
+                """
+            ).bindparams(*params)
+        )
+        self.session.flush()
+        return int(result.rowcount or 0)
+
+
+@dataclass
+class JobVectorRepository:
+    """Repository for maintaining job description vectors used by reverse matching."""
+
+    session: Session
+
+    def upsert(self, *, job_id: int, model: str, vector: list[float], text_hash: str) -> None:
+        """Inserts or replaces the vector of one job for one model.
+
+        Args:
+            job_id (int): Job identifier.
+            model (str): Provider/model identifier used to generate the vector.
+            vector (list[float]): Embedding of the job description.
+            text_hash (str): SHA-256 hex digest of the embedded description.
+
+        Raises:
+            ValueError: When the vector is empty or its dimension does not match
+                the registered model.
+        """
+        dimensions = len(vector)
+        if dimensions <= 0:
+            raise ValueError("Embedding vector must contain at least one dimension")
+        _register_embedding_model(self.session, model=model, dimensions=dimensions)
+
+        values = {
+            "dimensions": dimensions,
+            "vector": vector,
+            "text_hash": text_hash,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        stmt = pg_insert(models.JobVector).values(job_id=job_id, model=model, **values)
+        self.session.execute(
+            stmt.on_conflict_do_update(index_elements=["job_id", "model"], set_=values)
+        )
+        self.session.flush()
+
+    def get_job_ids(self, *, model: str) -> set[int]:
+        """Returns the ids of jobs that already have a vector for ``model``."""
+        return set(
+            self.session.scalars(
+                select(models.JobVector.job_id).where(models.JobVector.model == model)
+            )
+        )
+
+
+@dataclass
+class QueryEmbeddingRepository:
+    """Repository for querying and persisting cached query embedding rows."""
+
+    session: Session
+
+    def get(
+        self, *, text_hash: str, model: str, dimensions: int | None = None
+    ) -> models.QueryEmbedding | None:
+        """Finds a cached query embedding by text hash and model.
+
+        Args:
+            text_hash (str): SHA-256 hex digest of the embedded query text.
+            model (str): Provider/model identifier the vector belongs to.
+            dimensions (int | None): Optional dimension filter for the model space.
+
+        Returns:
+            models.QueryEmbedding | None: Cached row, or ``None`` on a miss.
+        """
+        stmt = (
+            select(models.QueryEmbedding)
+            .where(models.QueryEmbedding.text_hash == text_hash)
+            .where(models.QueryEmbedding.model == model)
+        )
+        if dimensions is not None:
+            stmt = stmt.where(models.QueryEmbedding.dimensions == dimensions)
+        return self.session.scalar(stmt.order_by(models.QueryEmbedding.created_at.desc()).limit(1))
+
+    def put(self, *, text_hash: str, model: str, vector: list[float]) -> None:
+        """Stores one query embedding, ignoring rows that already exist for the key.
+
+        Args:
+            text_hash (str): SHA-256 hex digest of the embedded query text.
+            model (str): Provider/model identifier the vector belongs to.
+            vector (list[float]): Embedding vector payload.
+        """
+        dimensions = len(vector)
+        if dimensions <= 0:
+            raise ValueError("Query embedding vector must contain at least one dimension")
+        stmt = (
+            pg_insert(models.QueryEmbedding)
+            .values(text_hash=text_hash, model=model, dimensions=dimensions, vector=vector)
+            .on_conflict_do_nothing(index_elements=["text_hash", "model", "dimensions"])
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+
+
+@dataclass
+class RerankCacheRepository:
+    """Repository for querying and persisting content-addressed rerank cache rows."""
+
+    session: Session
+
+    def get(self, *, cache_key: str) -> models.RerankCacheEntry | None:
+        """Finds a cached rerank payload by its content hash.
+
+        Args:
+            cache_key (str): SHA-256 hex digest of the cached call's inputs.
+
+        Returns:
+            models.RerankCacheEntry | None: Cached row, or ``None`` on a miss.
+        """
+        return self.session.scalar(
+            select(models.RerankCacheEntry).where(models.RerankCacheEntry.cache_key == cache_key)
+        )
+
+    def put(
+        self,
+        *,
+        cache_key: str,
+        kind: str,
+        model_alias: str,
+        prompt_version: str,
+        payload: dict,
+    ) -> None:
+        """Stores one rerank payload, ignoring rows that already exist for the key.
+
+        Args:
+            cache_key (str): SHA-256 hex digest of the cached call's inputs.
+            kind (str): Payload kind, e.g. ``"explanation"`` or ``"interview_pack"``.
+            model_alias (str): Model alias that produced the payload.
+            prompt_version (str): Version of the prompt that produced the payload.
+            payload (dict): JSON-serializable structured response.
+        """
+        stmt = (
+            pg_insert(models.RerankCacheEntry)
+            .values(
+                cache_key=cache_key,
+                kind=kind,
+                model_alias=model_alias,
+                prompt_version=prompt_version,
+                payload=payload,
+            )
+            .on_conflict_do_nothing(index_elements=["cache_key"])
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+
+
+@dataclass
+class SkillEmbeddingRepository:
+    """Repository for querying and persisting cached skill embedding rows."""
+
+    session: Session
+
+    def get_many(self, *, skill_texts: list[str], model: str) -> dict[str, list[float]]:
+        """Returns cached vectors for the given normalized skill texts.
+
+        Args:
+            skill_texts (list[str]): Normalized skill texts to look up.
+            model (str): Provider/model identifier the vectors must belong to.
+
+        Returns:
+            dict[str, list[float]]: Vectors keyed by skill text; misses are absent.
+        """
+        if not skill_texts:
+            return {}
+        rows = self.session.execute(
+            select(models.SkillEmbedding.skill_text, models.SkillEmbedding.vector)
+            .where(models.SkillEmbedding.model == model)
+            .where(models.SkillEmbedding.skill_text.in_(skill_texts))
+        ).all()
+        return {skill_text: [float(v) for v in vector] for skill_text, vector in rows}
+
+    def put_many(self, *, vectors: dict[str, list[float]], model: str) -> None:
+        """Stores skill vectors, ignoring rows that already exist for the key.
+
+        Args:
+            vectors (dict[str, list[float]]): Vectors keyed by normalized skill text.
+            model (str): Provider/model identifier the vectors belong to.
+        """
+        if not vectors:
+            return
+        stmt = (
+            pg_insert(models.SkillEmbedding)
+            .values(
+                [
+                    {
+                        "skill_text": skill_text,
+                        "model": model,
+                        "dimensions": len(vector),
+                        "vector": vector,
+                    }
+                    for skill_text, vector in vectors.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["skill_text", "model"])
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+
 
 @dataclass
 class MatchRepository:
@@ -456,6 +956,116 @@ class MatchRepository:
             .where(models.Match.candidate_id == candidate_id)
         )
 
+    def get_by_job(self, job_id: int) -> dict[int, models.Match]:
+        """Returns every match of one job keyed by candidate id.
+
+        Args:
+            job_id (int): Job identifier.
+
+        Returns:
+            dict[int, models.Match]: Matching records keyed by candidate id.
+        """
+        matches = self.session.scalars(
+            select(models.Match).where(models.Match.job_id == job_id)
+        ).all()
+        return {match.candidate_id: match for match in matches}
+
+    def get_by_job_and_candidates(
+        self, job_id: int, candidate_ids: list[int]
+    ) -> dict[int, models.Match]:
+        """Finds existing matches of one job for many candidates in one query.
+
+        Args:
+            job_id (int): Job identifier.
+            candidate_ids (list[int]): Candidate identifiers.
+
+        Returns:
+            dict[int, models.Match]: Matching records keyed by candidate id.
+        """
+        if not candidate_ids:
+            return {}
+        matches = self.session.scalars(
+            select(models.Match)
+            .where(models.Match.job_id == job_id)
+            .where(models.Match.candidate_id.in_(candidate_ids))
+        ).all()
+        return {match.candidate_id: match for match in matches}
+
+    def upsert_many(self, job_id: int, rows: list[dict]) -> None:
+        """Inserts or updates the matches of one job in a single statement.
+
+        Uses ``INSERT ... ON CONFLICT (job_id, candidate_id) DO UPDATE``. Scores
+        and reasons are overwritten; a ``None`` retrieval score or interview
+        pack keeps the stored value. Match objects already loaded in the
+        session are not refreshed.
+
+        Args:
+            job_id (int): Job identifier.
+            rows (list[dict]): One mapping per candidate with ``candidate_id``,
+                ``retrieval_score``, ``rerank_score``, ``final_score``,
+                ``reasons_json`` and ``interview_pack_json``.
+        """
+        if not rows:
+            return
+        # SQL NULL rather than JSON 'null', so COALESCE keeps the stored pack.
+        values = [
+            {
+                **row,
+                "job_id": job_id,
+                "interview_pack_json": (
+                    row["interview_pack_json"]
+                    if row.get("interview_pack_json") is not None
+                    else null()
+                ),
+            }
+            for row in rows
+        ]
+        stmt = pg_insert(models.Match).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["job_id", "candidate_id"],
+            set_={
+                "retrieval_score": func.coalesce(
+                    stmt.excluded.retrieval_score, models.Match.retrieval_score
+                ),
+                "rerank_score": stmt.excluded.rerank_score,
+                "final_score": stmt.excluded.final_score,
+                "reasons_json": stmt.excluded.reasons_json,
+                "interview_pack_json": func.coalesce(
+                    stmt.excluded.interview_pack_json, models.Match.interview_pack_json
+                ),
+            },
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+
+    def upsert_reverse_matches(self, rows: list[dict]) -> None:
+        """Writes deterministic scores computed for a new resume across several jobs.
+
+        Rows are inserted with ``INSERT ... ON CONFLICT (job_id, candidate_id)``;
+        an existing row is only overwritten when it came from reverse matching
+        too (``reasons_json.source == "reverse_match"``), so a reranked match is
+        never replaced by a cheaper score.
+
+        Args:
+            rows (list[dict]): One mapping per job with ``job_id``,
+                ``candidate_id``, ``retrieval_score``, ``final_score`` and
+                ``reasons_json``.
+        """
+        if not rows:
+            return
+        stmt = pg_insert(models.Match).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["job_id", "candidate_id"],
+            set_={
+                "retrieval_score": stmt.excluded.retrieval_score,
+                "final_score": stmt.excluded.final_score,
+                "reasons_json": stmt.excluded.reasons_json,
+            },
+            where=models.Match.reasons_json["source"].astext == REVERSE_MATCH_SOURCE,
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+
 
 @dataclass
 class TaskRepository:
@@ -524,3 +1134,50 @@ class TaskRepository:
 
         self.session.flush()
         return task
+
+
+@dataclass
+class RankingWatermarkRepository:
+    """Repository for querying and persisting per-job ranking watermarks."""
+
+    session: Session
+
+    def get(self, job_id: int) -> models.RankingWatermark | None:
+        """Returns the watermark of one job, if it was ever ranked incrementally.
+
+        Args:
+            job_id (int): Job identifier.
+
+        Returns:
+            models.RankingWatermark | None: Stored watermark, if any.
+        """
+        return self.session.get(models.RankingWatermark, job_id)
+
+    def upsert(
+        self,
+        *,
+        job_id: int,
+        requirements_hash: str,
+        top_k: int,
+        resume_watermark: tuple[datetime, int] | None,
+    ) -> None:
+        """Inserts or replaces the watermark of one job.
+
+        Args:
+            job_id (int): Job identifier.
+            requirements_hash (str): Hash of the job text and requirements ranked against.
+            top_k (int): Number of persisted top ranks.
+            resume_watermark (tuple[datetime, int] | None): ``(created_at, id)``
+                of the newest resume covered by the run.
+        """
+        created_at, resume_id = resume_watermark or (None, None)
+        values = {
+            "requirements_hash": requirements_hash,
+            "top_k": top_k,
+            "resume_created_at": created_at,
+            "resume_id": resume_id,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        stmt = pg_insert(models.RankingWatermark).values(job_id=job_id, **values)
+        self.session.execute(stmt.on_conflict_do_update(index_elements=["job_id"], set_=values))
+        self.session.flush()
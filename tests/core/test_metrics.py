@@ -0,0 +1,45 @@
+from src.core.metrics import CacheStats, PruningStats, StageStats
+
+
+def test_cache_stats_snapshot_and_reset() -> None:
+    stats = CacheStats()
+    stats.record_hit()
+    stats.record_hit()
+    stats.record_miss()
+
+    assert stats.snapshot() == {"hits": 2, "misses": 1, "hit_ratio": 0.6667}
+
+    stats.reset()
+    assert stats.snapshot() == {"hits": 0, "misses": 0, "hit_ratio": 0.0}
+
+
+def test_pruning_stats_snapshot_and_reset() -> None:
+    stats = PruningStats()
+    stats.record(evaluated=3, pruned=1)
+    stats.record(evaluated=1, pruned=0)
+
+    assert stats.snapshot() == {"evaluated": 4, "pruned": 1, "pruned_ratio": 0.2}
+
+    stats.reset()
+    assert stats.snapshot() == {"evaluated": 0, "pruned": 0, "pruned_ratio": 0.0}
+
+
+def test_stage_stats_snapshot_and_reset() -> None:
+    stats = StageStats()
+    stats.record(started=10.0, finished=10.5)
+    stats.record(started=10.5, finished=12.0, failed=True)
+    stats.record_queue_depth(3)
+    stats.record_queue_depth(1)
+
+    assert stats.snapshot() == {
+        "processed": 2,
+        "failed": 1,
+        "busy_seconds": 2.0,
+        "throughput_per_second": 1.0,
+        "queue_depth": 1,
+        "max_queue_depth": 3,
+    }
+
+    stats.reset()
+    assert stats.snapshot()["processed"] == 0
+    assert stats.snapshot()["throughput_per_second"] == 0.0
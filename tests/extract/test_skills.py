@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+
+from src.extract.skills import (
+    SkillRegistry,
+    normalize_candidate_signals,
+    normalize_job_requirements,
+    normalize_skill_text,
+)
+from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.batch import score_rank_inputs
+from src.ranking.service import RankingService
+from src.ranking.types import RankInput
+
+REPO_CONFIG = Path(__file__).resolve().parents[2] / "config" / "skill_aliases.yaml"
+
+
+@pytest.fixture
+def registry() -> SkillRegistry:
+    return SkillRegistry(REPO_CONFIG)
+
+
+def test_normalize_skill_text_folds_case_accents_and_separators() -> None:
+    assert normalize_skill_text("  Aprendizaje   Automático ") == "aprendizaje automatico"
+    assert normalize_skill_text("scikit-learn") == "scikit learn"
+    assert normalize_skill_text("(C++)") == "c++"
+
+
+def test_registry_maps_aliases_and_spanish_variants_to_canonical_ids(
+    registry: SkillRegistry,
+) -> None:
+    assert registry.normalize("Postgres") == "postgresql"
+    assert registry.normalize("PostgreSQL") == "postgresql"
+    assert registry.normalize("k8s") == "kubernetes"
+    assert registry.normalize("Aprendizaje automático") == "machine_learning"
+    assert registry.normalize("Machine Learning") == "machine_learning"
+    assert registry.normalize("Elixir") == "elixir"
+    assert registry.normalize_many(["K8s", "Kubernetes", " ", "Postgres"]) == [
+        "kubernetes",
+        "postgresql",
+    ]
+    assert registry.label("kubernetes") == "Kubernetes"
+
+
+def test_registry_rejects_spelling_claimed_by_two_skills(tmp_path: Path) -> None:
+    config = tmp_path / "skills.yaml"
+    config.write_text(
+        "terraform:\n  aliases: [tf]\ntensorflow:\n  aliases: [TF]\n", encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="claimed by both 'terraform' and 'tensorflow'"):
+        SkillRegistry(config)
+
+
+def test_normalized_fields_are_hidden_from_llm_schema(registry: SkillRegistry) -> None:
+    assert "normalized_hard_skills" not in JobRequirements.model_json_schema()["properties"]
+    assert "normalized_skills" not in CandidateSignals.model_json_schema()["properties"]
+
+    requirements = normalize_job_requirements(
+        JobRequirements(hard_skills=["Postgres", "k8s"]), registry
+    )
+    assert requirements.model_dump()["normalized_hard_skills"] == ["kubernetes", "postgresql"]
+
+
+def test_scoring_matches_skills_through_canonical_ids(registry: SkillRegistry) -> None:
+    rank_input = RankInput(
+        candidate_id=1,
+        retrieval_score=0.5,
+        requirements=normalize_job_requirements(
+            JobRequirements(hard_skills=["Postgres", "k8s", "Rust"]), registry
+        ),
+        signals=normalize_candidate_signals(
+            CandidateSignals(skills=["PostgreSQL", "Kubernetes"]), registry
+        ),
+    )
+
+    breakdown = RankingService()._deterministic_score(rank_input)
+
+    # Canonical ids are only used for matching; users see the job's own skill text.
+    assert breakdown.matched_hard_skills == ["k8s", "postgres"]
+    assert breakdown.missing_hard_skills == ["rust"]
+    assert score_rank_inputs([rank_input])[0].scores == breakdown
@@ -0,0 +1,223 @@
+"""Tests for the parallel ingestion engine."""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.ingest.engine import IngestionEngine
+from src.ingest.entities import ParsedResume
+from src.ingest.fingerprint import FileFingerprint, fingerprint_file
+from src.ingest.service import IngestionResult
+
+
+def _parsed(path: Path) -> ParsedResume:
+    return ParsedResume(
+        source_file=str(path),
+        raw_text=path.stem,
+        clean_text=path.stem,
+        links=[],
+        sections={},
+        section_items=[],
+        language="en",
+        parser_version="test",
+    )
+
+
+class _StemParser:
+    """Picklable parser, so it can run in parser processes."""
+
+    def parse(self, path: Path, sha256: str | None = None) -> ParsedResume:
+        if path.stem == "broken":
+            raise ValueError("unreadable pdf")
+        return _parsed(path)
+
+
+class _FakeSession:
+    open_now = 0
+    peak = 0
+    commits = 0
+    lock = threading.Lock()
+
+    def __init__(self) -> None:
+        with _FakeSession.lock:
+            _FakeSession.open_now += 1
+            _FakeSession.peak = max(_FakeSession.peak, _FakeSession.open_now)
+
+    def commit(self) -> None:
+        with _FakeSession.lock:
+            _FakeSession.commits += 1
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        with _FakeSession.lock:
+            _FakeSession.open_now -= 1
+
+
+class _FakeService:
+    def __init__(self) -> None:
+        self.parser = _StemParser()
+        self.analyzed: list[str] = []
+        self.known_sha256: set[str] = set()
+
+    def parse_pdf(self, path: Path, sha256: str | None = None) -> ParsedResume:
+        return self.parser.parse(path, sha256=sha256)
+
+    def find_existing_file(  # noqa: ANN001
+        self, path: Path, session
+    ) -> tuple[IngestionResult | None, FileFingerprint | None]:
+        if path.stem.startswith("seen"):
+            return IngestionResult(status="skipped_existing_resume", source_file=str(path)), None
+        fingerprint = fingerprint_file(path)
+        if fingerprint is not None and fingerprint.sha256 in self.known_sha256:
+            return IngestionResult(status="skipped_existing_content", source_file=str(path)), None
+        return None, fingerprint
+
+    def find_existing(  # noqa: ANN001
+        self, parsed: ParsedResume, session
+    ) -> IngestionResult | None:
+        time.sleep(0.01)
+        if parsed.raw_text.startswith("known"):
+            return IngestionResult(
+                status="skipped_existing_resume", source_file=parsed.source_file, resume_id=7
+            )
+        return None
+
+    def analyze(self, parsed: ParsedResume) -> SimpleNamespace:
+        time.sleep(0.01)
+        self.analyzed.append(parsed.raw_text)
+        return SimpleNamespace(parsed=parsed)
+
+    def persist(  # noqa: ANN001
+        self, analyzed: SimpleNamespace, session, fingerprint=None
+    ) -> IngestionResult:
+        if analyzed.parsed.raw_text == "conflict":
+            raise RuntimeError("duplicate key")
+        return IngestionResult(
+            status="ingested", source_file=analyzed.parsed.source_file, candidate_id=1, resume_id=2
+        )
+
+
+def _engine(service: _FakeService, parse_workers: int, queue_size: int = 4) -> IngestionEngine:
+    _FakeSession.open_now = _FakeSession.peak = _FakeSession.commits = 0
+    return IngestionEngine(
+        service=service,  # type: ignore[arg-type]
+        session_factory=_FakeSession,  # type: ignore[arg-type]
+        parse_workers=parse_workers,
+        llm_workers=4,
+        db_sessions=2,
+        queue_size=queue_size,
+    )
+
+
+def test_engine_keeps_file_order_and_isolates_failures() -> None:
+    service = _FakeService()
+    files = [Path(f"/tmp/{stem}.pdf") for stem in ("a", "known", "broken", "conflict", "b")]
+
+    engine = _engine(service, parse_workers=0)
+
+    results = engine.ingest_files(files)
+
+    assert [row["source_file"] for row in results] == [str(path) for path in files]
+    assert [row["status"] for row in results] == [
+        "ingested",
+        "skipped_existing_resume",
+        "error",
+        "error",
+        "ingested",
+    ]
+    assert results[2]["error"] == "unreadable pdf"
+    assert results[1]["resume_id"] == 7
+    # Known files never reach the LLM-bound stage.
+    assert sorted(service.analyzed) == ["a", "b", "conflict"]
+    assert _FakeSession.commits == 2
+    assert _FakeSession.peak <= 2
+    assert _FakeSession.open_now == 0
+
+    metrics = engine.metrics()
+    assert metrics["parse"]["processed"] == 5
+    assert metrics["parse"]["failed"] == 1
+    assert metrics["dedupe"]["processed"] == 4
+    assert metrics["analyze"]["processed"] == 3
+    assert metrics["persist"]["processed"] == 3
+    assert metrics["persist"]["failed"] == 1
+
+
+def test_slow_analysis_applies_back_pressure_to_parsing() -> None:
+    class SlowAnalysis(_FakeService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.parsed = 0
+            self.peak_backlog = 0
+            self.lock = threading.Lock()
+
+        def parse_pdf(self, path: Path) -> ParsedResume:
+            with self.lock:
+                self.parsed += 1
+                self.peak_backlog = max(self.peak_backlog, self.parsed - len(self.analyzed))
+            return super().parse_pdf(path)
+
+        def analyze(self, parsed: ParsedResume) -> SimpleNamespace:
+            time.sleep(0.02)
+            with self.lock:
+                self.analyzed.append(parsed.raw_text)
+            return SimpleNamespace(parsed=parsed)
+
+    service = SlowAnalysis()
+    files = [Path(f"/tmp/resume_{i}.pdf") for i in range(40)]
+    engine = _engine(service, parse_workers=0, queue_size=1)
+
+    streamed = list(engine.stream(files))
+
+    assert sorted(record.index for record in streamed) == list(range(40))
+    assert all(record.result is not None for record in streamed)
+    # Bounded by queue capacities plus items held by workers, not by the file count.
+    assert service.peak_backlog <= 12
+    assert engine.metrics()["analyze"]["max_queue_depth"] <= 1
+
+
+def test_engine_parses_in_worker_processes() -> None:
+    service = _FakeService()
+    files = [Path(f"/tmp/resume_{i}.pdf") for i in range(6)] + [Path("/tmp/broken.pdf")]
+
+    results = _engine(service, parse_workers=2).ingest_files(files)
+
+    assert [row["status"] for row in results] == ["ingested"] * 6 + ["error"]
+    assert sorted(service.analyzed) == [f"resume_{i}" for i in range(6)]
+
+
+def test_known_and_duplicate_files_are_never_parsed(tmp_path: Path) -> None:
+    class RecordingService(_FakeService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.parse_calls: list[tuple[str, str | None]] = []
+
+        def parse_pdf(self, path: Path, sha256: str | None = None) -> ParsedResume:
+            self.parse_calls.append((path.name, sha256))
+            return super().parse_pdf(path, sha256=sha256)
+
+    service = RecordingService()
+    paths = {name: tmp_path / f"{name}.pdf" for name in ("seen", "stored", "new", "copy")}
+    # A changed file at a known path is still skipped by the path check.
+    paths["seen"].write_bytes(b"%PDF changed")
+    paths["stored"].write_bytes(b"%PDF stored")
+    paths["new"].write_bytes(b"%PDF new")
+    paths["copy"].write_bytes(b"%PDF new")
+    service.known_sha256.add(fingerprint_file(paths["stored"]).sha256)
+
+    engine = _engine(service, parse_workers=0)
+    results = engine.ingest_files(list(paths.values()))
+
+    assert [row["status"] for row in results] == [
+        "skipped_existing_resume",
+        "skipped_existing_content",
+        "ingested",
+        "skipped_existing_content",
+    ]
+    # Only the new file is parsed, reusing the digest computed by the fingerprint stage.
+    assert service.parse_calls == [("new.pdf", fingerprint_file(paths["new"]).sha256)]
+    metrics = engine.metrics()
+    assert metrics["fingerprint"]["processed"] == 4
+    assert metrics["parse"]["processed"] == 1
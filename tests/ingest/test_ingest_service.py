@@ -1,11 +1,13 @@
+from contextlib import nullcontext
 from pathlib import Path
 from types import SimpleNamespace
 
 from pydantic import BaseModel
 
+from src.ingest.fingerprint import fingerprint_file, stat_file
 from src.ingest.parser import PDFResumeParser
 from src.ingest.service import IngestionService
-from src.extract.types import CandidateSignals
+from src.extract.types import CandidateSignals, JobRequirements
 from src.llm.types import LLMCallMetadata, LLMUsage
 
 
@@ -22,6 +24,65 @@ def test_discover_pdf_files_finds_nested(tmp_path: Path) -> None:
     assert [path.name for path in files] == ["a.pdf", "b.pdf"]
 
 
+def test_discover_pdf_files_drops_known_files_before_parsing(monkeypatch, tmp_path: Path) -> None:
+    unchanged = tmp_path / "unchanged.pdf"
+    copied = tmp_path / "copied.pdf"
+    fresh = tmp_path / "fresh.pdf"
+    for path, body in ((unchanged, "one"), (copied, "two"), (fresh, "three")):
+        path.write_text(body, encoding="utf-8")
+    copied_fingerprint = fingerprint_file(copied)
+    hashed: list[str] = []
+
+    class FakeResumeRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def get_source_stats(self, source_files):
+            return {str(unchanged): {stat_file(unchanged)}}
+
+        def get_known_source_fingerprints(self, fingerprints):
+            hashed.extend(sha256 for sha256, _ in fingerprints)
+            return {(copied_fingerprint.sha256, copied_fingerprint.size)}
+
+    monkeypatch.setattr("src.ingest.service.ResumeRepository", FakeResumeRepository)
+
+    files = IngestionService().discover_pdf_files(tmp_path, session=object())
+
+    assert files == [fresh]
+    # Unchanged files are recognized by size and mtime alone, without hashing.
+    assert len(hashed) == 2
+
+
+def test_ingest_skips_identical_bytes_before_parsing(monkeypatch, tmp_path: Path) -> None:
+    resume = tmp_path / "renamed.pdf"
+    resume.write_text("same bytes", encoding="utf-8")
+    expected = fingerprint_file(resume)
+
+    class FakeResumeRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def get_by_source_file(self, source_file):
+            return None
+
+        def get_by_source_fingerprint(self, sha256, size):
+            if (sha256, size) == (expected.sha256, expected.size):
+                return SimpleNamespace(id=11, candidate_id=3)
+            return None
+
+    def fail_parse(path):
+        raise AssertionError("known files must not be parsed")
+
+    monkeypatch.setattr("src.ingest.service.ResumeRepository", FakeResumeRepository)
+    service = IngestionService()
+    monkeypatch.setattr(service, "parse_pdf", fail_parse)
+
+    result = service.ingest_pdf(resume, session=object())
+
+    assert result.status == "skipped_existing_content"
+    assert (result.candidate_id, result.resume_id) == (3, 11)
+
+
 def test_candidate_external_id_is_deterministic(tmp_path: Path) -> None:
     resume = tmp_path / "resume.pdf"
     resume.write_text("x", encoding="utf-8")
@@ -125,7 +186,9 @@ def test_ingest_links_multiple_resumes_to_same_candidate(monkeypatch) -> None:
         def __init__(self, session):
             self.session = session
 
-        def create(self, *, resume_id, section_type, content, metadata_json=None, tokens=None):
+        def create(
+            self, *, resume_id, section_type, content, metadata_json=None, tokens=None, language=None
+        ):
             section = {
                 "resume_id": resume_id,
                 "section_type": section_type,
@@ -240,7 +303,9 @@ def test_ingest_merges_candidate_links(monkeypatch) -> None:
         def __init__(self, session):
             self.session = session
 
-        def create(self, *, resume_id, section_type, content, metadata_json=None, tokens=None):
+        def create(
+            self, *, resume_id, section_type, content, metadata_json=None, tokens=None, language=None
+        ):
             return type("Section", (), {"resume_id": resume_id})
 
     monkeypatch.setattr("src.ingest.service.CandidateRepository", FakeCandidateRepository)
@@ -357,7 +422,9 @@ def test_section_model_promotion_applies_threshold(monkeypatch) -> None:
         def __init__(self, session):
             self.session = session
 
-        def create(self, *, resume_id, section_type, content, metadata_json=None, tokens=None):
+        def create(
+            self, *, resume_id, section_type, content, metadata_json=None, tokens=None, language=None
+        ):
             row = {
                 "resume_id": resume_id,
                 "section_type": section_type,
@@ -460,7 +527,9 @@ def test_ingest_persists_non_skill_section_embeddings(monkeypatch) -> None:
         def __init__(self, session):
             self.session = session
 
-        def create(self, *, resume_id, section_type, content, metadata_json=None, tokens=None):
+        def create(
+            self, *, resume_id, section_type, content, metadata_json=None, tokens=None, language=None
+        ):
             row = {
                 "id": len(_Store.sections) + 1,
                 "resume_id": resume_id,
@@ -484,10 +553,23 @@ def test_ingest_persists_non_skill_section_embeddings(monkeypatch) -> None:
             _Store.embeddings.append(row)
             return type("Embedding", (), row)
 
+    class FakeCandidateVectorRepository:
+        refreshed: list[tuple[int, str]] = []
+
+        def __init__(self, session):
+            self.session = session
+
+        def refresh(self, *, candidate_id=None, model=None):
+            self.refreshed.append((candidate_id, model))
+            return 1
+
     monkeypatch.setattr("src.ingest.service.CandidateRepository", FakeCandidateRepository)
     monkeypatch.setattr("src.ingest.service.ResumeRepository", FakeResumeRepository)
     monkeypatch.setattr("src.ingest.service.ResumeSectionRepository", FakeResumeSectionRepository)
     monkeypatch.setattr("src.ingest.service.EmbeddingRepository", FakeEmbeddingRepository)
+    monkeypatch.setattr(
+        "src.ingest.service.CandidateVectorRepository", FakeCandidateVectorRepository
+    )
 
     service = IngestionService(
         llm_client=FakeLLM(),
@@ -498,6 +580,7 @@ def test_ingest_persists_non_skill_section_embeddings(monkeypatch) -> None:
 
     result = service.ingest_pdf(Path("/tmp/resume_embeddings.pdf"), session=object())
     assert result.status == "ingested"
+    assert FakeCandidateVectorRepository.refreshed == [(1, "openai/text-embedding-3-small")]
     assert len(_Store.embeddings) == 1
     assert _Store.embeddings[0]["owner_id"] == 1
     assert _Store.embeddings[0]["model"] == "openai/text-embedding-3-small"
@@ -576,7 +659,9 @@ def test_ingest_soft_fails_when_embedding_call_errors(monkeypatch) -> None:
         def __init__(self, session):
             self.session = session
 
-        def create(self, *, resume_id, section_type, content, metadata_json=None, tokens=None):
+        def create(
+            self, *, resume_id, section_type, content, metadata_json=None, tokens=None, language=None
+        ):
             row = {
                 "id": len(_Store.sections) + 1,
                 "resume_id": resume_id,
@@ -618,3 +703,91 @@ def test_ingest_soft_fails_when_embedding_call_errors(monkeypatch) -> None:
     embedding_meta = _Store.resumes[0].parsed_json["embedding"]
     assert embedding_meta["status"] == "error"
     assert embedding_meta["error_type"] == "RuntimeError"
+
+
+class _SavepointSession:
+    def begin_nested(self):
+        return nullcontext()
+
+
+def test_ingest_job_persists_job_vector_for_reverse_matching(monkeypatch) -> None:
+    class FakeLLM:
+        def embed_with_meta(self, texts, embedding_model_alias):
+            assert texts == ["Senior Python engineer"]
+            meta = LLMCallMetadata(
+                model_alias=embedding_model_alias, selected_model="openai/text-embedding-3-small"
+            )
+            return [[0.1, 0.2]], meta
+
+    class FakeExtractionService:
+        def __init__(self, llm_client):
+            self.llm_client = llm_client
+
+        def extract_job_requirements(self, description):
+            return JobRequirements(hard_skills=["Python"])
+
+    class FakeJobPostingRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def create(self, *, title, description, requirements_json):
+            return SimpleNamespace(id=7)
+
+    upserts: list[dict] = []
+
+    class FakeJobVectorRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def upsert(self, **kwargs):
+            upserts.append(kwargs)
+
+    monkeypatch.setattr("src.ingest.service.ExtractionService", FakeExtractionService)
+    monkeypatch.setattr("src.ingest.service.JobPostingRepository", FakeJobPostingRepository)
+    monkeypatch.setattr("src.ingest.service.JobVectorRepository", FakeJobVectorRepository)
+
+    service = IngestionService(llm_client=FakeLLM())
+    job_id = service.ingest_job("Engineer", "Senior Python engineer", _SavepointSession())
+
+    assert job_id == 7
+    assert len(upserts) == 1
+    assert upserts[0]["job_id"] == 7
+    assert upserts[0]["model"] == "openai/text-embedding-3-small"
+    assert upserts[0]["vector"] == [0.1, 0.2]
+
+
+def test_reverse_match_soft_fails_and_reports_matched_jobs(monkeypatch) -> None:
+    calls: list[dict] = []
+
+    class FakeReverseMatcher:
+        def __init__(self, session):
+            self.session = session
+
+        def match_resume(self, **kwargs):
+            calls.append(kwargs)
+            if kwargs["resume_id"] == 2:
+                raise RuntimeError("job_vectors missing")
+            return [(3, 0.8), (4, 0.6)]
+
+    monkeypatch.setattr("src.ingest.service.ReverseMatcher", FakeReverseMatcher)
+    service = IngestionService(llm_client=object())  # type: ignore[arg-type]
+    embedding_meta = {"status": "ok", "selected_model": "m", "dimensions": 2}
+
+    ok = service._reverse_match(
+        session=_SavepointSession(),  # type: ignore[arg-type]
+        candidate_id=1,
+        resume_id=1,
+        signals=CandidateSignals(skills=["Python"]),
+        embedding_meta=embedding_meta,
+    )
+    failed = service._reverse_match(
+        session=_SavepointSession(),  # type: ignore[arg-type]
+        candidate_id=1,
+        resume_id=2,
+        signals=CandidateSignals(skills=["Python"]),
+        embedding_meta=embedding_meta,
+    )
+
+    assert ok == {"status": "ok", "job_count": 2}
+    assert failed == {"status": "error", "job_count": 0, "error_type": "RuntimeError"}
+    assert calls[0]["model"] == "m" and calls[0]["dimensions"] == 2
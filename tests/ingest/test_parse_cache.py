@@ -0,0 +1,348 @@
+"""Tests for the on-disk markdown parse cache."""
+
+import hashlib
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.ingest.fingerprint import hash_file
+from src.ingest.identity import compute_content_hash
+from src.ingest.parse_cache import MarkdownCache, markdown_cache_key
+from src.ingest.parser import PDFResumeParser
+from src.ingest.service import IngestionService
+from src.llm.types import LLMCallMetadata
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = MarkdownCache(root=tmp_path, max_bytes=20)
+    cache.put("aa01", "x" * 10)
+    cache.put("bb02", "y" * 10)
+    os.utime(tmp_path / "aa" / "aa01.md", (1, 1))
+    os.utime(tmp_path / "bb" / "bb02.md", (2, 2))
+
+    # Reading the older entry makes it the most recently used one.
+    assert cache.get("aa01") == "x" * 10
+    cache.put("cc03", "z" * 10)
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") == "x" * 10
+    assert cache.get("cc03") == "z" * 10
+
+
+def test_cache_scans_the_directory_only_when_over_its_cap(monkeypatch, tmp_path: Path) -> None:
+    scans: list[int] = []
+    entries = MarkdownCache._entries
+
+    def counting_entries(self):
+        scans.append(1)
+        return entries(self)
+
+    monkeypatch.setattr(MarkdownCache, "_entries", counting_entries)
+    cache = MarkdownCache(root=tmp_path, max_bytes=25)
+    for index in range(5):
+        cache.put(f"k{index}", "x" * 5)
+    cache.put("k0", "y" * 5)
+
+    # Only the first write measures the cache; rewrites replace, not add, their size.
+    assert len(scans) == 1
+    assert cache.total_bytes() == 25
+
+    cache.put("k5", "z" * 5)
+
+    assert len(scans) == 2
+    assert cache.total_bytes() <= 25
+
+
+def test_parser_reuses_cached_markdown_per_file_bytes_and_ocr_flags(
+    monkeypatch, tmp_path: Path
+) -> None:
+    source = tmp_path / "resume.pdf"
+    source.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    calls: list[dict] = []
+
+    def fake_to_markdown(_doc, **kwargs):
+        calls.append(kwargs)
+        return "# Experience\nTaught physics"
+
+    monkeypatch.setattr("src.ingest.parser.pymupdf4llm.to_markdown", fake_to_markdown)
+    monkeypatch.setattr("src.ingest.parser.pymupdf.open", lambda _path: object())
+    cache = MarkdownCache(root=tmp_path / "cache", max_bytes=1024)
+    parser = PDFResumeParser(markdown_cache=cache)
+
+    first = parser.parse(source)
+    second = parser.parse(source)
+    PDFResumeParser(markdown_cache=cache, force_ocr=True).extract_markdown(source)
+
+    assert first == second
+    assert [call["force_ocr"] for call in calls] == [False, True]
+
+
+def test_tesseract_fallback_is_cached_under_the_no_ocr_key(monkeypatch, tmp_path: Path) -> None:
+    source = tmp_path / "scan.pdf"
+    source.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    tesseract_installed = False
+
+    def fake_to_markdown(_doc, **kwargs):
+        if kwargs["use_ocr"] and not tesseract_installed:
+            raise RuntimeError("Tesseract is not installed")
+        return "ocr text" if kwargs["use_ocr"] else "embedded text"
+
+    monkeypatch.setattr("src.ingest.parser.pymupdf4llm.to_markdown", fake_to_markdown)
+    monkeypatch.setattr("src.ingest.parser.pymupdf.open", lambda _path: object())
+    cache = MarkdownCache(root=tmp_path / "cache", max_bytes=1024)
+    parser = PDFResumeParser(markdown_cache=cache)
+    sha256 = hash_file(source)
+
+    assert parser.extract_markdown(source) == "embedded text"
+    assert cache.get(parser.markdown_cache_key(sha256)) is None
+    assert cache.get(parser.markdown_cache_key(sha256, use_ocr=False)) == "embedded text"
+
+    tesseract_installed = True
+
+    assert parser.extract_markdown(source) == "ocr text"
+
+
+class _NoEmbeddings:
+    def embed_with_meta(self, texts, embedding_model_alias):
+        raise RuntimeError("embedding provider unavailable")
+
+
+class _RecordingEmbeddings:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_with_meta(self, texts, embedding_model_alias):
+        self.calls.append(list(texts))
+        meta = LLMCallMetadata(model_alias=embedding_model_alias, selected_model="emb-model")
+        return [[0.5, 0.5] for _ in texts], meta
+
+
+def _resume(resume_id: int, source_file: str, source_sha256: str | None, parser_version: str):
+    return SimpleNamespace(
+        id=resume_id,
+        candidate_id=resume_id,
+        source_file=source_file,
+        source_sha256=source_sha256,
+        content_hash="old",
+        parsed_json={"parser_version": parser_version, "section_names": ["general"]},
+        language=None,
+    )
+
+
+def _section(section_id: int, section_type: str, content: str, original_type: str | None = None):
+    return SimpleNamespace(
+        id=section_id,
+        section_type=section_type,
+        content=content,
+        metadata_json={"original_section_type": original_type or section_type},
+        language="en",
+    )
+
+
+def _patch_repositories(monkeypatch, resumes: list, sections: dict, embeddings: list) -> None:
+    """Backs the reparse repositories with in-memory resumes, sections and embeddings."""
+
+    class FakeResumeRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def list_all(self):
+            return resumes
+
+    class FakeResumeSectionRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def list_by_resume(self, resume_id):
+            return list(sections.get(resume_id, []))
+
+        def delete_for_resume(self, resume_id):
+            owned = {section.id for section in sections.get(resume_id, [])}
+            embeddings[:] = [row for row in embeddings if row.owner_id not in owned]
+            return len(sections.pop(resume_id, []))
+
+        def create(self, *, resume_id, section_type, content, metadata_json, tokens, language):
+            section_id = 1 + max(
+                (section.id for rows in sections.values() for section in rows), default=100
+            )
+            section = _section(section_id, section_type, content)
+            section.metadata_json, section.language = metadata_json, language
+            sections.setdefault(resume_id, []).append(section)
+            return section
+
+    class FakeEmbeddingRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def list_by_owner_ids(self, owner_ids):
+            return [row for row in embeddings if row.owner_id in owner_ids]
+
+        def create(self, *, owner_id, model, vector, text_hash):
+            row = SimpleNamespace(
+                owner_id=owner_id, model=model, vector=vector, text_hash=text_hash
+            )
+            embeddings.append(row)
+            return row
+
+    class FakeCandidateVectorRepository:
+        def __init__(self, session):
+            self.session = session
+
+        def refresh(self, *, candidate_id=None, model=None):
+            return 1
+
+    monkeypatch.setattr("src.ingest.service.ResumeRepository", FakeResumeRepository)
+    monkeypatch.setattr("src.ingest.service.ResumeSectionRepository", FakeResumeSectionRepository)
+    monkeypatch.setattr("src.ingest.service.EmbeddingRepository", FakeEmbeddingRepository)
+    monkeypatch.setattr(
+        "src.ingest.service.CandidateVectorRepository", FakeCandidateVectorRepository
+    )
+
+
+def _text_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def test_reparse_resumes_rebuilds_resumes_and_sections_from_cache(
+    monkeypatch, tmp_path: Path
+) -> None:
+    cache = MarkdownCache(root=tmp_path / "cache", max_bytes=1024)
+    parser = PDFResumeParser(parser_version="stage3.v2", markdown_cache=cache)
+    markdown = "# Experience\nTaught physics\n# Skills\nPython https://example.com/jdoe"
+    cache.put(parser.markdown_cache_key("cafe"), markdown)
+    source = tmp_path / "uncached.pdf"
+    source.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    resumes = [
+        _resume(1, "/resumes/cached.pdf", "cafe", "stage3.v1"),
+        _resume(2, "/resumes/current.pdf", "beef", "stage3.v2"),
+        _resume(3, str(source), hash_file(source), "stage3.v1"),
+    ]
+    # Sections stored by the previous parser, which put everything under one heading.
+    sections = {1: [_section(1, "general", markdown)], 3: [_section(3, "general", "old")]}
+    commits: list[int] = []
+    _patch_repositories(monkeypatch, resumes, sections, embeddings=[])
+    service = IngestionService(
+        parser=parser, llm_client=_NoEmbeddings(), enable_section_model_fallback=False
+    )
+    session = SimpleNamespace(
+        flush=lambda: None, commit=lambda: commits.append(1), rollback=lambda: None
+    )
+
+    counts = service.reparse_resumes(session)
+
+    assert counts == {"reparsed": 1, "current": 1, "missing": 1, "failed": 0}
+    assert [section.section_type for section in sections[1]] == ["experience", "skills"]
+    assert {section.language for section in sections[1]} == {"en"}
+    assert [section.content for section in sections[3]] == ["old"]
+    resume = resumes[0]
+    assert resume.parsed_json["parser_version"] == "stage3.v2"
+    assert resume.parsed_json["section_names"] == ["experience", "skills"]
+    assert resume.parsed_json["links"] == ["https://example.com/jdoe"]
+    assert resume.content_hash == compute_content_hash(resume.parsed_json["clean_text"])
+    assert resume.language == "en"
+    # One transaction per processed resume.
+    assert len(commits) == 2
+
+
+def test_reparse_reuses_stored_embeddings_for_unchanged_sections(
+    monkeypatch, tmp_path: Path
+) -> None:
+    cache = MarkdownCache(root=tmp_path / "cache", max_bytes=4096)
+    parser = PDFResumeParser(parser_version="stage3.v2", markdown_cache=cache)
+    markdown = "# Experience\nTaught physics\n# Education\nBSc Physics"
+    cache.put(parser.markdown_cache_key("cafe"), markdown)
+    items = parser.parse_markdown(markdown=markdown, source_file="/r.pdf").section_items
+    resumes = [_resume(1, "/resumes/unchanged.pdf", "cafe", "stage3.v1")]
+    resumes[0].parsed_json["embedding"] = {"status": "ok", "selected_model": "emb-model"}
+    # Stored by the previous parser: same section text, one routed by the classifier.
+    sections = {
+        1: [
+            _section(10, "experience", items[0].content),
+            _section(11, "projects", items[1].content, original_type=items[1].normalized_type),
+        ]
+    }
+    embeddings = [
+        SimpleNamespace(
+            owner_id=section.id,
+            model="emb-model",
+            vector=[0.1 * section.id],
+            text_hash=_text_hash(section.content),
+        )
+        for section in sections[1]
+    ]
+    _patch_repositories(monkeypatch, resumes, sections, embeddings)
+    llm = _RecordingEmbeddings()
+    classified: list[str] = []
+    service = IngestionService(parser=parser, llm_client=llm, enable_section_model_fallback=True)
+    monkeypatch.setattr(
+        service,
+        "_build_llm_fallback_resolver",
+        lambda: SimpleNamespace(classify_section=lambda **kwargs: classified.append(kwargs)),
+    )
+    session = SimpleNamespace(flush=lambda: None, commit=lambda: None, rollback=lambda: None)
+
+    assert service.reparse_resumes(session)["reparsed"] == 1
+
+    # Unchanged text makes no embedding call and keeps the classifier's section type.
+    assert llm.calls == []
+    assert classified == []
+    assert [section.section_type for section in sections[1]] == ["experience", "projects"]
+    assert sorted((row.owner_id, row.vector) for row in embeddings) == [(101, [1.0]), (102, [1.1])]
+    assert resumes[0].parsed_json["embedding"]["vector_count"] == 2
+
+
+def test_reparse_embeds_only_changed_section_text(monkeypatch, tmp_path: Path) -> None:
+    cache = MarkdownCache(root=tmp_path / "cache", max_bytes=4096)
+    parser = PDFResumeParser(parser_version="stage3.v2", markdown_cache=cache)
+    cache.put(
+        parser.markdown_cache_key("cafe"),
+        "# Experience\nTaught physics\n# Education\nMSc Physics",
+    )
+    resumes = [_resume(1, "/resumes/changed.pdf", "cafe", "stage3.v1")]
+    resumes[0].parsed_json["embedding"] = {"status": "ok", "selected_model": "emb-model"}
+    sections = {1: [_section(10, "experience", "Taught physics")]}
+    embeddings = [
+        SimpleNamespace(
+            owner_id=10, model="emb-model", vector=[0.1], text_hash=_text_hash("Taught physics")
+        )
+    ]
+    _patch_repositories(monkeypatch, resumes, sections, embeddings)
+    llm = _RecordingEmbeddings()
+    service = IngestionService(parser=parser, llm_client=llm, enable_section_model_fallback=False)
+    session = SimpleNamespace(flush=lambda: None, commit=lambda: None, rollback=lambda: None)
+
+    assert service.reparse_resumes(session)["reparsed"] == 1
+
+    assert llm.calls == [["MSc Physics"]]
+    assert sorted(row.vector for row in embeddings) == [[0.1], [0.5, 0.5]]
+
+
+def test_reparse_fingerprints_legacy_resumes_when_extracting(monkeypatch, tmp_path: Path) -> None:
+    source = tmp_path / "legacy.pdf"
+    source.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    monkeypatch.setattr(
+        "src.ingest.parser.pymupdf4llm.to_markdown", lambda _doc, **kwargs: "# Skills\nPython"
+    )
+    monkeypatch.setattr("src.ingest.parser.pymupdf.open", lambda _path: object())
+    resumes = [_resume(1, str(source), None, "stage3.v1")]
+    _patch_repositories(monkeypatch, resumes, sections={}, embeddings=[])
+    service = IngestionService(
+        parser=PDFResumeParser(parser_version="stage3.v2"),
+        llm_client=_NoEmbeddings(),
+        enable_section_model_fallback=False,
+    )
+    session = SimpleNamespace(flush=lambda: None, commit=lambda: None, rollback=lambda: None)
+
+    assert service.reparse_resumes(session)["missing"] == 1
+    assert service.reparse_resumes(session, extract_missing=True)["reparsed"] == 1
+    assert resumes[0].source_sha256 == hash_file(source)
+    assert resumes[0].source_size == source.stat().st_size
+    assert resumes[0].parsed_json["section_names"] == ["skills"]
+
+
+def test_cache_key_covers_extractor_version() -> None:
+    base = {"sha256": "cafe", "use_ocr": True, "force_ocr": False}
+
+    assert markdown_cache_key(extractor_version="0.3.4", **base) != markdown_cache_key(
+        extractor_version="0.3.5", **base
+    )
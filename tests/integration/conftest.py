@@ -57,8 +57,11 @@ def mock_default_llm_client() -> Generator[None, None, None]:
         # Also patch where it might have been imported already
         if hasattr(ingest_service, "build_default_llm_client"):
             mp.setattr(ingest_service, "build_default_llm_client", lambda: fake_client)
+        # The shared client is built lazily from the patched factory.
+        llm_factory.reload_shared_llm_client()
 
         yield
+    llm_factory.reload_shared_llm_client()
 
 
 pytest.importorskip("testcontainers.postgres")
@@ -155,7 +158,13 @@ def truncate_tables(integration_db_url):
                     resume_sections,
                     resumes,
                     candidates,
-                    job_postings
+                    job_postings,
+                    query_embeddings,
+                    candidate_vectors,
+                    rerank_cache,
+                    skill_embeddings,
+                    ranking_watermarks,
+                    job_vectors
                 RESTART IDENTITY CASCADE
                 """
             )
@@ -26,9 +26,9 @@ def test_flow_run_report_smoke(monkeypatch, integration_db_url, tmp_path: Path)
     a = tmp_path / "a.pdf"
     b = tmp_path / "b.pdf"
     c = tmp_path / "broken.pdf"
-    a.write_text("x", encoding="utf-8")
-    b.write_text("x", encoding="utf-8")
-    c.write_text("x", encoding="utf-8")
+    a.write_text("a", encoding="utf-8")
+    b.write_text("b", encoding="utf-8")
+    c.write_text("c", encoding="utf-8")
 
     markdown_map = {
         str(a): "# John Doe\njdoe@example.com\n+1 415 555 0100\n# Experience\nA",
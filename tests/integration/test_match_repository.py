@@ -1,5 +1,11 @@
 import pytest
-from src.storage.repositories import MatchRepository, JobPostingRepository, CandidateRepository
+from src.storage.repositories import (
+    CandidateRepository,
+    JobPostingRepository,
+    MatchRepository,
+    RankingWatermarkRepository,
+    ResumeRepository,
+)
 
 
 @pytest.mark.integration
@@ -30,3 +36,97 @@ def test_match_repository_interview_pack(db_session) -> None:
     fetched_match = match_repo.get_by_job_and_candidate(job.id, cand.id)
     assert fetched_match is not None
     assert fetched_match.interview_pack_json["technical_questions"] == ["Q1"]
+
+
+@pytest.mark.integration
+def test_match_repository_upsert_many_updates_in_place_and_keeps_stored_pack(db_session) -> None:
+    job = JobPostingRepository(db_session).create(title="Test Job", description="Test Desc")
+    cand_repo = CandidateRepository(db_session)
+    first = cand_repo.create(name="First")
+    second = cand_repo.create(name="Second")
+    match_repo = MatchRepository(db_session)
+    match_repo.create(
+        job_id=job.id,
+        candidate_id=first.id,
+        final_score=0.1,
+        interview_pack_json={"technical_questions": ["Q1"]},
+    )
+
+    match_repo.upsert_many(
+        job.id,
+        [
+            {
+                "candidate_id": candidate_id,
+                "retrieval_score": 0.5,
+                "rerank_score": 0.1,
+                "final_score": 0.6,
+                "reasons_json": {"rank": rank},
+                "interview_pack_json": None,
+            }
+            for rank, candidate_id in enumerate([first.id, second.id], 1)
+        ],
+    )
+    db_session.expire_all()
+
+    matches = match_repo.get_by_job_and_candidates(job.id, [first.id, second.id])
+    assert set(matches) == {first.id, second.id}
+    assert matches[first.id].final_score == 0.6
+    assert matches[first.id].interview_pack_json == {"technical_questions": ["Q1"]}
+    assert matches[second.id].reasons_json == {"rank": 2}
+    assert matches[second.id].interview_pack_json is None
+
+
+@pytest.mark.integration
+def test_resume_repository_loads_latest_resume_per_candidate(db_session) -> None:
+    cand_repo = CandidateRepository(db_session)
+    first = cand_repo.create(name="First")
+    second = cand_repo.create(name="Second")
+    without_resume = cand_repo.create(name="None")
+    resume_repo = ResumeRepository(db_session)
+    resume_repo.create(first.id, "old.pdf", "h1", "old")
+    newest = resume_repo.create(first.id, "new.pdf", "h2", "new")
+    only = resume_repo.create(second.id, "only.pdf", "h3", "only")
+
+    latest = resume_repo.get_latest_resumes_by_candidate_ids(
+        [first.id, second.id, without_resume.id]
+    )
+
+    assert {cid: r.id for cid, r in latest.items()} == {first.id: newest.id, second.id: only.id}
+
+
+@pytest.mark.integration
+def test_resume_watermark_selects_candidates_with_newer_resumes(db_session) -> None:
+    cand_repo = CandidateRepository(db_session)
+    first = cand_repo.create(name="First")
+    second = cand_repo.create(name="Second")
+    resume_repo = ResumeRepository(db_session)
+    old = resume_repo.create(first.id, "old.pdf", "h1", "old")
+    after_old = (old.created_at, old.id)
+    resume_repo.create(second.id, "new.pdf", "h2", "new")
+
+    watermark = resume_repo.get_resume_watermark()
+
+    assert watermark is not None and watermark > after_old
+    assert resume_repo.get_candidate_ids_with_resumes_between(after_old, watermark) == [
+        second.id
+    ]
+    assert resume_repo.get_candidate_ids_with_resumes_between(None, watermark) == [
+        first.id,
+        second.id,
+    ]
+
+
+@pytest.mark.integration
+def test_ranking_watermark_repository_upserts_per_job(db_session) -> None:
+    job = JobPostingRepository(db_session).create(title="Test Job", description="Test Desc")
+    repo = RankingWatermarkRepository(db_session)
+    assert repo.get(job.id) is None
+
+    repo.upsert(job_id=job.id, requirements_hash="a" * 64, top_k=5, resume_watermark=None)
+    repo.upsert(job_id=job.id, requirements_hash="b" * 64, top_k=3, resume_watermark=None)
+    db_session.expire_all()
+
+    stored = repo.get(job.id)
+    assert stored is not None
+    assert (stored.requirements_hash, stored.top_k) == ("b" * 64, 3)
+    assert stored.resume_id is None
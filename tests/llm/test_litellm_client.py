@@ -173,3 +173,32 @@ def test_generate_structured_raises_structured_output_for_parse_errors(
             schema=ResumeSummary,
             model_alias="summarizer_default",
         )
+
+
+def test_router_for_alias_builds_one_router_per_alias_under_concurrency(
+    monkeypatch, tmp_path: Path
+) -> None:
+    import threading
+
+    builds: list[str] = []
+
+    class FakeRouter:
+        def __init__(self, *, model_list, **_kwargs) -> None:
+            builds.append(model_list[0]["model_name"])
+
+    monkeypatch.setattr(litellm, "Router", FakeRouter)
+    client = LiteLLMClient(_make_registry(tmp_path), timeout_seconds=5, max_retries=1)
+
+    routers: list[object] = []
+
+    def resolve() -> None:
+        routers.append(client._router_for_alias("summarizer_default"))
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert builds == ["summarizer_default"]
+    assert all(router is routers[0] for router in routers)
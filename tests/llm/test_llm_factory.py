@@ -0,0 +1,70 @@
+import threading
+
+from src.llm import factory
+
+
+def test_shared_client_is_built_once_and_reused(monkeypatch) -> None:
+    builds: list[object] = []
+
+    def fake_build(registry: object = None) -> object:  # noqa: ARG001
+        client = object()
+        builds.append(client)
+        return client
+
+    monkeypatch.setattr(factory, "build_default_llm_client", fake_build)
+    monkeypatch.setattr(factory, "ModelAliasRegistry", lambda path: object())  # noqa: ARG005
+    factory.reload_shared_llm_client()
+    try:
+        results: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(factory.get_shared_llm_client()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(builds) == 1
+        assert all(result is builds[0] for result in results)
+    finally:
+        factory.reload_shared_llm_client()
+
+
+def test_reload_rebuilds_client_on_next_access(monkeypatch) -> None:
+    monkeypatch.setattr(
+        factory, "build_default_llm_client", lambda registry=None: object()  # noqa: ARG005
+    )
+    monkeypatch.setattr(factory, "ModelAliasRegistry", lambda path: object())  # noqa: ARG005
+    factory.reload_shared_llm_client()
+    try:
+        first = factory.get_shared_llm_client()
+        assert factory.get_shared_llm_client() is first
+
+        factory.reload_shared_llm_client()
+        assert factory.get_shared_llm_client() is not first
+    finally:
+        factory.reload_shared_llm_client()
+
+
+def test_shared_client_routes_with_the_shared_registry(monkeypatch) -> None:
+    parsed: list[object] = []
+
+    def fake_registry(path: object) -> object:  # noqa: ARG001
+        registry = object()
+        parsed.append(registry)
+        return registry
+
+    monkeypatch.setattr(factory, "ModelAliasRegistry", fake_registry)
+    monkeypatch.setattr(
+        factory, "LiteLLMClient", lambda *, registry, **kwargs: registry  # noqa: ARG005
+    )
+    factory.reload_shared_llm_client()
+    try:
+        registry = factory.get_shared_registry()
+        client_registry = factory.get_shared_llm_client()
+
+        assert parsed == [registry]
+        assert client_registry is registry
+    finally:
+        factory.reload_shared_llm_client()
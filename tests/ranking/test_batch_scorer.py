@@ -0,0 +1,71 @@
+"""Tests for the vectorized deterministic batch scorer."""
+
+import random
+
+import pytest
+
+from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.batch import CandidateSkillMatrix, score_rank_inputs
+from src.ranking.service import RankingService
+from src.ranking.types import RankInput
+
+_SKILLS = ["Python", "SQL", "Docker", "AWS", "Go", "Rust", "Kafka", "Spark", "dbt", "React"]
+
+
+def _reference_top(inputs: list[RankInput], n: int) -> list[tuple[int, float, list, list]]:
+    service = RankingService()
+    scored = [(inp.candidate_id, service._deterministic_score(inp)) for inp in inputs]
+    scored.sort(key=lambda item: item[1].final_score, reverse=True)
+    return [
+        (cid, b.final_score, b.matched_hard_skills, b.missing_hard_skills)
+        for cid, b in scored[:n]
+    ]
+
+
+def _random_inputs(count: int, seed: int) -> list[RankInput]:
+    rng = random.Random(seed)
+    requirements = JobRequirements(hard_skills=["python", "sql", "Kafka", "terraform"])
+    return [
+        RankInput(
+            candidate_id=1000 + i,
+            # Coarse scores so that ties are common.
+            retrieval_score=rng.choice([0.2, 0.4, 0.6, 0.8]),
+            requirements=requirements,
+            signals=CandidateSignals(skills=rng.sample(_SKILLS, rng.randint(0, 5))),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("n", [1, 7, 50, 500])
+def test_batch_scorer_matches_per_candidate_scorer(n: int) -> None:
+    inputs = _random_inputs(500, seed=n)
+
+    ranked = score_rank_inputs(inputs, n)
+
+    assert [
+        (r.candidate_id, r.scores.final_score, r.scores.matched_hard_skills,
+         r.scores.missing_hard_skills)
+        for r in ranked
+    ] == _reference_top(inputs, n)
+    assert [r.rank for r in ranked] == list(range(1, n + 1))
+
+
+def test_batch_scorer_handles_empty_requirements_and_candidates_without_skills() -> None:
+    matrix = CandidateSkillMatrix.build([1, 2], [[], ["Python", "python"]])
+
+    scores, matched = matrix.score(JobRequirements(), [0.4, 0.2])
+    assert scores.tolist() == [0.7, 0.6]
+    assert matched.tolist() == [0, 0]
+
+    scores, matched = matrix.score(JobRequirements(hard_skills=["PYTHON", "go"]), [0.4, 0.2])
+    assert matched.tolist() == [0, 1]
+    assert scores.tolist() == [0.4 * 0.5 + 0.0, 0.2 * 0.5 + 0.5 * 0.5]
+
+
+def test_score_rank_inputs_rejects_mixed_requirements() -> None:
+    inputs = _random_inputs(2, seed=0)
+    inputs[1] = inputs[1].model_copy(update={"requirements": JobRequirements(hard_skills=["go"])})
+
+    with pytest.raises(ValueError, match="share the same job requirements"):
+        score_rank_inputs(inputs)
@@ -0,0 +1,295 @@
+"""Tests for concurrent LLM reranking in RankingService."""
+
+import asyncio
+
+import pytest
+
+from src.core.metrics import PruningStats
+from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.service import RankingService
+from src.ranking.types import (
+    InterviewPrepPack,
+    RankedCandidate,
+    RankExplanation,
+    RankInput,
+    RankSlate,
+    ScoreBreakdown,
+    SlateRankExplanation,
+)
+
+
+def _inputs(count: int) -> list[RankInput]:
+    return [
+        RankInput(
+            candidate_id=i,
+            retrieval_score=1.0 - i * 0.1,
+            requirements=JobRequirements(hard_skills=["python"]),
+            signals=CandidateSignals(skills=["python"], summary=f"candidate-{i}"),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _ranked(inputs: list[RankInput]) -> list[RankedCandidate]:
+    return [
+        RankedCandidate(
+            candidate_id=inp.candidate_id,
+            rank=0,
+            scores=ScoreBreakdown(deterministic_score=0.5, final_score=0.5),
+        )
+        for inp in inputs
+    ]
+
+
+def test_async_rerank_bounds_concurrency_per_alias_and_keeps_order() -> None:
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    class AsyncLLM:
+        async def agenerate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            in_flight[model_alias] = in_flight.get(model_alias, 0) + 1
+            peak[model_alias] = max(peak.get(model_alias, 0), in_flight[model_alias])
+            try:
+                # Later candidates answer first, so ordering must come from assembly.
+                delay = 0.05 if "candidate-1" in prompt else 0.01
+                await asyncio.sleep(delay)
+                if schema is RankExplanation:
+                    return RankExplanation(evidence_based_summary=prompt[-40:])
+                return InterviewPrepPack(technical_questions=["q"])
+            finally:
+                in_flight[model_alias] -= 1
+
+    inputs = _inputs(6)
+    service = RankingService(llm_client=AsyncLLM(), llm_concurrency=2)  # type: ignore[arg-type]
+
+    results = asyncio.run(service.arerank_with_llm(_ranked(inputs), inputs))
+
+    assert len(results) == 6
+    assert all(explanation is not None and pack is not None for _, explanation, pack in results)
+    assert peak["ranker_default"] <= 2
+    assert peak["explainer_default"] <= 2
+
+
+def test_async_rerank_timeout_and_failure_fall_back_to_zero_adjustment() -> None:
+    class SlowOrBrokenLLM:
+        async def agenerate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            if schema is RankExplanation and "candidate-1" in prompt:
+                await asyncio.sleep(1)
+            if schema is RankExplanation and "candidate-2" in prompt:
+                raise RuntimeError("provider down")
+            if schema is RankExplanation:
+                return RankExplanation(evidence_based_summary="ok", llm_adjustment_score=0.1)
+            return InterviewPrepPack()
+
+    inputs = _inputs(3)
+    service = RankingService(
+        llm_client=SlowOrBrokenLLM(), llm_timeout_seconds=0.05  # type: ignore[arg-type]
+    )
+
+    results = asyncio.run(service.arerank_with_llm(_ranked(inputs), inputs))
+
+    assert results[0] == (0.0, None, None)
+    assert results[1] == (0.0, None, None)
+    assert results[2][0] == 0.1
+    assert results[2][1] is not None
+
+
+def test_rank_candidates_applies_async_results_with_sync_only_client() -> None:
+    class SyncLLM:
+        def generate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            if schema is RankExplanation:
+                return RankExplanation(evidence_based_summary="ok", llm_adjustment_score=0.2)
+            return InterviewPrepPack()
+
+    service = RankingService(llm_client=SyncLLM())  # type: ignore[arg-type]
+
+    ranked = service.rank_candidates(_inputs(2), top_k=2)
+
+    assert [c.rank for c in ranked] == [1, 2]
+    assert all(c.scores.llm_adjustment == 0.2 for c in ranked)
+    assert all(c.interview_pack is not None for c in ranked)
+
+
+def test_listwise_rerank_uses_one_call_per_slate_and_falls_back_for_missing() -> None:
+    calls: list[str] = []
+
+    class SlateLLM:
+        async def agenerate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            calls.append(schema.__name__)
+            if schema is RankSlate:
+                # Candidate 2 is dropped and an unknown id is returned instead.
+                return RankSlate(
+                    rankings=[
+                        SlateRankExplanation(
+                            candidate_id=cid,
+                            evidence_based_summary=f"slate-{cid}",
+                            llm_adjustment_score=0.15,
+                        )
+                        for cid in (1, 3, 99)
+                    ]
+                )
+            if schema is RankExplanation:
+                return RankExplanation(
+                    evidence_based_summary="pointwise", llm_adjustment_score=-0.1
+                )
+            return InterviewPrepPack()
+
+    inputs = _inputs(4)
+    service = RankingService(
+        llm_client=SlateLLM(), rerank_mode="listwise", slate_size=3  # type: ignore[arg-type]
+    )
+
+    results = asyncio.run(service.arerank_with_llm(_ranked(inputs), inputs))
+
+    assert [adjustment for adjustment, _, _ in results] == [0.15, -0.1, 0.15, -0.1]
+    assert results[0][1] is not None
+    assert results[0][1].evidence_based_summary == "slate-1"
+    assert results[1][1] is not None
+    assert results[1][1].evidence_based_summary == "pointwise"
+    # One slate call for candidates 1-3, pointwise calls for the dropped candidate and the
+    # single-candidate trailing slate, plus one pack per candidate.
+    assert calls.count("RankSlate") == 1
+    assert calls.count("RankExplanation") == 2
+    assert calls.count("InterviewPrepPack") == 4
+
+
+def test_unknown_rerank_mode_raises() -> None:
+    inputs = _inputs(1)
+    service = RankingService(llm_client=object(), rerank_mode="pairwise")  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="Unknown ranking rerank mode"):
+        asyncio.run(service.arerank_with_llm(_ranked(inputs), inputs))
+
+
+def test_deferred_prep_packs_are_generated_once_and_in_order() -> None:
+    calls: list[str] = []
+
+    class CountingLLM:
+        async def agenerate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            calls.append(schema.__name__)
+            if schema is RankExplanation:
+                return RankExplanation(evidence_based_summary="ok")
+            # Earlier candidates answer last, so ordering must come from assembly.
+            await asyncio.sleep(0.03 if "candidate-1" in prompt else 0.0)
+            return InterviewPrepPack(technical_questions=[prompt.split("candidate-")[1][:1]])
+
+    inputs = _inputs(4)
+    service = RankingService(llm_client=CountingLLM())  # type: ignore[arg-type]
+
+    ranked = service.rank_candidates(inputs, top_k=4, with_prep_packs=False)
+    assert calls.count("InterviewPrepPack") == 0
+    assert all(c.interview_pack is None for c in ranked)
+
+    by_id = {inp.candidate_id: inp for inp in inputs}
+    top = ranked[:2]
+    packs = service.generate_interview_packs(
+        [(by_id[c.candidate_id], c.explanation) for c in top]  # type: ignore[misc]
+    )
+
+    assert calls.count("InterviewPrepPack") == 2
+    assert [p.technical_questions for p in packs] == [  # type: ignore[union-attr]
+        [str(c.candidate_id)] for c in top
+    ]
+
+
+def test_bound_pruning_keeps_exhaustive_top_k_with_fewer_calls() -> None:
+    # Retrieval scores spread deterministic scores over ~0.45; every candidate matches "python".
+    retrieval = {1: 0.95, 2: 0.9, 3: 0.85, 4: 0.8, 5: 0.6, 6: 0.5, 7: 0.3, 8: 0.1, 9: 0.05}
+    adjustment = {1: -0.2, 2: -0.2, 3: 0.2, 4: 0.1, 5: 0.2, 6: 0.2, 7: 0.2, 8: 0.2, 9: 0.2}
+    reranked_ids: list[int] = []
+
+    class BoundedLLM:
+        async def agenerate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            candidate_id = int(prompt.split("candidate-")[1][:1])
+            reranked_ids.append(candidate_id)
+            return RankExplanation(
+                evidence_based_summary="ok", llm_adjustment_score=adjustment[candidate_id]
+            )
+
+    inputs = [
+        RankInput(
+            candidate_id=cid,
+            retrieval_score=score,
+            requirements=JobRequirements(hard_skills=["python"]),
+            signals=CandidateSignals(skills=["python"], summary=f"candidate-{cid}"),
+        )
+        for cid, score in retrieval.items()
+    ]
+    stats = PruningStats()
+    service = RankingService(
+        llm_client=BoundedLLM(),  # type: ignore[arg-type]
+        pruning_stats=stats,
+        max_reranked=len(inputs),
+    )
+
+    ranked = service.rank_candidates(inputs, top_k=3, with_prep_packs=False)
+
+    deterministic = {c.candidate_id: c.scores.deterministic_score for c in ranked}
+    exhaustive = sorted(
+        retrieval, key=lambda cid: deterministic[cid] + adjustment[cid], reverse=True
+    )[:3]
+    assert [c.candidate_id for c in ranked[:3]] == exhaustive
+    assert all(c.explanation is not None for c in ranked[:3])
+    # Candidates 7-9 trail the k-th bound by more than twice the adjustment bound.
+    assert sorted(reranked_ids) == [1, 2, 3, 4, 5, 6]
+    assert stats.snapshot() == {"evaluated": 6, "pruned": 3, "pruned_ratio": 0.3333}
+
+
+def test_rank_candidates_clamps_out_of_bound_adjustments() -> None:
+    class OverconfidentLLM:
+        def generate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            return RankExplanation(evidence_based_summary="ok", llm_adjustment_score=0.9)
+
+    service = RankingService(
+        llm_client=OverconfidentLLM(), pruning_stats=PruningStats()  # type: ignore[arg-type]
+    )
+
+    ranked = service.rank_candidates(_inputs(1), top_k=1, with_prep_packs=False)
+
+    assert ranked[0].scores.llm_adjustment == 0.2
+
+
+def test_rerank_calls_default_to_the_deterministic_top_k() -> None:
+    calls: list[str] = []
+
+    class CountingLLM:
+        def generate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            calls.append(prompt)
+            return RankExplanation(evidence_based_summary="ok", llm_adjustment_score=0.2)
+
+    service = RankingService(
+        llm_client=CountingLLM(), pruning_stats=PruningStats()  # type: ignore[arg-type]
+    )
+
+    ranked = service.rank_candidates(_inputs(8), top_k=2, with_prep_packs=False)
+
+    # Without a configured cap the cascade stops after the first wave, as before pruning.
+    assert len(calls) == 2
+    assert sum(c.explanation is not None for c in ranked) == 2
+
+
+def test_rerank_waves_and_late_packs_share_one_event_loop() -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+    schemas: list[type] = []
+
+    class LoopRecordingLLM:
+        async def agenerate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            loops.append(asyncio.get_running_loop())
+            schemas.append(schema)
+            if schema is RankExplanation:
+                # Negative adjustments keep later candidates viable for another wave.
+                return RankExplanation(evidence_based_summary="ok", llm_adjustment_score=-0.2)
+            return InterviewPrepPack(technical_questions=["q"])
+
+    service = RankingService(
+        llm_client=LoopRecordingLLM(),  # type: ignore[arg-type]
+        pruning_stats=PruningStats(),
+        max_reranked=6,
+    )
+
+    ranked = service.rank_candidates(_inputs(6), top_k=2)
+
+    # Several waves ran and packs were filled in for later waves, all in one loop.
+    assert schemas.count(RankExplanation) > 2
+    assert all(c.interview_pack is not None for c in ranked[:2])
+    assert all(loop is loops[0] for loop in loops)
@@ -40,3 +40,15 @@ def test_interview_prep_pack_shape() -> None:
         clarification_questions=["Can you elaborate on your SQL experience?"],
     )
     assert len(pack.technical_questions) == 1
+
+
+def test_rank_explanation_bounds_llm_adjustment() -> None:
+    """Out-of-bound adjustments are clamped, and the bound is part of the LLM schema."""
+    schema = RankExplanation.model_json_schema()["properties"]["llm_adjustment_score"]
+
+    assert (schema["minimum"], schema["maximum"]) == (-0.2, 0.2)
+    clamped = RankExplanation(evidence_based_summary="x", llm_adjustment_score=0.9)
+    assert clamped.llm_adjustment_score == 0.2
+    assert RankExplanation.model_validate_json(
+        '{"evidence_based_summary": "x", "llm_adjustment_score": -3}'
+    ).llm_adjustment_score == -0.2
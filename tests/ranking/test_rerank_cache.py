@@ -0,0 +1,65 @@
+"""Tests for the content-addressed rerank cache."""
+
+from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.cache import rerank_cache_key
+from src.ranking.service import RankingService
+from src.ranking.types import InterviewPrepPack, RankExplanation, RankInput
+
+
+def _input(candidate_id: int, skills: list[str]) -> RankInput:
+    return RankInput(
+        candidate_id=candidate_id,
+        retrieval_score=0.8,
+        requirements=JobRequirements(hard_skills=["python", "sql"]),
+        signals=CandidateSignals(skills=skills, summary="backend engineer"),
+    )
+
+
+class _MemoryCache:
+    """In-memory stand-in with the same interface as RerankCache."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict] = {}
+
+    def get(self, *, schema, **key_fields):  # noqa: ANN001, ANN003, ANN201
+        payload = self.rows.get(rerank_cache_key(**key_fields))
+        return schema.model_validate(payload) if payload is not None else None
+
+    def put(self, *, value, **key_fields) -> None:  # noqa: ANN001, ANN003
+        self.rows.setdefault(rerank_cache_key(**key_fields), value.model_dump(mode="json"))
+
+
+def test_rerank_cache_key_ignores_ids_but_tracks_content_alias_and_version() -> None:
+    def key(rank_input: RankInput, alias: str = "ranker_default", version: str = "1") -> str:
+        return rerank_cache_key(
+            kind="explanation", model_alias=alias, prompt_version=version, rank_input=rank_input
+        )
+
+    base = key(_input(1, ["python"]))
+
+    assert key(_input(2, ["python"])) == base
+    assert key(_input(1, ["python", "sql"])) != base
+    assert key(_input(1, ["python"]), alias="ranker_strong") != base
+    assert key(_input(1, ["python"]), version="2") != base
+
+
+def test_ranking_service_serves_identical_pairs_from_cache() -> None:
+    calls: list[str] = []
+
+    class CountingLLM:
+        def generate_structured(self, prompt, schema, model_alias, **kwargs):  # noqa: ANN001
+            calls.append(schema.__name__)
+            if schema is RankExplanation:
+                return RankExplanation(evidence_based_summary="ok", llm_adjustment_score=0.1)
+            return InterviewPrepPack(technical_questions=["q"])
+
+    cache = _MemoryCache()
+    service = RankingService(llm_client=CountingLLM(), cache=cache)  # type: ignore[arg-type]
+
+    first = service.rank_candidates([_input(1, ["python"])], top_k=1)
+    # Same content under another candidate id, e.g. a re-ingested resume.
+    second = service.rank_candidates([_input(7, ["python"])], top_k=1)
+
+    assert calls == ["RankExplanation", "InterviewPrepPack"]
+    assert second[0].scores.llm_adjustment == first[0].scores.llm_adjustment == 0.1
+    assert second[0].interview_pack == first[0].interview_pack
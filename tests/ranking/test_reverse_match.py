@@ -0,0 +1,87 @@
+"""Tests for reverse (resume to job) matching."""
+
+from types import SimpleNamespace
+
+from src.extract.types import CandidateSignals, JobRequirements
+from src.ranking.reverse import ReverseMatcher
+
+
+class _FakeRetrieval:
+    def __init__(self, hits: list[tuple[int, float]]) -> None:
+        self.hits = hits
+        self.calls: list[dict] = []
+
+    def top_jobs_for_resume(self, resume_id, *, model, dimensions, k):  # noqa: ANN001
+        self.calls.append({"resume_id": resume_id, "model": model, "k": k})
+        return self.hits
+
+
+class _FakeSession:
+    def __init__(self, jobs: list[SimpleNamespace]) -> None:
+        self.jobs = jobs
+
+    def scalars(self, statement):  # noqa: ANN001
+        return self.jobs
+
+
+def test_match_resume_scores_top_jobs_deterministically(monkeypatch) -> None:
+    stored: list[dict] = []
+
+    class FakeMatchRepository:
+        def __init__(self, session):  # noqa: ANN001
+            self.session = session
+
+        def upsert_reverse_matches(self, rows):  # noqa: ANN001
+            stored.extend(rows)
+
+    monkeypatch.setattr("src.ranking.reverse.MatchRepository", FakeMatchRepository)
+    jobs = [
+        SimpleNamespace(
+            id=1,
+            requirements_json=JobRequirements(
+                hard_skills=["Python", "SQL"], normalized_hard_skills=["python", "sql"]
+            ).model_dump(),
+        ),
+        SimpleNamespace(id=2, requirements_json=None),
+    ]
+    retrieval = _FakeRetrieval(hits=[(1, 0.8), (2, 0.7)])
+    matcher = ReverseMatcher(
+        session=_FakeSession(jobs),  # type: ignore[arg-type]
+        retrieval_service=retrieval,  # type: ignore[arg-type]
+        top_jobs=3,
+    )
+
+    result = matcher.match_resume(
+        candidate_id=5,
+        resume_id=9,
+        signals=CandidateSignals(skills=["Python"], normalized_skills=["python"]),
+        model="m",
+        dimensions=2,
+    )
+
+    assert retrieval.calls == [{"resume_id": 9, "model": "m", "k": 3}]
+    # Job 2 has no extracted requirements and is skipped.
+    assert [row["job_id"] for row in stored] == [1]
+    row = stored[0]
+    assert row["candidate_id"] == 5
+    assert row["reasons_json"]["source"] == "reverse_match"
+    assert row["reasons_json"]["breakdown"]["matched_hard_skills"] == ["python"]
+    assert row["reasons_json"]["breakdown"]["llm_adjustment"] == 0.0
+    assert result == [(1, row["final_score"])]
+
+
+def test_match_resume_is_disabled_with_zero_top_jobs() -> None:
+    retrieval = _FakeRetrieval(hits=[(1, 0.8)])
+    matcher = ReverseMatcher(
+        session=_FakeSession([]),  # type: ignore[arg-type]
+        retrieval_service=retrieval,  # type: ignore[arg-type]
+        top_jobs=0,
+    )
+
+    assert (
+        matcher.match_resume(
+            candidate_id=1, resume_id=1, signals=CandidateSignals(), model="m", dimensions=2
+        )
+        == []
+    )
+    assert retrieval.calls == []
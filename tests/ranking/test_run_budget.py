@@ -0,0 +1,267 @@
+"""Tests for budgeted ranking runs."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.extract.types import CandidateSignals, JobRequirements
+from src.llm.types import LLMCallMetadata, LLMUsage
+from src.ranking.budget import COMPLETION_TOKENS_ESTIMATE, RunBudget
+from src.ranking.service import RankingService
+from src.ranking.types import InterviewPrepPack, RankExplanation, RankInput
+from src.ranking.workflow import RankingWorkflow, _lexical_query, _requirements_hash
+
+
+def _inputs(count: int) -> list[RankInput]:
+    return [
+        RankInput(
+            candidate_id=i,
+            retrieval_score=1.0 - i * 0.1,
+            requirements=JobRequirements(hard_skills=["python"]),
+            signals=CandidateSignals(skills=["python"], summary=f"candidate-{i}"),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+class _MeteredLLM:
+    """Answers every call and reports 100 tokens and $0.01 of usage."""
+
+    def __init__(self) -> None:
+        self.calls: list[type] = []
+
+    async def agenerate_structured_with_meta(  # noqa: ANN001
+        self, prompt, schema, model_alias, **kwargs
+    ):
+        self.calls.append(schema)
+        metadata = LLMCallMetadata(
+            model_alias=model_alias,
+            latency_ms=250.0,
+            usage=LLMUsage(total_tokens=100, estimated_cost_usd=0.01),
+        )
+        if schema is RankExplanation:
+            return RankExplanation(evidence_based_summary=prompt[-40:]), metadata
+        return InterviewPrepPack(technical_questions=["q"]), metadata
+
+
+def test_budget_exhaustion_skips_packs_then_rerank_and_records_it() -> None:
+    llm = _MeteredLLM()
+    # Three calls at 100 tokens, then room for exactly one more 512-token reservation.
+    budget = RunBudget(max_tokens=300 + COMPLETION_TOKENS_ESTIMATE, token_counter=lambda _: 0)
+    service = RankingService(
+        llm_client=llm,  # type: ignore[arg-type]
+        llm_concurrency=1,
+        budget=budget,
+        max_reranked=6,
+    )
+
+    ranked = service.rank_candidates(_inputs(6), top_k=3)
+
+    by_id = {r.candidate_id: r for r in ranked}
+    # Reranking ran before any pack, so the budget went to candidates 1-4.
+    assert llm.calls == [RankExplanation] * 4
+    assert [cid for cid in range(1, 7) if by_id[cid].explanation] == [1, 2, 3, 4]
+    assert all(r.interview_pack is None for r in ranked)
+    assert budget.exhausted_by == "tokens"
+    assert budget.reasons(1)["skipped"] == ["interview_pack"]
+    assert budget.reasons(4)["skipped"] == []
+    assert budget.reasons(5)["skipped"] == ["rerank"]
+    assert budget.reasons(6)["skipped"] == ["rerank"]
+    assert budget.reasons(1)["spent_tokens"] == 400
+    assert budget.reasons(1)["spent_cost_usd"] == 0.04
+    assert budget.reasons(1)["spent_llm_seconds"] == 1.0
+
+
+def test_budget_exhausted_up_front_leaves_deterministic_scores() -> None:
+    llm = _MeteredLLM()
+    budget = RunBudget(max_seconds=0.0)
+    service = RankingService(llm_client=llm, budget=budget)  # type: ignore[arg-type]
+
+    ranked = service.rank_candidates(_inputs(4), top_k=2)
+
+    assert llm.calls == []
+    assert [r.candidate_id for r in ranked] == [1, 2, 3, 4]
+    assert all(r.scores.final_score == r.scores.deterministic_score for r in ranked)
+    assert budget.exhausted_by == "time"
+    assert budget.reasons(1)["skipped"] == ["rerank"]
+
+
+def test_cost_cap_projects_spend_from_observed_cost_per_token() -> None:
+    budget = RunBudget(max_cost_usd=0.05, token_counter=lambda _: 0)
+
+    first = budget.reserve("prompt")
+    assert first == COMPLETION_TOKENS_ESTIMATE
+    budget.settle(
+        first,
+        LLMCallMetadata(
+            model_alias="ranker_default",
+            usage=LLMUsage(total_tokens=500, estimated_cost_usd=0.04),
+        ),
+    )
+
+    # 512 more tokens at $0.00008/token would bring the run to ~$0.081.
+    assert budget.reserve("prompt") is None
+    assert budget.exhausted_by == "cost"
+    assert budget.spent_cost_usd == 0.04
+
+
+def test_from_settings_returns_none_without_limits() -> None:
+    assert RunBudget.from_settings() is None
+
+
+def test_workflow_gives_each_job_its_own_budget() -> None:
+    workflow = RankingWorkflow(
+        session=object(),  # type: ignore[arg-type]
+        budget_factory=lambda: RunBudget(max_tokens=1_000, token_counter=lambda _: 0),
+    )
+
+    first, second = workflow._ranking_service(), workflow._ranking_service()
+    assert first.budget is not None and second.budget is not None
+    assert first.budget.reserve("prompt") is not None
+    first.budget.max_tokens = 0
+    assert first.budget.reserve("prompt") is None
+
+    # A job that exhausts its budget leaves the next job's budget untouched.
+    assert second.budget.reserve("prompt") is not None
+    first.budget.mark_skipped([1, 2], "rerank")
+    assert first.budget.summary()["skipped"] == {"rerank": 2}
+    assert second.budget.summary()["skipped"] == {}
+
+
+_WATERMARK = (datetime(2026, 1, 1, tzinfo=timezone.utc), 10)
+
+
+def _match(candidate_id: int, score: float, **reasons) -> SimpleNamespace:
+    return SimpleNamespace(
+        candidate_id=candidate_id,
+        retrieval_score=0.5,
+        final_score=score,
+        interview_pack_json=None,
+        reasons_json={
+            "rank": 1,
+            "breakdown": {
+                "deterministic_score": score,
+                "final_score": score,
+                "matched_hard_skills": [],
+                "missing_hard_skills": [],
+            },
+            **reasons,
+        },
+    )
+
+
+def _incremental_workflow(monkeypatch, matches: dict, *, changed_ids: list[int]):
+    job = SimpleNamespace(
+        id=1, description="python developer", requirements_json={"hard_skills": ["python"]}
+    )
+    upserts: list[dict] = []
+    full_runs: list[int] = []
+
+    class FakeResumeRepository:
+        def __init__(self, session):
+            pass
+
+        def get_resume_watermark(self):
+            return _WATERMARK if not changed_ids else (_WATERMARK[0], 11)
+
+        def get_candidate_ids_with_resumes_between(self, after, until):
+            return list(changed_ids)
+
+        def get_latest_resumes_by_candidate_ids(self, candidate_ids):
+            return {
+                cid: SimpleNamespace(signals_json={"skills": ["python"]}) for cid in candidate_ids
+            }
+
+    class FakeMatchRepository:
+        def __init__(self, session):
+            pass
+
+        def get_by_job(self, job_id):
+            return matches
+
+        def upsert_many(self, job_id, rows):
+            upserts.extend(rows)
+
+    class FakeWatermarkRepository:
+        def __init__(self, session):
+            pass
+
+        def get(self, job_id):
+            return SimpleNamespace(
+                requirements_hash=_requirements_hash(job),
+                top_k=2,
+                resume_created_at=_WATERMARK[0],
+                resume_id=_WATERMARK[1],
+            )
+
+        def upsert(self, **kwargs):
+            pass
+
+    class FakeRetrieval:
+        def score_candidates(self, job_description, candidate_ids):
+            return [(cid, 0.1) for cid in candidate_ids]
+
+    monkeypatch.setattr("src.ranking.workflow.ResumeRepository", FakeResumeRepository)
+    monkeypatch.setattr("src.ranking.workflow.MatchRepository", FakeMatchRepository)
+    monkeypatch.setattr("src.ranking.workflow.RankingWatermarkRepository", FakeWatermarkRepository)
+    session = SimpleNamespace(get=lambda model, job_id: job, expire=lambda obj: None)
+    workflow = RankingWorkflow(
+        session=session, budget_factory=lambda: None  # type: ignore[arg-type]
+    )
+    llm = _MeteredLLM()
+    workflow._ranking_service = lambda: RankingService(  # type: ignore[method-assign]
+        llm_client=llm,  # type: ignore[arg-type]
+        budget=RunBudget(max_tokens=1_000_000, token_counter=lambda _: 0),
+    )
+    workflow._retrieval_service = lambda: FakeRetrieval()  # type: ignore[method-assign]
+    workflow.run = (  # type: ignore[method-assign]
+        lambda job_id, **kwargs: full_runs.append(job_id) or []
+    )
+    return workflow, upserts, full_runs, llm
+
+
+def test_incremental_run_rescores_matches_whose_rerank_the_budget_skipped(monkeypatch) -> None:
+    matches = {
+        1: _match(1, 0.9),
+        2: _match(2, 0.8),
+        3: _match(3, 0.7, budget={"skipped": ["rerank"]}),
+    }
+    workflow, _, full_runs, _ = _incremental_workflow(monkeypatch, matches, changed_ids=[])
+
+    workflow.run_incremental(1, top_k=2)
+
+    # The budget-cut run may have left candidates without any stored match.
+    assert full_runs == [1]
+
+
+def test_incremental_run_rescores_unreusable_matches_and_renumbers_ranks(monkeypatch) -> None:
+    matches = {
+        1: _match(1, 0.9),
+        2: _match(2, 0.8),
+        3: _match(3, 0.7),
+        4: _match(4, 0.2, source="reverse_match"),
+    }
+    workflow, upserts, full_runs, llm = _incremental_workflow(monkeypatch, matches, changed_ids=[5])
+
+    ranked = workflow.run_incremental(1, top_k=2)
+
+    assert full_runs == []
+    # The new resume and the reverse-matched row are both scored and reranked.
+    assert llm.calls.count(RankExplanation) == 2
+    assert [r.candidate_id for r in ranked] == [1, 2]
+    ranks = {row["candidate_id"]: row["reasons_json"]["rank"] for row in upserts}
+    assert ranks[1] == 1 and ranks[2] == 2
+    # Rows outside the new top keep a current rank instead of a stale one.
+    assert sorted(ranks) == [1, 2, 3, 4, 5]
+    assert sorted(ranks.values()) == [1, 2, 3, 4, 5]
+
+
+def test_lexical_query_keeps_the_leading_distinct_hard_skills(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "src.ranking.workflow.get_settings",
+        lambda: SimpleNamespace(retrieval_hybrid_max_terms=3),
+    )
+    job = SimpleNamespace(
+        requirements_json={"hard_skills": ["Python", "SAP FI", "python", "", "Kubernetes", "Go"]}
+    )
+
+    assert _lexical_query(job) == "Python SAP FI Kubernetes"  # type: ignore[arg-type]
@@ -0,0 +1,107 @@
+"""Tests for embedding-based soft skill matching."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from src.extract.types import CandidateSignals, JobRequirements
+from src.llm.types import ModelAlias
+from src.ranking.batch import score_rank_inputs
+from src.ranking.service import RankingService
+from src.ranking.soft_match import SkillSoftMatcher, clear_skill_vector_cache
+from src.ranking.types import RankInput
+
+# Hand-picked directions: "relational databases" is close to "postgresql",
+# everything else is orthogonal.
+_VECTORS = {
+    "PostgreSQL": [1.0, 0.0, 0.0],
+    "relational databases": [0.95, 0.3, 0.0],
+    "Kubernetes": [0.0, 1.0, 0.0],
+    "cooking": [0.0, 0.0, 1.0],
+}
+
+
+class _FakeRegistry:
+    def get(self, alias_name: str) -> ModelAlias:
+        return ModelAlias(default_model=f"test/{alias_name}")
+
+
+class _FakeEmbedder:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    def embed(self, texts: list[str], embedding_model_alias: str) -> list[list[float]]:
+        if self.fail:
+            raise RuntimeError("provider down")
+        self.calls.append(list(texts))
+        return [_VECTORS[text] for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def _clean_vector_cache() -> Iterator[None]:
+    clear_skill_vector_cache()
+    yield
+    clear_skill_vector_cache()
+
+
+def _matcher(embedder: _FakeEmbedder) -> SkillSoftMatcher:
+    return SkillSoftMatcher(
+        llm_client=embedder,  # type: ignore[arg-type]
+        registry=_FakeRegistry(),  # type: ignore[arg-type]
+        threshold=0.9,
+    )
+
+
+def test_equivalents_thresholds_similarity_and_embeds_each_skill_once() -> None:
+    embedder = _FakeEmbedder()
+    matcher = _matcher(embedder)
+
+    first = matcher.equivalents(["postgresql", "kubernetes"], ["relational databases", "cooking"])
+    second = matcher.equivalents(["postgresql"], ["relational databases", "kubernetes"])
+
+    assert first == {"postgresql": {"relational databases"}}
+    assert second == {"postgresql": {"relational databases"}}
+    # Every skill of the second call was cached by the first one.
+    assert len(embedder.calls) == 1
+    assert sorted(embedder.calls[0]) == sorted(_VECTORS)
+
+
+def test_equivalents_fall_back_to_exact_matching_when_embedding_fails() -> None:
+    matcher = _matcher(_FakeEmbedder(fail=True))
+
+    assert matcher.equivalents(["postgresql"], ["relational databases"]) == {}
+
+
+def test_both_scorers_apply_soft_matches() -> None:
+    requirements = JobRequirements(
+        hard_skills=["PostgreSQL", "Kubernetes"],
+        normalized_hard_skills=["kubernetes", "postgresql"],
+    )
+    inputs = [
+        RankInput(
+            candidate_id=1,
+            retrieval_score=0.5,
+            requirements=requirements,
+            signals=CandidateSignals(
+                skills=["relational databases"], normalized_skills=["relational databases"]
+            ),
+        ),
+        RankInput(
+            candidate_id=2,
+            retrieval_score=0.5,
+            requirements=requirements,
+            signals=CandidateSignals(skills=["cooking"], normalized_skills=["cooking"]),
+        ),
+    ]
+    service = RankingService(skill_matcher=_matcher(_FakeEmbedder()))
+
+    batch = score_rank_inputs(inputs, skill_matcher=service.skill_matcher)
+    single = [service._deterministic_score(inp) for inp in inputs]
+
+    assert [r.candidate_id for r in batch] == [1, 2]
+    assert batch[0].scores == single[0]
+    assert batch[1].scores == single[1]
+    assert single[0].matched_hard_skills == ["postgresql"]
+    assert single[0].missing_hard_skills == ["kubernetes"]
+    assert single[1].matched_hard_skills == []
@@ -0,0 +1,193 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.retrieval import numpy_backend
+from src.retrieval.numpy_backend import NumpyVectorIndex, get_numpy_index
+from src.retrieval.service import RetrievalService, _SectionScoring
+
+
+def _build_index() -> NumpyVectorIndex:
+    return NumpyVectorIndex.build(
+        model="m",
+        dimensions=2,
+        vectors=np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 3.0], [0.0, -1.0]]),
+        section_ids=np.array([10, 11, 12, 13]),
+        candidate_ids=np.array([2, 1, 2, 3]),
+    )
+
+
+def test_top_k_groups_sections_by_candidate_max() -> None:
+    index = _build_index()
+
+    result = index.top_k([1.0, 0.0], 3)
+
+    assert [cid for cid, _ in result] == [2, 1, 3]
+    assert result[0][1] == pytest.approx(1.0)
+    assert result[1][1] == pytest.approx(0.0)
+    assert result[2][1] == pytest.approx(0.0)
+
+
+def test_top_k_matches_brute_force() -> None:
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(200, 8))
+    candidate_ids = rng.integers(1, 40, size=200)
+    index = NumpyVectorIndex.build(
+        model="m",
+        dimensions=8,
+        vectors=vectors,
+        section_ids=np.arange(200),
+        candidate_ids=candidate_ids,
+    )
+    query = rng.normal(size=8)
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sims = unit @ (query / np.linalg.norm(query))
+    expected: dict[int, float] = {}
+    for cid, sim in zip(candidate_ids, sims):
+        expected[int(cid)] = max(expected.get(int(cid), -1.0), float(sim))
+    expected_top = sorted(expected.items(), key=lambda item: -item[1])[:5]
+
+    result = index.top_k(query.tolist(), 5)
+    assert [cid for cid, _ in result] == [cid for cid, _ in expected_top]
+    assert [s for _, s in result] == pytest.approx([s for _, s in expected_top], abs=1e-5)
+
+
+def test_snapshot_round_trip_is_memory_mapped(tmp_path: Path) -> None:
+    index = _build_index()
+    index.save(tmp_path / "snap")
+
+    loaded = NumpyVectorIndex.load(tmp_path / "snap")
+
+    assert isinstance(loaded.matrix, np.memmap)
+    assert loaded.top_k_many([[1.0, 0.0], [0.0, 1.0]], 1) == index.top_k_many(
+        [[1.0, 0.0], [0.0, 1.0]], 1
+    )
+
+
+def test_retrieval_service_dispatches_to_numpy_backend(monkeypatch) -> None:
+    index = _build_index()
+    service = RetrievalService(session=object(), backend="numpy")  # type: ignore[arg-type]
+    monkeypatch.setattr(service, "_numpy_index", lambda *, model, dimensions: index)  # noqa: ARG005
+
+    result = service._query_top_candidates(model="m", query_vector=[0.0, 1.0], k=1)
+    assert result[0][0] == 1
+
+
+def _typed_index() -> tuple[NumpyVectorIndex, np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(11)
+    vectors = rng.normal(size=(120, 6))
+    candidate_ids = rng.integers(1, 25, size=120)
+    section_types = rng.choice(["experience", "skills", "summary"], size=120)
+    index = NumpyVectorIndex.build(
+        model="m",
+        dimensions=6,
+        vectors=vectors,
+        section_ids=np.arange(120),
+        candidate_ids=candidate_ids,
+        section_types=section_types,
+    )
+    return index, vectors, candidate_ids, section_types
+
+
+def _brute_force(
+    scoring: _SectionScoring,
+    vectors: np.ndarray,
+    candidate_ids: np.ndarray,
+    section_types: np.ndarray,
+    query: np.ndarray,
+) -> dict[int, float]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sims = unit @ (query / np.linalg.norm(query))
+    sections: dict[int, list[tuple[float, float]]] = {}
+    for cid, section_type, sim in zip(candidate_ids, section_types, sims):
+        if scoring.section_types and section_type not in scoring.section_types:
+            continue
+        weight = scoring.section_weights.get(str(section_type), 1.0)
+        sections.setdefault(int(cid), []).append((weight * float(sim), weight))
+    scores: dict[int, float] = {}
+    for cid, rows in sections.items():
+        weighted = [ws for ws, _ in rows]
+        if scoring.aggregation == "max":
+            scores[cid] = max(weighted)
+        elif scoring.aggregation == "softmax":
+            best = max(weighted)
+            exp = [np.exp((ws - best) / scoring.temperature) for ws in weighted]
+            scores[cid] = sum(ws * e for ws, e in zip(weighted, exp)) / sum(exp)
+        else:
+            top = sorted(rows, key=lambda row: -row[0])[: scoring.top_n]
+            total = sum(weight for _, weight in top)
+            scores[cid] = sum(ws for ws, _ in top) / total if total else 0.0
+    return scores
+
+
+@pytest.mark.parametrize("aggregation", ["max", "weighted_mean", "softmax"])
+def test_top_k_applies_section_scoring_like_pgvector(aggregation: str) -> None:
+    index, vectors, candidate_ids, section_types = _typed_index()
+    scoring = _SectionScoring(
+        aggregation=aggregation,
+        section_weights={"experience": 1.5, "summary": 0.5},
+        section_types=["experience", "summary"],
+        top_n=2,
+        temperature=0.2,
+    )
+    query = np.random.default_rng(3).normal(size=6)
+
+    expected = _brute_force(scoring, vectors, candidate_ids, section_types, query)
+    result = index.top_k(query.tolist(), 100, **scoring.numpy_options())
+
+    assert {cid for cid, _ in result} == set(expected)
+    for cid, score in result:
+        assert score == pytest.approx(expected[cid], abs=1e-5)
+    assert [s for _, s in result] == sorted((s for _, s in result), reverse=True)
+
+
+def test_snapshot_round_trip_keeps_section_types_and_version(tmp_path: Path) -> None:
+    index, *_ = _typed_index()
+    index.version = (120, 119)
+    index.save(tmp_path / "snap")
+
+    loaded = NumpyVectorIndex.load(tmp_path / "snap")
+
+    assert loaded.version == (120, 119)
+    options = _SectionScoring(section_weights={"skills": 2.0}).numpy_options()
+    assert loaded.top_k([1.0] * 6, 5, **options) == index.top_k([1.0] * 6, 5, **options)
+
+
+def test_get_numpy_index_reloads_when_the_embedding_space_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    versions = iter([(4, 13), (4, 13), (5, 14)])
+    current: dict[str, tuple[int, int]] = {}
+    loads: list[tuple[int, int]] = []
+
+    def fake_space_version(session, *, model, dimensions):  # noqa: ARG001
+        current["version"] = next(versions)
+        return current["version"]
+
+    def fake_from_session(session, *, model, dimensions):  # noqa: ARG001
+        loads.append(current["version"])
+        index = _build_index()
+        index.version = current["version"]
+        return index
+
+    monkeypatch.setattr(numpy_backend, "space_version", fake_space_version)
+    monkeypatch.setattr(NumpyVectorIndex, "from_session", staticmethod(fake_from_session))
+    session: Any = object()
+    numpy_backend.clear_numpy_index_cache()
+    try:
+        first = get_numpy_index(session, model="m", dimensions=2, snapshot_dir=tmp_path)
+        again = get_numpy_index(session, model="m", dimensions=2, snapshot_dir=tmp_path)
+        changed = get_numpy_index(session, model="m", dimensions=2, snapshot_dir=tmp_path)
+    finally:
+        numpy_backend.clear_numpy_index_cache()
+
+    assert again is first
+    assert changed is not first
+    assert loads == [(4, 13), (5, 14)]
+    snapshot = NumpyVectorIndex.load(
+        numpy_backend.snapshot_directory(tmp_path, model="m", dimensions=2)
+    )
+    assert snapshot.version == (5, 14)
@@ -1,7 +1,10 @@
 from pathlib import Path
 
-from src.retrieval.service import RetrievalService
+import pytest
+
+from src.retrieval.service import RetrievalService, _SectionScoring
 from src.llm.registry import ModelAliasRegistry
+from src.llm.types import LLMCallMetadata
 
 
 def _make_registry(tmp_path: Path) -> ModelAliasRegistry:
@@ -25,10 +28,12 @@ def test_top_k_resolves_model_and_queries(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         service,
         "_embed_job_description",
-        lambda *, job_description, embedding_model_alias: [0.1, 0.2],  # noqa: ARG005
+        lambda *, job_description, embedding_model_alias: ([0.1, 0.2], None),  # noqa: ARG005
     )
 
-    def fake_query_top_candidates(*, model: str, query_vector: list[float], k: int) -> list[int]:
+    def fake_query_top_candidates(
+        *, model: str, query_vector: list[float], k: int, lexical_query: str | None = None
+    ) -> list[int]:
         captured["model"] = model
         captured["query_vector"] = query_vector
         captured["k"] = k
@@ -48,6 +53,402 @@ def test_top_k_returns_empty_when_embedding_missing(monkeypatch, tmp_path: Path)
     monkeypatch.setattr(
         service,
         "_embed_job_description",
-        lambda *, job_description, embedding_model_alias: [],  # noqa: ARG005
+        lambda *, job_description, embedding_model_alias: ([], None),  # noqa: ARG005
     )
     assert service.top_k("backend engineer", 5, embedding_model_alias="embedding_default") == []
+
+
+def test_ann_query_widens_until_k_distinct_candidates(monkeypatch) -> None:
+    service = RetrievalService(session=object(), query_mode="ann")  # type: ignore[arg-type]
+    limits: list[int] = []
+
+    def fake_run_ann_query(session, *, model, query_vector, k, inner_limit):  # noqa: ANN001
+        limits.append(inner_limit)
+        if inner_limit < 40:
+            return [(1, 0.9)], inner_limit
+        return [(1, 0.9), (2, 0.8), (3, 0.7)], inner_limit
+
+    monkeypatch.setattr(service, "_run_ann_query", fake_run_ann_query)
+
+    result = service._query_top_candidates(model="m", query_vector=[0.1, 0.2], k=3)
+    assert result == [(1, 0.9), (2, 0.8), (3, 0.7)]
+    assert limits == [12, 24, 48]
+
+
+def test_ann_query_stops_widening_when_space_exhausted(monkeypatch) -> None:
+    service = RetrievalService(session=object(), query_mode="ann")  # type: ignore[arg-type]
+    limits: list[int] = []
+
+    def fake_run_ann_query(session, *, model, query_vector, k, inner_limit):  # noqa: ANN001
+        limits.append(inner_limit)
+        return [(1, 0.9)], 5
+
+    monkeypatch.setattr(service, "_run_ann_query", fake_run_ann_query)
+
+    assert service._query_top_candidates(model="m", query_vector=[0.1], k=3) == [(1, 0.9)]
+    assert limits == [12]
+
+
+def test_ann_query_falls_back_to_exact_past_ef_search_cap(monkeypatch) -> None:
+    service = RetrievalService(session=object(), query_mode="ann")  # type: ignore[arg-type]
+    limits: list[int] = []
+
+    def fake_run_ann_query(session, *, model, query_vector, k, inner_limit):  # noqa: ANN001
+        limits.append(inner_limit)
+        return [(1, 0.9)], inner_limit
+
+    monkeypatch.setattr(service, "_run_ann_query", fake_run_ann_query)
+    monkeypatch.setattr(
+        service,
+        "_query_top_candidates_exact",
+        lambda *, model, query_vector, k: [(1, 0.9), (2, 0.8), (3, 0.7)],  # noqa: ARG005
+    )
+
+    result = service._query_top_candidates(model="m", query_vector=[0.1], k=1200)
+
+    assert result == [(1, 0.9), (2, 0.8), (3, 0.7)]
+    # An inner limit of 1200 exceeds hnsw.ef_search, so no ANN round can fill it.
+    assert limits == []
+
+
+def test_unknown_query_mode_raises() -> None:
+    service = RetrievalService(session=object(), query_mode="bogus")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Unknown retrieval query mode"):
+        service._query_top_candidates(model="m", query_vector=[0.1], k=1)
+
+
+class _RecordingSession:
+    def __init__(self, rows: list[tuple], marker: str = "fused") -> None:
+        self.rows = rows
+        self.marker = marker
+        self.statements: list = []
+
+    def execute(self, statement):  # noqa: ANN001
+        self.statements.append(statement)
+        rows = self.rows if self.marker in str(statement) else []
+        return type("Result", (), {"fetchall": lambda _self: rows})()
+
+
+def test_hybrid_query_fuses_both_legs_in_one_statement() -> None:
+    session = _RecordingSession(rows=[(7, 1.0, 400, 2), (3, 0.5, 400, 2)])
+    service = RetrievalService(
+        session=session, query_mode="hybrid", backend="pgvector"  # type: ignore[arg-type]
+    )
+
+    result = service._query_top_candidates(
+        model="m", query_vector=[0.1, 0.2], k=2, lexical_query="Kubernetes SAP FI"
+    )
+
+    assert result == [(7, 1.0), (3, 0.5)]
+    search_statements = [st for st in session.statements if "fused" in str(st)]
+    assert len(search_statements) == 1
+    sql = str(search_statements[0])
+    assert "search_vector @@" in sql and "<=>" in sql
+    params = search_statements[0].compile().params
+    assert params["lexical_query"] == "Kubernetes SAP FI"
+    assert params["k"] == 2
+
+
+def test_hybrid_query_widens_both_legs_until_k_candidates_fuse() -> None:
+    rounds = iter(
+        [
+            [(7, 1.0, 400, 100)],
+            [(7, 1.0, 800, 130), (3, 0.5, 800, 130)],
+        ]
+    )
+    params: list[dict] = []
+
+    class WideningSession:
+        def execute(self, statement):  # noqa: ANN001
+            if "fused" not in str(statement):
+                return None
+            params.append(statement.compile().params)
+            rows = next(rounds)
+            return type("Result", (), {"fetchall": lambda _self: rows})()
+
+    service = RetrievalService(
+        session=WideningSession(), query_mode="hybrid", backend="pgvector"  # type: ignore[arg-type]
+    )
+
+    result = service._query_top_candidates(
+        model="m", query_vector=[0.1, 0.2], k=2, lexical_query="Kubernetes"
+    )
+
+    assert result == [(7, 1.0), (3, 0.5)]
+    assert [(p["inner_limit"], p["leg_limit"]) for p in params] == [(400, 100), (800, 200)]
+
+
+def test_hybrid_query_stops_widening_when_both_legs_are_exhausted() -> None:
+    session = _RecordingSession(rows=[(7, 1.0, 12, 3)])
+    service = RetrievalService(
+        session=session, query_mode="hybrid", backend="pgvector"  # type: ignore[arg-type]
+    )
+
+    result = service._query_top_candidates(
+        model="m", query_vector=[0.1, 0.2], k=5, lexical_query="Kubernetes"
+    )
+
+    assert result == [(7, 1.0)]
+    assert len([st for st in session.statements if "fused" in str(st)]) == 1
+
+
+def test_top_k_uses_description_as_default_lexical_query(monkeypatch, tmp_path: Path) -> None:
+    service = RetrievalService(
+        session=object(),  # type: ignore[arg-type]
+        registry=_make_registry(tmp_path),
+        query_mode="hybrid",
+        backend="pgvector",
+    )
+    monkeypatch.setattr(
+        service,
+        "_embed_job_description",
+        lambda *, job_description, embedding_model_alias: ([0.1, 0.2], None),  # noqa: ARG005
+    )
+    seen: list[str] = []
+
+    def fake_hybrid(*, model, query_vector, lexical_query, k):  # noqa: ANN001
+        seen.append(lexical_query)
+        return [(1, 0.9)]
+
+    monkeypatch.setattr(service, "_query_top_candidates_hybrid", fake_hybrid)
+
+    service.top_k("python engineer", 1, embedding_model_alias="embedding_default")
+    service.top_k(
+        "python engineer", 1, embedding_model_alias="embedding_default", lexical_query="Kubernetes"
+    )
+    assert seen == ["python engineer", "Kubernetes"]
+
+
+class _FakeQueryCache:
+    def __init__(self, stored: dict[tuple[str, str], list[float]] | None = None) -> None:
+        self.stored = dict(stored or {})
+        self.puts: list[tuple[str, str, list[float]]] = []
+
+    def get(self, *, text: str, model: str) -> list[float] | None:
+        return self.stored.get((text, model))
+
+    def put(self, *, text: str, model: str, vector: list[float]) -> None:
+        self.puts.append((text, model, vector))
+        self.stored[(text, model)] = vector
+
+
+def test_top_k_uses_cached_query_vector(monkeypatch, tmp_path: Path) -> None:
+    cache = _FakeQueryCache({("backend engineer", "openai/text-embedding-3-small"): [0.3, 0.4]})
+    service = RetrievalService(registry=_make_registry(tmp_path), query_cache=cache)  # type: ignore[arg-type]
+
+    def fail_embed(*, job_description, embedding_model_alias):  # noqa: ANN001, ARG001
+        raise AssertionError("provider should not be called on a cache hit")
+
+    monkeypatch.setattr(service, "_embed_job_description", fail_embed)
+    monkeypatch.setattr(
+        service,
+        "_query_top_candidates",
+        lambda *, model, query_vector, k, lexical_query=None: (  # noqa: ARG005
+            [(7, 0.9)] if query_vector == [0.3, 0.4] else []
+        ),
+    )
+
+    assert service.top_k("backend engineer", 1, embedding_model_alias="embedding_default") == [
+        (7, 0.9)
+    ]
+    assert cache.puts == []
+
+
+def test_top_k_embeds_and_stores_on_cache_miss(monkeypatch, tmp_path: Path) -> None:
+    cache = _FakeQueryCache()
+    service = RetrievalService(registry=_make_registry(tmp_path), query_cache=cache)  # type: ignore[arg-type]
+    monkeypatch.setattr(
+        service,
+        "_embed_job_description",
+        lambda *, job_description, embedding_model_alias: ([0.1, 0.2], None),  # noqa: ARG005
+    )
+    monkeypatch.setattr(
+        service,
+        "_query_top_candidates",
+        lambda *, model, query_vector, k, lexical_query=None: [(1, 0.5)],  # noqa: ARG005
+    )
+
+    service.top_k("data engineer", 1, embedding_model_alias="embedding_default")
+    assert cache.puts == [("data engineer", "openai/text-embedding-3-small", [0.1, 0.2])]
+
+
+def test_top_k_many_embeds_misses_in_one_batch(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+
+    class FakeLLM:
+        def embed_with_meta(self, texts, embedding_model_alias):  # noqa: ANN001
+            calls.append(list(texts))
+            return [[float(len(t)), 1.0] for t in texts], None
+
+    cache = _FakeQueryCache({("cached job", "openai/text-embedding-3-small"): [9.0, 9.0]})
+    service = RetrievalService(
+        registry=_make_registry(tmp_path),
+        llm_client=FakeLLM(),  # type: ignore[arg-type]
+        query_cache=cache,  # type: ignore[arg-type]
+        query_mode="ann",
+    )
+    captured = {}
+
+    def fake_many(*, model, query_vectors, k):  # noqa: ANN001
+        captured["query_vectors"] = query_vectors
+        return [[(i + 1, 0.5)] for i in range(len(query_vectors))]
+
+    monkeypatch.setattr(service, "_query_top_candidates_ann_many", fake_many)
+
+    result = service.top_k_many(
+        ["job a", "cached job", "job a", "job bb"], 1, embedding_model_alias="embedding_default"
+    )
+
+    assert calls == [["job a", "job bb"]]
+    assert captured["query_vectors"] == [[5.0, 1.0], [9.0, 9.0], [5.0, 1.0], [6.0, 1.0]]
+    assert result == [[(1, 0.5)], [(2, 0.5)], [(3, 0.5)], [(4, 0.5)]]
+    assert {text for text, _, _ in cache.puts} == {"job a", "job bb"}
+
+
+def test_fallback_model_query_vectors_are_not_cached(monkeypatch, tmp_path: Path) -> None:
+    class FallbackLLM:
+        def embed_with_meta(self, texts, embedding_model_alias):  # noqa: ANN001
+            metadata = LLMCallMetadata(
+                model_alias=embedding_model_alias, selected_model="cohere/embed-english-v3.0"
+            )
+            return [[0.1, 0.2] for _ in texts], metadata
+
+    cache = _FakeQueryCache()
+    service = RetrievalService(
+        registry=_make_registry(tmp_path),
+        llm_client=FallbackLLM(),  # type: ignore[arg-type]
+        query_cache=cache,  # type: ignore[arg-type]
+        query_mode="ann",
+    )
+    monkeypatch.setattr(
+        service,
+        "_query_top_candidates",
+        lambda *, model, query_vector, k, lexical_query=None: [(1, 0.5)],  # noqa: ARG005
+    )
+    monkeypatch.setattr(
+        service,
+        "_query_top_candidates_ann_many",
+        lambda *, model, query_vectors, k: [[(1, 0.5)] for _ in query_vectors],  # noqa: ARG005
+    )
+
+    service.top_k("data engineer", 1, embedding_model_alias="embedding_default")
+    service.top_k_many(["job a", "job b"], 1, embedding_model_alias="embedding_default")
+
+    assert cache.puts == []
+
+
+def test_top_k_many_widens_only_short_queries(monkeypatch) -> None:
+    service = RetrievalService(session=object(), query_mode="ann")  # type: ignore[arg-type]
+    widened: list[list[float]] = []
+
+    monkeypatch.setattr(
+        service,
+        "_run_ann_many_query",
+        lambda session, *, model, query_vectors, k, inner_limit: [  # noqa: ARG005
+            ([(1, 0.9), (2, 0.8)], inner_limit),
+            ([(3, 0.9)], inner_limit),
+            ([(4, 0.9)], 1),
+        ],
+    )
+
+    def fake_single(*, model, query_vector, k):  # noqa: ANN001, ARG001
+        widened.append(query_vector)
+        return [(3, 0.9), (5, 0.7)]
+
+    monkeypatch.setattr(service, "_query_top_candidates_ann", fake_single)
+
+    result = service._query_top_candidates_ann_many(
+        model="m", query_vectors=[[0.1], [0.2], [0.3]], k=2
+    )
+    assert result == [[(1, 0.9), (2, 0.8)], [(3, 0.9), (5, 0.7)], [(4, 0.9)]]
+    assert widened == [[0.2]]
+
+
+def test_section_scoring_defaults_keep_unweighted_max() -> None:
+    scoring = _SectionScoring()
+
+    assert scoring.weight_sql() == "1.0"
+    assert scoring.section_filter_sql("AND") == ""
+    assert "MAX(weighted_similarity)" in scoring.aggregate_sql("scored", "candidate_id")
+    assert scoring.bindparams() == []
+
+
+def test_section_scoring_weights_filter_and_pooling() -> None:
+    scoring = _SectionScoring(
+        aggregation="weighted_mean",
+        section_weights={"experience": 1.0, "summary": 0.4},
+        section_types=["experience", "summary"],
+        top_n=2,
+    )
+
+    assert "rs.section_type" in scoring.weight_sql()
+    assert scoring.section_filter_sql("WHERE") == "WHERE rs.section_type = ANY(:section_types)"
+    assert "section_rank <= 2" in scoring.aggregate_sql("scored", "candidate_id")
+    assert {param.key for param in scoring.bindparams()} == {"section_weights", "section_types"}
+    assert "exp(" in _SectionScoring(aggregation="softmax").aggregate_sql("s", "candidate_id")
+
+
+def test_unknown_aggregation_raises() -> None:
+    service = RetrievalService(
+        session=object(), query_mode="exact", backend="pgvector", aggregation="median"  # type: ignore[arg-type]
+    )
+    with pytest.raises(ValueError, match="Unknown retrieval aggregation"):
+        service._query_top_candidates(model="m", query_vector=[0.1], k=1)
+
+
+def test_quantized_mode_rescores_compact_hits_in_one_round(monkeypatch) -> None:
+    service = RetrievalService(
+        session=object(), query_mode="quantized", backend="pgvector"  # type: ignore[arg-type]
+    )
+    captured = {}
+
+    def fake_grouped(session, *, hits_sql, query_vector, k, inner_limit):  # noqa: ANN001, ARG001
+        captured["hits_sql"] = hits_sql
+        return [(1, 0.9), (2, 0.8)], inner_limit
+
+    monkeypatch.setattr(service, "_run_grouped_hits", fake_grouped)
+
+    assert service._query_top_candidates(model="m", query_vector=[0.1, 0.2], k=2) == [
+        (1, 0.9),
+        (2, 0.8),
+    ]
+    assert "vector_half::halfvec(2)" in captured["hits_sql"]
+    assert "e.vector <=> cast(:query_vector as vector(2))" in captured["hits_sql"]
+
+
+def test_centroid_mode_scores_only_shortlisted_candidates() -> None:
+    session = _RecordingSession(rows=[(4, 0.8)], marker="shortlist")
+    service = RetrievalService(
+        session=session, query_mode="centroid", backend="pgvector"  # type: ignore[arg-type]
+    )
+
+    assert service._query_top_candidates(model="m", query_vector=[0.1, 0.2], k=2) == [(4, 0.8)]
+    statement = next(st for st in session.statements if "shortlist" in str(st))
+    sql = str(statement)
+    assert "FROM candidate_vectors cv" in sql
+    assert "JOIN resumes" not in sql
+    assert statement.compile().params["shortlist_limit"] == 10
+
+
+def test_score_candidates_restricts_exact_scoring_to_given_candidates(
+    monkeypatch, tmp_path: Path
+) -> None:
+    session = _RecordingSession(rows=[(9, 0.7)], marker="candidate_ids")
+    service = RetrievalService(
+        session=session,  # type: ignore[arg-type]
+        registry=_make_registry(tmp_path),
+        query_mode="hybrid",
+    )
+    monkeypatch.setattr(
+        service,
+        "_embed_job_description",
+        lambda *, job_description, embedding_model_alias: ([0.1, 0.2], None),  # noqa: ARG005
+    )
+
+    assert service.score_candidates("backend engineer", [9, 11]) == [(9, 0.7)]
+    statement = next(st for st in session.statements if "candidate_ids" in str(st))
+    assert "r.candidate_id = ANY(:candidate_ids)" in str(statement)
+    params = statement.compile().params
+    assert params["candidate_ids"] == [9, 11]
+    assert params["k"] == 2
+    assert service.score_candidates("backend engineer", []) == []
@@ -0,0 +1,36 @@
+from src.storage.repositories import CandidateVectorRepository
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    def execute(self, statement):  # noqa: ANN001
+        self.statements.append(statement)
+        return type("Result", (), {"rowcount": 2})()
+
+    def flush(self) -> None:
+        return None
+
+
+def test_refresh_scopes_delete_and_insert_to_candidate_and_model() -> None:
+    session = _RecordingSession()
+
+    written = CandidateVectorRepository(session).refresh(candidate_id=5, model="m")  # type: ignore[arg-type]
+
+    assert written == 2
+    delete_sql, insert_sql = (str(statement) for statement in session.statements)
+    assert "candidate_id = :candidate_id AND model = :model" in delete_sql
+    assert "AVG(e.vector)" in insert_sql
+    assert "WHERE candidate_id = :candidate_id" in insert_sql
+    assert "WHERE e.model = :model" in insert_sql
+    assert session.statements[1].compile().params == {"candidate_id": 5, "model": "m"}
+
+
+def test_refresh_without_scope_rebuilds_everything() -> None:
+    session = _RecordingSession()
+
+    CandidateVectorRepository(session).refresh()  # type: ignore[arg-type]
+
+    delete_sql = str(session.statements[0])
+    assert delete_sql.strip() == "DELETE FROM candidate_vectors"
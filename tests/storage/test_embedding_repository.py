@@ -1,7 +1,7 @@
 import pytest
 
 from src.storage import models
-from src.storage.repositories import EmbeddingRepository
+from src.storage.repositories import EmbeddingRepository, binary_quantize
 
 
 class _FakeSession:
@@ -54,3 +54,22 @@ def test_embedding_repository_rejects_dimension_mismatch_for_existing_model() ->
             vector=[0.1, 0.2],
             text_hash="abc",
         )
+
+
+def test_embedding_repository_writes_compact_forms() -> None:
+    session = _FakeSession()
+    repo = EmbeddingRepository(session=session)  # type: ignore[arg-type]
+
+    row = repo.create(
+        owner_id=1,
+        model="openai/text-embedding-3-small",
+        vector=[0.5, -0.2, 0.0, 1.5],
+        text_hash="abc",
+    )
+
+    assert row.vector_half == [0.5, -0.2, 0.0, 1.5]
+    assert row.vector_bit == "1001"
+
+
+def test_binary_quantize_matches_positive_components() -> None:
+    assert binary_quantize([-1.0, 0.0, 0.1]) == "001"
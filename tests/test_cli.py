@@ -11,3 +11,9 @@ def test_cli_has_commands() -> None:
     assert "ingest" in result.output
     assert "index" in result.output
     assert "rank" in result.output
+
+
+def test_cli_has_rank_all_command() -> None:
+    result = runner.invoke(app, ["rank-all", "--help"])
+    assert result.exit_code == 0
+    assert "--top-k" in result.output